@@ -34,12 +34,15 @@ class LoginCommandHandler(BaseCommandHandler[LoginCommand, TokenGroup]):
 
     async def handle(self, command: LoginCommand) -> TokenGroup:
         if "@" in command.username:
-            user = await self.user_repository.get_with_roles_by_email(command.username)
+            authorization = await self.user_repository.get_authorization_by_email(command.username)
         else:
-            user = await self.user_repository.get_with_roles_by_username(command.username)
+            authorization = await self.user_repository.get_authorization_by_username(command.username)
 
+        if authorization is None:
+            raise WrongLoginDataError(username=command.username)
+
+        user, effective = authorization
         if (
-            (user is None) or
             (user.password_hash is None) or
             (not self.hash_service.verify_password(command.password, user.password_hash))
         ):
@@ -53,7 +56,7 @@ class LoginCommandHandler(BaseCommandHandler[LoginCommand, TokenGroup]):
         await self.event_bus.publish(session.pull_events())
 
         token_group = self.jwt_manager.create_token_pair(
-            AuthUserJWTData.create_from_user(user, device_id=session.device_id)
+            AuthUserJWTData.create_from_effective_permissions(user, effective, device_id=session.device_id)
         )
 
         logger.info("Logging user", extra={"user_id": user.id, "device_id": session.device_id})
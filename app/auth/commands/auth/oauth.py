@@ -71,22 +71,20 @@ class ProcessOAuthCallbackCommandHandler(BaseCommandHandler[ProcessOAuthCallback
                     )
                     await self.oauth_repository.create(oauth_account)
 
-                user = await self.user_repository.get_user_with_permission_by_id(user_id)
-                if not user:
+                authorization = await self.user_repository.get_authorization_by_id(user_id)
+                if not authorization:
                     raise NotFoundUserError(user_by=user_id, user_field="id")
 
             elif oauth_account:
-                user = await self.user_repository.get_user_with_permission_by_id(oauth_account.user_id)
+                authorization = await self.user_repository.get_authorization_by_id(oauth_account.user_id)
 
-                if not user:
+                if not authorization:
                     raise NotFoundUserError(user_by=user_id, user_field="id")
 
                 user_id = oauth_account.user_id
 
             else:
-                role = await self.role_repository.get_with_permission_by_name(
-                    RolesEnum.STANDARD_USER.value.name
-                )
+                role = await self.role_repository.get_by_name(RolesEnum.STANDARD_USER.value.name)
                 if not role:
                     raise NotFoundRoleError(name=RolesEnum.STANDARD_USER.value.name)
 
@@ -103,6 +101,9 @@ class ProcessOAuthCallbackCommandHandler(BaseCommandHandler[ProcessOAuthCallback
                 await self.session.commit()
 
                 user_id = user.id
+                authorization = await self.user_repository.get_authorization_by_id(user_id)
+                if not authorization:
+                    raise NotFoundUserError(user_by=user_id, user_field="id")
                 oauth_account = OAuthAccount(
                     provider=OAuthProviderEnum(command.provider),
                     provider_email=oauth_data.email,
@@ -119,7 +120,7 @@ class ProcessOAuthCallbackCommandHandler(BaseCommandHandler[ProcessOAuthCallback
             await self.event_bus.publish(session.pull_events())
 
             token_group = self.jwt_manager.create_token_pair(
-                AuthUserJWTData.create_from_user(user, device_id=session.device_id)
+                AuthUserJWTData.create_from_effective_permissions(*authorization, device_id=session.device_id)
             )
 
             logger.info(
@@ -44,14 +44,13 @@ class RefreshTokenCommandHandler(BaseCommandHandler[RefreshTokenCommand, TokenGr
 
         session.online()
 
-        user = await self.user_repository.get_user_with_permission_by_id(
-                int(refresh_token.sub)
-            )
-        if user is None:
+        authorization = await self.user_repository.get_authorization_by_id(int(refresh_token.sub))
+        if authorization is None:
             raise NotFoundUserError(user_field="id", user_by="")
 
-        user_jwt_data = AuthUserJWTData.create_from_user(
-            user, refresh_token.did
+        user, effective = authorization
+        user_jwt_data = AuthUserJWTData.create_from_effective_permissions(
+            user, effective, refresh_token.did
         )
 
         try:
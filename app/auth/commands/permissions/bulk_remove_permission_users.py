@@ -0,0 +1,55 @@
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dtos.user import AuthUserJWTData
+from app.auth.exceptions import NotFoundPermissionsError, NotFoundUsersError
+from app.auth.repositories.permission import PermissionRepository
+from app.auth.repositories.session import TokenBlacklistRepository
+from app.auth.repositories.user import UserRepository
+from app.auth.services.rbac import AuthRBACManager
+from app.core.commands import BaseCommand, BaseCommandHandler
+from app.core.services.auth.exceptions import AccessDeniedError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BulkDeletePermissionToUsersCommand(BaseCommand):
+    user_jwt_data: AuthUserJWTData
+    user_ids: set[int]
+    permissions: set[str]
+
+
+@dataclass(frozen=True)
+class BulkDeletePermissionToUsersCommandHandler(BaseCommandHandler[BulkDeletePermissionToUsersCommand, None]):
+    session: AsyncSession
+    user_repository: UserRepository
+    permission_repository: PermissionRepository
+    rbac_manager: AuthRBACManager
+    token_blacklist: TokenBlacklistRepository
+
+    async def handle(self, command: BulkDeletePermissionToUsersCommand) -> None:
+        if not self.rbac_manager.check_permission(command.user_jwt_data, {"permission:update", "user:update"}):
+            raise AccessDeniedError(
+                need_permissions={"permission:update", "user:update"} - set(command.user_jwt_data.permissions)
+            )
+
+        permissions = await self.permission_repository.get_permissions_by_names(command.permissions)
+        if len(permissions) != len(command.permissions):
+            raise NotFoundPermissionsError(missing=command.permissions - {p.name for p in permissions})
+
+        missing = command.user_ids - await self.user_repository.get_existing_ids(command.user_ids)
+        if missing:
+            raise NotFoundUsersError(missing=missing)
+
+        changed = await self.user_repository.remove_permissions(command.user_ids, {p.id for p in permissions})
+        await self.token_blacklist.add_users(changed)
+
+        await self.session.commit()
+        logger.info("Permissions bulk deleted from users", extra={
+            "permission": command.permissions,
+            "deleted_count": len(changed),
+            "deleted_by": command.user_jwt_data.id,
+        })
@@ -0,0 +1,58 @@
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dtos.user import AuthUserJWTData
+from app.auth.exceptions import NotFoundRolesError, NotFoundUsersError
+from app.auth.repositories.role import RoleRepository
+from app.auth.repositories.session import TokenBlacklistRepository
+from app.auth.repositories.user import UserRepository
+from app.auth.services.rbac import AuthRBACManager
+from app.core.commands import BaseCommand, BaseCommandHandler
+from app.core.services.auth.exceptions import AccessDeniedError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BulkAssignRoleCommand(BaseCommand):
+    user_ids: set[int]
+    role_names: set[str]
+    user_jwt_data: AuthUserJWTData
+
+
+@dataclass(frozen=True)
+class BulkAssignRoleCommandHandler(BaseCommandHandler[BulkAssignRoleCommand, None]):
+    session: AsyncSession
+    role_repository: RoleRepository
+    user_repository: UserRepository
+    rbac_manager: AuthRBACManager
+    token_blacklist: TokenBlacklistRepository
+
+    async def handle(self, command: BulkAssignRoleCommand) -> None:
+        if not self.rbac_manager.check_permission(command.user_jwt_data, {"role:assign"}):
+            raise AccessDeniedError(
+                need_permissions={"role:assign"} - set(command.user_jwt_data.permissions)
+            )
+
+        roles = await self.role_repository.get_by_names(command.role_names)
+        if len(roles) != len(command.role_names):
+            raise NotFoundRolesError(missing=command.role_names - {role.name for role in roles})
+
+        for role in roles:
+            self.rbac_manager.check_security_level(command.user_jwt_data.security_level, role.security_level)
+
+        missing = command.user_ids - await self.user_repository.get_existing_ids(command.user_ids)
+        if missing:
+            raise NotFoundUsersError(missing=missing)
+
+        changed = await self.user_repository.add_roles(command.user_ids, {role.id for role in roles})
+        await self.token_blacklist.add_users(changed)
+
+        await self.session.commit()
+        logger.info("Roles bulk assigned", extra={
+            "role_names": command.role_names,
+            "assigned_count": len(changed),
+            "assigned_by": command.user_jwt_data.id,
+        })
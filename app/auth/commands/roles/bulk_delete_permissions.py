@@ -0,0 +1,57 @@
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dtos.user import AuthUserJWTData
+from app.auth.exceptions import NotFoundPermissionsError, NotFoundRolesError
+from app.auth.repositories.permission import PermissionRepository
+from app.auth.repositories.role import RoleInvalidateRepository, RoleRepository
+from app.auth.services.rbac import AuthRBACManager
+from app.core.commands import BaseCommand, BaseCommandHandler
+from app.core.services.auth.exceptions import AccessDeniedError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BulkDeletePermissionRoleCommand(BaseCommand):
+    role_names: set[str]
+    permissions: set[str]
+    user_jwt_data: AuthUserJWTData
+
+
+@dataclass(frozen=True)
+class BulkDeletePermissionRoleCommandHandler(BaseCommandHandler[BulkDeletePermissionRoleCommand, None]):
+    session: AsyncSession
+    role_repository: RoleRepository
+    permission_repository: PermissionRepository
+    rbac_manager: AuthRBACManager
+    role_invalidation: RoleInvalidateRepository
+
+    async def handle(self, command: BulkDeletePermissionRoleCommand) -> None:
+        if not self.rbac_manager.check_permission(command.user_jwt_data, {"role:update"}):
+            raise AccessDeniedError(need_permissions={"role:update"} - set(command.user_jwt_data.permissions))
+
+        roles = await self.role_repository.get_by_names(command.role_names)
+        if len(roles) != len(command.role_names):
+            raise NotFoundRolesError(missing=command.role_names - {role.name for role in roles})
+
+        for role in roles:
+            self.rbac_manager.check_security_level(command.user_jwt_data.security_level, role.security_level)
+
+        permissions = await self.permission_repository.get_permissions_by_names(command.permissions)
+        if len(permissions) != len(command.permissions):
+            raise NotFoundPermissionsError(missing=command.permissions - {p.name for p in permissions})
+
+        changed = await self.role_repository.remove_permissions(
+            {role.id for role in roles}, {p.id for p in permissions}
+        )
+        await self.role_invalidation.invalidate_roles(role.name for role in roles if role.id in changed)
+
+        await self.session.commit()
+        logger.info("Permissions bulk deleted from roles", extra={
+            "role_names": command.role_names,
+            "permission": command.permissions,
+            "delete_permission_by": command.user_jwt_data.id,
+        })
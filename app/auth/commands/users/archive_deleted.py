@@ -0,0 +1,38 @@
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.config import auth_config
+from app.auth.repositories.user import UserRepository
+from app.core.commands import BaseCommand, BaseCommandHandler
+from app.core.utils import now_utc
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ArchiveDeletedUsersCommand(BaseCommand):
+    retention_days: int = auth_config.USER_ARCHIVE_AFTER_DAYS
+    batch_size: int = auth_config.USER_ARCHIVE_BATCH_SIZE
+
+
+@dataclass(frozen=True)
+class ArchiveDeletedUsersCommandHandler(BaseCommandHandler[ArchiveDeletedUsersCommand, int]):
+    session: AsyncSession
+    user_repository: UserRepository
+
+    async def handle(self, command: ArchiveDeletedUsersCommand) -> int:
+        deleted_before = now_utc() - timedelta(days=command.retention_days)
+        archived = 0
+
+        while True:
+            moved = await self.user_repository.archive_deleted(deleted_before, command.batch_size)
+            await self.session.commit()
+            archived += moved
+            if moved < command.batch_size:
+                break
+
+        logger.info("Archive deleted users", extra={"archived": archived, "deleted_before": deleted_before})
+        return archived
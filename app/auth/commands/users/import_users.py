@@ -0,0 +1,118 @@
+import itertools
+import logging
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.config import auth_config
+from app.auth.dtos.user import ImportConflictDTO, ImportUsersReportDTO
+from app.auth.exceptions import NotFoundRoleError
+from app.auth.models.role_permission import RolesEnum
+from app.auth.models.user import CreatedUserEvent
+from app.auth.repositories.role import RoleRepository
+from app.auth.repositories.user import UserRepository
+from app.auth.services.hash import HashService
+from app.auth.services.user_import import (
+    ImportFormat,
+    ImportUserRow,
+    hash_passwords_in_pool,
+    read_rows,
+    validate_rows,
+)
+from app.core.commands import BaseCommand, BaseCommandHandler
+from app.core.events.service import BaseEventBus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ImportUsersCommand(BaseCommand):
+    path: str
+    import_format: ImportFormat
+    role_name: str = RolesEnum.STANDARD_USER.value.name
+    batch_size: int = auth_config.USER_IMPORT_BATCH_SIZE
+    workers: int = auth_config.USER_IMPORT_HASH_WORKERS
+
+
+@dataclass(frozen=True)
+class ImportUsersCommandHandler(BaseCommandHandler[ImportUsersCommand, ImportUsersReportDTO]):
+    session: AsyncSession
+    event_bus: BaseEventBus
+    user_repository: UserRepository
+    role_repository: RoleRepository
+    hash_service: HashService
+
+    async def handle(self, command: ImportUsersCommand) -> ImportUsersReportDTO:
+        role = await self.role_repository.get_by_name(command.role_name)
+        if role is None:
+            raise NotFoundRoleError(name=command.role_name)
+
+        report = ImportUsersReportDTO()
+        schemes = tuple(self.hash_service.pwd_context.schemes())
+
+        with (
+            open(command.path, newline="", encoding="utf-8") as source,
+            ProcessPoolExecutor(max_workers=command.workers) as pool,
+        ):
+            for batch in itertools.batched(
+                read_rows(source, command.import_format), command.batch_size, strict=False
+            ):
+                rows, invalid = validate_rows(batch)
+                report.invalid.extend(invalid)
+                if not rows:
+                    continue
+
+                hashes = await hash_passwords_in_pool(
+                    pool, schemes, [row.password for _, row in rows], chunks=command.workers
+                )
+                await self.user_repository.stage_import(
+                    (line, row.email, row.username, password_hash, row.is_verified)
+                    for (line, row), password_hash in zip(rows, hashes, strict=True)
+                )
+                created = await self.user_repository.merge_import()
+                await self.user_repository.add_roles([user_id for user_id, *_ in created], [role.id])
+                report.conflicts.extend(await self._conflicts(rows, created))
+                await self.session.commit()
+
+                report.imported += len(created)
+                await self.event_bus.publish(
+                    CreatedUserEvent(email=email, username=username)
+                    for _, email, username, is_verified in created
+                    if not is_verified
+                )
+                logger.info("Import batch merged", extra={
+                    "created": len(created), "invalid": len(invalid), "imported": report.imported
+                })
+
+        await self.user_repository.invalidate_cache()
+        logger.info("Import users", extra={
+            "path": command.path,
+            "imported": report.imported,
+            "invalid": len(report.invalid),
+            "conflicts": len(report.conflicts),
+        })
+        return report
+
+    async def _conflicts(
+        self, rows: Sequence[tuple[int, ImportUserRow]], created: Sequence[tuple[int, str, str, bool]]
+    ) -> list[ImportConflictDTO]:
+        created_pairs = {(email, username) for _, email, username, _ in created}
+        rejected = []
+        for line, row in rows:
+            if (row.email, row.username) in created_pairs:
+                created_pairs.discard((row.email, row.username))
+            else:
+                rejected.append((line, row))
+
+        if not rejected:
+            return []
+
+        taken_emails = await self.user_repository.get_taken_emails({row.email for _, row in rejected})
+        return [
+            ImportConflictDTO(line=line, field="email", value=row.email)
+            if row.email in taken_emails
+            else ImportConflictDTO(line=line, field="username", value=row.username)
+            for line, row in rejected
+        ]
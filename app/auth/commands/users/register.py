@@ -1,6 +1,7 @@
 import logging
 from dataclasses import dataclass
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dtos.user import UserDTO
@@ -11,10 +12,14 @@ from app.auth.repositories.role import RoleRepository
 from app.auth.repositories.user import UserRepository
 from app.auth.services.hash import HashService
 from app.core.commands import BaseCommand, BaseCommandHandler
+from app.core.db.exceptions import violated_constraint
 from app.core.events.service import BaseEventBus
 
 logger = logging.getLogger(__name__)
 
+DUPLICATE_FIELDS = {"ix_users_email": "email", "ix_users_username": "username"}
+
+
 @dataclass(frozen=True)
 class RegisterCommand(BaseCommand):
     username: str
@@ -58,7 +63,15 @@ class RegisterCommandHandler(BaseCommandHandler[RegisterCommand, UserDTO]):
         )
         await self.user_repository.create(user)
 
-        await self.session.commit()
+        try:
+            await self.session.commit()
+        except IntegrityError as exc:
+            field = DUPLICATE_FIELDS.get(violated_constraint(exc) or "")
+            if field is None:
+                raise
+            await self.session.rollback()
+            raise DuplicateUserError(field=field, value=getattr(command, field)) from exc
+
         await self.event_bus.publish(user.pull_events())
         await self.user_repository.invalidate_cache()
 
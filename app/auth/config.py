@@ -8,6 +8,13 @@ class AuthConfig(BaseConfig):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 5
     REFRESH_TOKEN_EXPIRE_DAYS: int = 60
 
+    USER_IMPORT_BATCH_SIZE: int = 1000
+    USER_IMPORT_HASH_WORKERS: int = 4
+
+    USER_ARCHIVE_AFTER_DAYS: int = 90
+    USER_ARCHIVE_BATCH_SIZE: int = 500
+    USER_ARCHIVE_CRON: str = "30 3 * * *"
+
     # OAuth Google
     OAUTH_GOOGLE_CLIENT_ID: str = ""
     OAUTH_GOOGLE_CLIENT_SECRET: str = ""
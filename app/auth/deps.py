@@ -1,20 +1,16 @@
-from typing import TYPE_CHECKING, Annotated
+from typing import Annotated
 
 from dishka.integrations.fastapi import FromDishka, inject
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 
-from app.auth.dtos.user import AuthUserJWTData, UserDTO
+from app.auth.dtos.user import AuthUserJWTData, CurrentUserDTO
 from app.auth.queries.auth.get_by_token import GetByAccessTokenQuery
+from app.core.db.routing import bind_db_identity
 from app.core.mediators.base import BaseMediator
 from app.core.services.auth.depends import UserJWTDataGetter
 from app.core.services.auth.exceptions import AccessDeniedError, NotAuthenticatedError
 
-if TYPE_CHECKING:
-    from app.auth.models.user import User
-
-
-
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/api/v1/auth/login",
     refreshUrl="/api/v1/auth/refresh",
@@ -28,26 +24,26 @@ class CurrentUserGetter:
         self,
         mediator: FromDishka[BaseMediator],
         token: Annotated[str | None, Depends(oauth2_scheme)],
-    ) -> UserDTO:
+    ) -> CurrentUserDTO:
         if token is None:
             raise NotAuthenticatedError
 
-        user: User = await mediator.handle_query(
+        user: CurrentUserDTO = await mediator.handle_query(
             GetByAccessTokenQuery(token=token)
         )
-        user_dto = UserDTO.model_validate(user)
-        return user_dto
+        bind_db_identity(user.id)
+        return user
 
 
 class ActiveUserGetter:
-    async def __call__(self, user: Annotated[UserDTO, Depends(CurrentUserGetter())]) -> UserDTO:
+    async def __call__(self, user: Annotated[CurrentUserDTO, Depends(CurrentUserGetter())]) -> CurrentUserDTO:
         if not user.is_active:
             raise AccessDeniedError(need_permissions=set())
         return user
 
 
-CurrentUserModel = Annotated[UserDTO, Depends(CurrentUserGetter())]
-ActiveUserModel = Annotated[UserDTO, Depends(ActiveUserGetter())]
+CurrentUserModel = Annotated[CurrentUserDTO, Depends(CurrentUserGetter())]
+ActiveUserModel = Annotated[CurrentUserDTO, Depends(ActiveUserGetter())]
 
 
 AuthCurrentUserJWTData = Annotated[AuthUserJWTData, Depends(UserJWTDataGetter())]
@@ -3,6 +3,7 @@ from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from app.auth.dtos.permissions import PermissionDTO
 from app.auth.dtos.role import RoleDTO
 from app.auth.dtos.sessions import SessionDTO
+from app.auth.models.effective_permissions import UserEffectivePermissions
 from app.auth.models.user import User
 from app.core.services.auth.dto import UserJWTData
 
@@ -44,6 +45,19 @@ class AuthUserJWTData(UserJWTData):
             device_id=device_id
         )
 
+    @classmethod
+    def create_from_effective_permissions(
+        cls, user: User, effective: UserEffectivePermissions, device_id: str | None=None
+    ) -> AuthUserJWTData:
+        return cls(
+            id=str(user.id),
+            username=user.username,
+            security_level=effective.security_level,
+            roles=effective.roles,
+            permissions=effective.permissions,
+            device_id=device_id
+        )
+
 
 class UserDTO(BaseUser):
     id: int
@@ -54,3 +68,57 @@ class UserDTO(BaseUser):
 
     is_active: bool
     is_verified: bool
+
+
+class CurrentUserDTO(BaseUser):
+    id: int
+    is_active: bool
+    is_verified: bool
+    security_level: int
+    roles: list[str] = Field(default_factory=list)
+    permissions: list[str] = Field(default_factory=list)
+
+    @classmethod
+    def create_from_effective_permissions(cls, user: User, effective: UserEffectivePermissions) -> CurrentUserDTO:
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+            security_level=effective.security_level,
+            roles=effective.roles,
+            permissions=effective.permissions,
+        )
+
+
+class ImportInvalidRowDTO(BaseModel):
+    line: int
+    errors: list[str]
+
+
+class ImportConflictDTO(BaseModel):
+    line: int
+    field: str
+    value: str
+
+
+class ImportUsersReportDTO(BaseModel):
+    imported: int = 0
+    invalid: list[ImportInvalidRowDTO] = Field(default_factory=list)
+    conflicts: list[ImportConflictDTO] = Field(default_factory=list)
+
+
+class UserFieldsDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int | None = None
+    username: str | None = None
+    email: str | None = None
+
+    roles: list[RoleDTO] | None = None
+    permissions: list[PermissionDTO] | None = None
+    sessions: list[SessionDTO] | None = None
+
+    is_active: bool | None = None
+    is_verified: bool | None = None
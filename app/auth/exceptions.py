@@ -21,6 +21,22 @@ class NotFoundUserError(ApplicationError):
         return {"user_by": self.user_by, "user_field": self.user_field}
 
 
+@dataclass(kw_only=True)
+class NotFoundUsersError(ApplicationError):
+    missing: set[int]
+
+    code: str = "NOT_FOUND_USERS"
+    status: int = 404
+
+    @property
+    def message(self) -> str:
+        return "Users not found"
+
+    @property
+    def detail(self) -> dict[str, Any]:
+        return {"users": sorted(self.missing)}
+
+
 @dataclass(kw_only=True)
 class WrongLoginDataError(ApplicationError):
     username: str
@@ -85,6 +101,22 @@ class NotFoundRoleError(ApplicationError):
         return {"name": self.name}
 
 
+@dataclass(kw_only=True)
+class NotFoundRolesError(ApplicationError):
+    missing: set[str]
+
+    code: str = "NOT_FOUND_ROLES"
+    status: int = 404
+
+    @property
+    def message(self) -> str:
+        return "Roles not found"
+
+    @property
+    def detail(self) -> dict[str, Any]:
+        return {"roles": list(self.missing)}
+
+
 @dataclass(kw_only=True)
 class InvalidRoleNameError(ApplicationError):
     name: str
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import ClassVar
 
 from app.core.filters.base import BaseFilter
 from app.core.filters.condition import FilterOperator
@@ -8,6 +9,8 @@ from app.core.filters.loading_strategy import LoadingStrategyType
 
 @dataclass
 class UserFilter(BaseFilter):
+    searchable_fields: ClassVar[frozenset[str]] = frozenset({"email", "username"})
+
     email: str | None = None
     username: str | None = None
     is_active: bool | None = None
@@ -21,6 +24,7 @@ class UserFilter(BaseFilter):
     has_sessions: bool | None = None
     role_names: list[str] | None = None
     permission_names: list[str] | None = None
+    search: str | None = None
 
     def build_condition(self) -> None:
         self.add_condition("is_active", FilterOperator.EQ, self.is_active)
@@ -36,6 +40,8 @@ class UserFilter(BaseFilter):
 
         self.add_condition("username", FilterOperator.CONTAINS, self.username)
 
+        self.add_condition("search_vector", FilterOperator.SEARCH, self.search)
+
         self.add_condition("created_at", FilterOperator.GTE, self.created_after)
 
         self.add_condition("created_at", FilterOperator.LTE, self.created_before)
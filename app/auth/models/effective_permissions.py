@@ -0,0 +1,141 @@
+from datetime import datetime
+
+from sqlalchemy import DDL, BigInteger, DateTime, ForeignKey, Integer, String, event, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.db.base_model import BaseModel
+
+
+class UserEffectivePermissions(BaseModel):
+    __tablename__ = "user_effective_permissions"
+
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="cascade", onupdate="cascade"),
+        primary_key=True,
+    )
+    roles: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, server_default=text("'{}'"))
+    permissions: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, server_default=text("'{}'"))
+    security_level: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+REFRESH_FUNCTION = "refresh_user_effective_permissions"
+
+_REFRESH_SQL = f"""
+CREATE OR REPLACE FUNCTION {REFRESH_FUNCTION}(target_ids bigint[]) RETURNS void
+LANGUAGE sql AS $$
+    INSERT INTO user_effective_permissions (user_id, roles, permissions, security_level, updated_at)
+    SELECT
+        u.id,
+        coalesce((
+            SELECT array_agg(r.name ORDER BY r.name)
+            FROM user_roles ur JOIN roles r ON r.id = ur.role_id
+            WHERE ur.user_id = u.id
+        ), '{{}}'),
+        coalesce((
+            SELECT array_agg(p.name ORDER BY p.name)
+            FROM (
+                SELECT rp.permission_id
+                FROM user_roles ur JOIN role_permissions rp ON rp.role_id = ur.role_id
+                WHERE ur.user_id = u.id
+                UNION
+                SELECT up.permission_id FROM user_permissions up WHERE up.user_id = u.id
+            ) AS granted JOIN permissions p ON p.id = granted.permission_id
+        ), '{{}}'),
+        coalesce((
+            SELECT max(r.security_level)
+            FROM user_roles ur JOIN roles r ON r.id = ur.role_id
+            WHERE ur.user_id = u.id
+        ), 0),
+        now()
+    FROM users u
+    WHERE u.id = ANY(target_ids)
+    ON CONFLICT (user_id) DO UPDATE SET
+        roles = EXCLUDED.roles,
+        permissions = EXCLUDED.permissions,
+        security_level = EXCLUDED.security_level,
+        updated_at = EXCLUDED.updated_at;
+$$
+"""
+
+_TRIGGER_FUNCTIONS = {
+    "user_effective_permissions_by_new_user": "ARRAY(SELECT id FROM changed_rows)",
+    "user_effective_permissions_by_user": "ARRAY(SELECT DISTINCT user_id FROM changed_rows)",
+    "user_effective_permissions_by_role_permission": (
+        "ARRAY(SELECT DISTINCT ur.user_id FROM user_roles ur "
+        "WHERE ur.role_id IN (SELECT role_id FROM changed_rows))"
+    ),
+    "user_effective_permissions_by_role": "ARRAY(SELECT ur.user_id FROM user_roles ur WHERE ur.role_id = NEW.id)",
+    "user_effective_permissions_by_permission": (
+        "ARRAY(SELECT up.user_id FROM user_permissions up WHERE up.permission_id = NEW.id "
+        "UNION SELECT ur.user_id FROM user_roles ur JOIN role_permissions rp ON rp.role_id = ur.role_id "
+        "WHERE rp.permission_id = NEW.id)"
+    ),
+}
+
+_STATEMENT_TRIGGERS = (
+    ("users", "INSERT", "user_effective_permissions_by_new_user"),
+    ("user_roles", "INSERT", "user_effective_permissions_by_user"),
+    ("user_roles", "DELETE", "user_effective_permissions_by_user"),
+    ("user_permissions", "INSERT", "user_effective_permissions_by_user"),
+    ("user_permissions", "DELETE", "user_effective_permissions_by_user"),
+    ("role_permissions", "INSERT", "user_effective_permissions_by_role_permission"),
+    ("role_permissions", "DELETE", "user_effective_permissions_by_role_permission"),
+)
+
+_ROW_TRIGGERS = (
+    ("roles", "name, security_level", "user_effective_permissions_by_role"),
+    ("permissions", "name", "user_effective_permissions_by_permission"),
+)
+
+
+def _trigger_function_sql(name: str, user_ids: str) -> str:
+    return f"""
+CREATE OR REPLACE FUNCTION {name}() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM {REFRESH_FUNCTION}({user_ids});
+    RETURN NULL;
+END
+$$
+"""
+
+
+def _statement_trigger_sql(table: str, operation: str, function: str) -> str:
+    transition = "NEW" if operation == "INSERT" else "OLD"
+    return (
+        f"CREATE TRIGGER {table}_{operation.lower()}_effective_permissions AFTER {operation} ON {table} "
+        f"REFERENCING {transition} TABLE AS changed_rows FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+    )
+
+
+def _row_trigger_sql(table: str, columns: str, function: str) -> str:
+    changed = " OR ".join(
+        f"OLD.{column} IS DISTINCT FROM NEW.{column}" for column in columns.split(", ")
+    )
+    return (
+        f"CREATE TRIGGER {table}_update_effective_permissions AFTER UPDATE OF {columns} ON {table} "
+        f"FOR EACH ROW WHEN ({changed}) EXECUTE FUNCTION {function}()"
+    )
+
+
+CREATE_EFFECTIVE_PERMISSIONS_SQL: tuple[str, ...] = (
+    _REFRESH_SQL,
+    *(_trigger_function_sql(name, user_ids) for name, user_ids in _TRIGGER_FUNCTIONS.items()),
+    *(_statement_trigger_sql(*trigger) for trigger in _STATEMENT_TRIGGERS),
+    *(_row_trigger_sql(*trigger) for trigger in _ROW_TRIGGERS),
+)
+
+DROP_EFFECTIVE_PERMISSIONS_SQL: tuple[str, ...] = (
+    *(f"DROP FUNCTION IF EXISTS {name}() CASCADE" for name in _TRIGGER_FUNCTIONS),
+    f"DROP FUNCTION IF EXISTS {REFRESH_FUNCTION}(bigint[])",
+)
+
+for statement in CREATE_EFFECTIVE_PERMISSIONS_SQL:
+    event.listen(BaseModel.metadata, "after_create", DDL(statement).execute_if(dialect="postgresql"))  # type: ignore[no-untyped-call]
+
+for statement in DROP_EFFECTIVE_PERMISSIONS_SQL:
+    event.listen(BaseModel.metadata, "before_drop", DDL(statement).execute_if(dialect="postgresql"))  # type: ignore[no-untyped-call]
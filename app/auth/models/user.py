@@ -1,10 +1,19 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import BigInteger, Boolean, ForeignKey, Integer, String
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-
-from app.core.db.base_model import BaseModel, DateMixin, SoftDeleteMixin
+from sqlalchemy.sql import func
+
+from app.core.db.base_model import (
+    BaseModel,
+    DateMixin,
+    SoftDeleteMixin,
+    deleted_index,
+    not_deleted_unique_index,
+)
+from app.core.db.search import search_vector_column, search_vector_index, trigram_index
 from app.core.events.event import BaseEvent
 
 if TYPE_CHECKING:
@@ -53,15 +62,31 @@ class UserPermissions(BaseModel):
     )
 
 
+class UserArchive(BaseModel):
+    __tablename__ = "users_archive"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    email: Mapped[str] = mapped_column(String, nullable=False)
+    username: Mapped[str] = mapped_column(String, nullable=False)
+    password_hash: Mapped[str | None] = mapped_column(String, nullable=True)
+    is_active: Mapped[bool] = mapped_column(Boolean)
+    is_verified: Mapped[bool] = mapped_column(Boolean)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    deleted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
 class User(BaseModel, DateMixin, SoftDeleteMixin):
     __tablename__ = "users"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    email: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
-    username: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
+    email: Mapped[str] = mapped_column(String, nullable=False)
+    username: Mapped[str] = mapped_column(String, nullable=False)
     password_hash: Mapped[str | None] = mapped_column(String, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False)
+    search_vector: Mapped[Any] = search_vector_column("username", "email")
 
     sessions: Mapped[list[Session]] = relationship(
         back_populates="user",
@@ -83,6 +108,15 @@ class User(BaseModel, DateMixin, SoftDeleteMixin):
         "Permission", secondary="user_permissions", back_populates="users"
     )
 
+    __table_args__ = (
+        not_deleted_unique_index("users", "email"),
+        not_deleted_unique_index("users", "username"),
+        deleted_index("users"),
+        trigram_index("users", "email"),
+        trigram_index("users", "username"),
+        search_vector_index("users"),
+    )
+
     @classmethod
     def create(
         cls, email: str, username: str, password_hash: str | None,
@@ -14,6 +14,14 @@ from app.auth.commands.permissions.add_permission_user import (
     AddPermissionToUserCommand,
     AddPermissionToUserCommandHandler,
 )
+from app.auth.commands.permissions.bulk_add_permission_users import (
+    BulkAddPermissionToUsersCommand,
+    BulkAddPermissionToUsersCommandHandler,
+)
+from app.auth.commands.permissions.bulk_remove_permission_users import (
+    BulkDeletePermissionToUsersCommand,
+    BulkDeletePermissionToUsersCommandHandler,
+)
 from app.auth.commands.permissions.create import CreatePermissionCommand, CreatePermissionCommandHandler
 from app.auth.commands.permissions.delete import DeletePermissionCommand, DeletePermissionCommandHandler
 from app.auth.commands.permissions.remove_permission_user import (
@@ -22,6 +30,16 @@ from app.auth.commands.permissions.remove_permission_user import (
 )
 from app.auth.commands.roles.add_permissions import AddPermissionRoleCommand, AddPermissionRoleCommandHandler
 from app.auth.commands.roles.assign_role_to_user import AssignRoleCommand, AssignRoleCommandHandler
+from app.auth.commands.roles.bulk_add_permissions import (
+    BulkAddPermissionRoleCommand,
+    BulkAddPermissionRoleCommandHandler,
+)
+from app.auth.commands.roles.bulk_assign_roles import BulkAssignRoleCommand, BulkAssignRoleCommandHandler
+from app.auth.commands.roles.bulk_delete_permissions import (
+    BulkDeletePermissionRoleCommand,
+    BulkDeletePermissionRoleCommandHandler,
+)
+from app.auth.commands.roles.bulk_remove_roles import BulkRemoveRoleCommand, BulkRemoveRoleCommandHandler
 from app.auth.commands.roles.create import CreateRoleCommand, CreateRoleCommandHandler
 from app.auth.commands.roles.delete_permissions import DeletePermissionRoleCommand, DeletePermissionRoleCommandHandler
 from app.auth.commands.roles.remove_role_user import RemoveRoleCommand, RemoveRoleCommandHandler
@@ -30,6 +48,8 @@ from app.auth.commands.sessions.deactivate_session import (
     UserDeactivateSessionCommand,
     UserDeactivateSessionCommandHandler,
 )
+from app.auth.commands.users.archive_deleted import ArchiveDeletedUsersCommand, ArchiveDeletedUsersCommandHandler
+from app.auth.commands.users.import_users import ImportUsersCommand, ImportUsersCommandHandler
 from app.auth.commands.users.register import RegisterCommand, RegisterCommandHandler
 from app.auth.commands.users.reset_password import ResetPasswordCommand, ResetPasswordCommandHandler
 from app.auth.commands.users.send_reset_password import SendResetPasswordCommand, SendResetPasswordCommandHandler
@@ -44,8 +64,10 @@ from app.auth.queries.auth.oauth import GetUserOAuthAccountsQuery, GetUserOAuthA
 from app.auth.queries.auth.verify import VerifyTokenQuery, VerifyTokenQueryHandler
 from app.auth.queries.permissions.get_list import GetListPermissionsQuery, GetListPermissionsQueryHandler
 from app.auth.queries.roles.get_list import GetListRolesQuery, GetListRolesQueryHandler
+from app.auth.queries.sessions.export import ExportSessionsQuery, ExportSessionsQueryHandler
 from app.auth.queries.sessions.get_list import GetListSessionQuery, GetListSessionQueryHandler
 from app.auth.queries.sessions.get_list_by_user import GetListSessionsUserQuery, GetListSessionsUserQueryHandler
+from app.auth.queries.users.export import ExportUsersQuery, ExportUsersQueryHandler
 from app.auth.queries.users.get_list import GetListUserQuery, GetListUserQueryHandler
 from app.auth.repositories.oauth import OauthAccountRepository, OAuthCodeRepository
 from app.auth.repositories.permission import PermissionInvalidateRepository, PermissionRepository
@@ -179,6 +201,8 @@ class AuthModuleProvider(Provider):
     oauth_manager = provide(OAuthManager)
 
     register_user_handler = provide(RegisterCommandHandler)
+    import_users_handler = provide(ImportUsersCommandHandler)
+    archive_deleted_users_handler = provide(ArchiveDeletedUsersCommandHandler)
     reset_password_handler = provide(ResetPasswordCommandHandler)
     send_reset_password_handler = provide(SendResetPasswordCommandHandler)
     send_verify_handler = provide(SendVerifyCommandHandler)
@@ -196,17 +220,25 @@ class AuthModuleProvider(Provider):
     remove_role_handler = provide(RemoveRoleCommandHandler)
     add_permission_role_handler = provide(AddPermissionRoleCommandHandler)
     remove_permission_role_handler = provide(DeletePermissionRoleCommandHandler)
+    bulk_assign_role_handler = provide(BulkAssignRoleCommandHandler)
+    bulk_remove_role_handler = provide(BulkRemoveRoleCommandHandler)
+    bulk_add_permission_role_handler = provide(BulkAddPermissionRoleCommandHandler)
+    bulk_remove_permission_role_handler = provide(BulkDeletePermissionRoleCommandHandler)
 
     create_permission_handler = provide(CreatePermissionCommandHandler)
     delete_permission_handler = provide(DeletePermissionCommandHandler)
     add_permission_to_user_handler = provide(AddPermissionToUserCommandHandler)
     delete_permission_to_user_handler = provide(DeletePermissionToUserCommandHandler)
+    bulk_add_permission_to_users_handler = provide(BulkAddPermissionToUsersCommandHandler)
+    bulk_delete_permission_to_users_handler = provide(BulkDeletePermissionToUsersCommandHandler)
 
     deactivate_session_handler = provide(UserDeactivateSessionCommandHandler)
 
     @decorate
     def register_auth_command_handlers(self, command_registry: CommandRegistry) -> CommandRegistry:
         command_registry.register_command(RegisterCommand, RegisterCommandHandler)
+        command_registry.register_command(ImportUsersCommand, ImportUsersCommandHandler)
+        command_registry.register_command(ArchiveDeletedUsersCommand, ArchiveDeletedUsersCommandHandler)
         command_registry.register_command(VerifyCommand, VerifyCommandHandler)
         command_registry.register_command(SendVerifyCommand, SendVerifyCommandHandler)
         command_registry.register_command(ResetPasswordCommand, ResetPasswordCommandHandler)
@@ -225,11 +257,19 @@ class AuthModuleProvider(Provider):
         command_registry.register_command(AddPermissionRoleCommand, AddPermissionRoleCommandHandler)
         command_registry.register_command(DeletePermissionRoleCommand, DeletePermissionRoleCommandHandler)
         command_registry.register_command(RoleUpdateCommand, RoleUpdateCommandHandler)
+        command_registry.register_command(BulkAssignRoleCommand, BulkAssignRoleCommandHandler)
+        command_registry.register_command(BulkRemoveRoleCommand, BulkRemoveRoleCommandHandler)
+        command_registry.register_command(BulkAddPermissionRoleCommand, BulkAddPermissionRoleCommandHandler)
+        command_registry.register_command(BulkDeletePermissionRoleCommand, BulkDeletePermissionRoleCommandHandler)
 
         command_registry.register_command(CreatePermissionCommand, CreatePermissionCommandHandler)
         command_registry.register_command(DeletePermissionCommand, DeletePermissionCommandHandler)
         command_registry.register_command(AddPermissionToUserCommand, AddPermissionToUserCommandHandler)
         command_registry.register_command(DeletePermissionToUserCommand, DeletePermissionToUserCommandHandler)
+        command_registry.register_command(BulkAddPermissionToUsersCommand, BulkAddPermissionToUsersCommandHandler)
+        command_registry.register_command(
+            BulkDeletePermissionToUsersCommand, BulkDeletePermissionToUsersCommandHandler
+        )
 
         command_registry.register_command(UserDeactivateSessionCommand, UserDeactivateSessionCommandHandler)
         return command_registry
@@ -245,11 +285,13 @@ class AuthModuleProvider(Provider):
     # query
     get_jwt_data = provide(VerifyTokenQueryHandler)
     get_list_user_query_handler = provide(GetListUserQueryHandler)
+    export_users_query_handler = provide(ExportUsersQueryHandler)
     get_user_by_access_token_query_handler = provide(GetByAccessTokenQueryHandler)
     get_permissions_query_handler = provide(GetListPermissionsQueryHandler)
     get_roles_query_handler = provide(GetListRolesQueryHandler)
     get_list_user_sessions = provide(GetListSessionsUserQueryHandler)
     get_list_sessions = provide(GetListSessionQueryHandler)
+    export_sessions = provide(ExportSessionsQueryHandler)
     get_user_oauth_accounts = provide(GetUserOAuthAccountsQueryHandler)
 
     @decorate
@@ -260,6 +302,7 @@ class AuthModuleProvider(Provider):
         query_registry.register_query(GetUserOAuthAccountsQuery, GetUserOAuthAccountsQueryHandler)
 
         query_registry.register_query(GetListUserQuery, GetListUserQueryHandler)
+        query_registry.register_query(ExportUsersQuery, ExportUsersQueryHandler)
 
         query_registry.register_query(GetListPermissionsQuery, GetListPermissionsQueryHandler)
 
@@ -267,4 +310,5 @@ class AuthModuleProvider(Provider):
 
         query_registry.register_query(GetListSessionsUserQuery, GetListSessionsUserQueryHandler)
         query_registry.register_query(GetListSessionQuery, GetListSessionQueryHandler)
+        query_registry.register_query(ExportSessionsQuery, ExportSessionsQueryHandler)
         return query_registry
@@ -1,8 +1,9 @@
 import logging
 from dataclasses import dataclass
+from typing import ClassVar
 
+from app.auth.dtos.user import CurrentUserDTO
 from app.auth.exceptions import NotFoundUserError
-from app.auth.models.user import User
 from app.auth.repositories.user import UserRepository
 from app.auth.services.jwt import AuthJWTManager
 from app.core.queries import BaseQuery, BaseQueryHandler
@@ -13,19 +14,21 @@ logger = logging.getLogger(__name__)
 class GetByAccessTokenQuery(BaseQuery):
     token: str
 
+    read_from_replica: ClassVar[bool] = False
+
 
 @dataclass(frozen=True)
-class GetByAccessTokenQueryHandler(BaseQueryHandler[GetByAccessTokenQuery, User]):
+class GetByAccessTokenQueryHandler(BaseQueryHandler[GetByAccessTokenQuery, CurrentUserDTO]):
     user_repository: UserRepository
     jwt_manager: AuthJWTManager
 
-    async def handle(self, query: GetByAccessTokenQuery) -> User:
+    async def handle(self, query: GetByAccessTokenQuery) -> CurrentUserDTO:
         token_data = await self.jwt_manager.validate_token(token=query.token)
         user_id = token_data.sub
 
-        user = await self.user_repository.get_user_with_permission_by_id(int(user_id))
-        if not user:
+        authorization = await self.user_repository.get_authorization_by_id(int(user_id))
+        if not authorization:
             raise NotFoundUserError(user_by=user_id, user_field="id")
 
-        logger.debug("Get user by access token", extra={"user_id": user.id})
-        return user
+        logger.debug("Get user by access token", extra={"user_id": user_id})
+        return CurrentUserDTO.create_from_effective_permissions(*authorization)
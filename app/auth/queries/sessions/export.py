@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.dtos.sessions import SessionDTO
+from app.auth.dtos.user import AuthUserJWTData
+from app.auth.filters.sessions import SessionFilter
+from app.auth.models.session import Session
+from app.auth.repositories.session import SessionRepository
+from app.auth.services.rbac import AuthRBACManager
+from app.core.db.routing import DBRoute, db_route, route_to
+from app.core.queries import BaseQuery, BaseQueryHandler
+from app.core.services.auth.exceptions import AccessDeniedError
+
+
+@dataclass(frozen=True)
+class ExportSessionsQuery(BaseQuery):
+    session_filter: SessionFilter
+    user_jwt_data: AuthUserJWTData
+    batch_size: int = 1000
+
+
+@dataclass(frozen=True)
+class ExportSessionsQueryHandler(BaseQueryHandler[ExportSessionsQuery, AsyncIterator[list[SessionDTO]]]):
+    session_repository: SessionRepository
+    rbac_manager: AuthRBACManager
+    session_maker: async_sessionmaker[AsyncSession]
+
+    async def handle(self, query: ExportSessionsQuery) -> AsyncIterator[list[SessionDTO]]:
+        if not self.rbac_manager.check_permission(query.user_jwt_data, {"user:view"}):
+            raise AccessDeniedError(need_permissions={"user:view"} - set(query.user_jwt_data.permissions))
+
+        return self._stream(query.session_filter, query.batch_size, db_route.get() or DBRoute.PRIMARY)
+
+    async def _stream(
+        self, session_filter: SessionFilter, batch_size: int, route: DBRoute
+    ) -> AsyncIterator[list[SessionDTO]]:
+        with route_to(route):
+            async with self.session_maker() as db_session:
+                repository = replace(self.session_repository, session=db_session)
+                async for sessions in repository.stream_by_filter(Session, session_filter, batch_size):
+                    yield [SessionDTO.model_validate(session) for session in sessions]
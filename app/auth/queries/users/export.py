@@ -0,0 +1,53 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.dtos.user import AuthUserJWTData, UserDTO, UserFieldsDTO
+from app.auth.filters.users import UserFilter
+from app.auth.models.user import User
+from app.auth.repositories.user import UserRepository
+from app.auth.services.rbac import AuthRBACManager
+from app.core.db.routing import DBRoute, db_route, route_to
+from app.core.queries import BaseQuery, BaseQueryHandler
+from app.core.services.auth.exceptions import AccessDeniedError
+
+
+@dataclass(frozen=True)
+class ExportUsersQuery(BaseQuery):
+    user_filter: UserFilter
+    user_jwt_data: AuthUserJWTData
+    batch_size: int = 1000
+
+
+@dataclass(frozen=True)
+class ExportUsersQueryHandler(BaseQueryHandler[ExportUsersQuery, AsyncIterator[list[BaseModel]]]):
+    user_repository: UserRepository
+    rbac_manager: AuthRBACManager
+    session_maker: async_sessionmaker[AsyncSession]
+
+    async def handle(self, query: ExportUsersQuery) -> AsyncIterator[list[BaseModel]]:
+        if not self.rbac_manager.check_permission(query.user_jwt_data, {"user:view"}):
+            raise AccessDeniedError(need_permissions={"user:view"} - set(query.user_jwt_data.permissions))
+
+        return self._stream(query.user_filter, query.batch_size, db_route.get() or DBRoute.PRIMARY)
+
+    async def _stream(
+        self, user_filter: UserFilter, batch_size: int, route: DBRoute
+    ) -> AsyncIterator[list[BaseModel]]:
+        # the response iterates after the mediator has closed the request session, so the stream owns its own
+        fields = user_filter.fields
+        with route_to(route):
+            async with self.session_maker() as session:
+                repository = replace(self.user_repository, session=session)
+                async for users in repository.stream_by_filter(User, user_filter, batch_size):
+                    if fields is None:
+                        yield [UserDTO.model_validate(user) for user in users]
+                    else:
+                        yield [
+                            UserFieldsDTO.model_validate(
+                                {name: getattr(user, name) for name in fields}, from_attributes=True
+                            )
+                            for user in users
+                        ]
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from app.auth.dtos.user import AuthUserJWTData, UserDTO
+from app.auth.dtos.user import AuthUserJWTData, UserDTO, UserFieldsDTO
 from app.auth.filters.users import UserFilter
 from app.auth.models.user import User
 from app.auth.repositories.user import UserRepository
@@ -17,14 +17,20 @@ class GetListUserQuery(BaseQuery):
 
 
 @dataclass(frozen=True)
-class GetListUserQueryHandler(BaseQueryHandler[GetListUserQuery, PageResult[UserDTO]]):
+class GetListUserQueryHandler(BaseQueryHandler[GetListUserQuery, PageResult[UserDTO] | PageResult[UserFieldsDTO]]):
     user_repository: UserRepository
     rbac_manager: AuthRBACManager
 
-    async def handle(self, query: GetListUserQuery) -> PageResult[UserDTO]:
+    async def handle(self, query: GetListUserQuery) -> PageResult[UserDTO] | PageResult[UserFieldsDTO]:
         if not self.rbac_manager.check_permission(query.user_jwt_data, {"user:view"}):
             raise AccessDeniedError(need_permissions={"user:view"} - set(query.user_jwt_data.permissions))
 
+        if query.user_filter.has_projection():
+            return await self.user_repository.cache_paginated(
+                UserFieldsDTO, self._handle_projection, ttl=200,
+                user_filter=query.user_filter,
+            )
+
         return await self.user_repository.cache_paginated(
             UserDTO, self._handle, ttl=200,
             user_filter=query.user_filter,
@@ -42,3 +48,28 @@ class GetListUserQueryHandler(BaseQueryHandler[GetListUserQuery, PageResult[User
             page=pagination_users.page,
             page_size=pagination_users.page_size
         )
+
+    async def _handle_projection(self, user_filter: UserFilter) -> PageResult[UserFieldsDTO]:
+        fields = user_filter.fields or ()
+
+        if not user_filter.has_relation_fields():
+            pagination_rows = await self.user_repository.find_rows_by_filter(User, filters=user_filter)
+            items = [UserFieldsDTO.model_validate(row) for row in pagination_rows.items]
+            return PageResult(
+                items=items,
+                total=pagination_rows.total,
+                page=pagination_rows.page,
+                page_size=pagination_rows.page_size
+            )
+
+        pagination_users = await self.user_repository.find_by_filter(User, filters=user_filter)
+
+        return PageResult(
+            items=[
+                UserFieldsDTO.model_validate({name: getattr(user, name) for name in fields}, from_attributes=True)
+                for user in pagination_users.items
+            ],
+            total=pagination_users.total,
+            page=pagination_users.page,
+            page_size=pagination_users.page_size
+        )
@@ -2,13 +2,18 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from redis.asyncio import Redis
-from sqlalchemy import Select, select
+from sqlalchemy import Select, bindparam, select
 
 from app.auth.filters.permissions import PermissionFilter
 from app.auth.models.permission import Permission
 from app.core.db.repository import IRepository
+from app.core.db.statements import hot_statements
 from app.core.utils import fromtimestamp, now_utc
 
+GET_BY_NAME = hot_statements.register(
+    "permission.get_by_name", select(Permission).where(Permission.name == bindparam("name"))
+)
+
 
 @dataclass
 class PermissionRepository(IRepository[Permission, PermissionFilter]):
@@ -19,8 +24,7 @@ class PermissionRepository(IRepository[Permission, PermissionFilter]):
         await self.session.delete(permission)
 
     async def get_permission_by_name(self, name: str) -> Permission | None:
-        query = select(Permission).where(Permission.name == name)
-        result = await self.session.execute(query)
+        result = await self.session.execute(GET_BY_NAME, {"name": name})
         return result.scalar()
 
     async def get_permissions_by_names(self, names: set[str]) -> list[Permission]:
@@ -1,16 +1,23 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from redis.asyncio import Redis
-from sqlalchemy import Select, select
+from sqlalchemy import Select, bindparam, delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import selectinload
 
 from app.auth.filters.roles import RoleFilter
-from app.auth.models.permission import Permission
+from app.auth.models.permission import Permission, RolePermissions
 from app.auth.models.role import Role
+from app.core.db.bulk import any_of
 from app.core.db.repository import IRepository
+from app.core.db.statements import hot_statements
 from app.core.utils import fromtimestamp, now_utc
 
+GET_BY_NAME = hot_statements.register("role.get_by_name", select(Role).where(Role.name == bindparam("name")))
+GET_BY_ID = hot_statements.register("role.get_by_id", select(Role).where(Role.id == bindparam("role_id")))
+
 
 @dataclass
 class RoleRepository(IRepository[Role, RoleFilter]):
@@ -20,15 +27,33 @@ class RoleRepository(IRepository[Role, RoleFilter]):
         return result.scalar()
 
     async def get_by_name(self, name: str) -> Role | None:
-        query = select(Role).where(Role.name==name)
-        result = await self.session.execute(query)
+        result = await self.session.execute(GET_BY_NAME, {"name": name})
         return result.scalar()
 
     async def get_by_id(self, role_id: int) -> Role | None:
-        query = select(Role).where(Role.id==role_id)
-        result = await self.session.execute(query)
+        result = await self.session.execute(GET_BY_ID, {"role_id": role_id})
         return result.scalar()
 
+    async def get_by_names(self, names: Iterable[str]) -> list[Role]:
+        query = select(Role).where(any_of(Role.name, names))
+        result = await self.session.execute(query)
+        return list(result.scalars())
+
+    async def add_permissions(self, role_ids: Iterable[int], permission_ids: Iterable[int]) -> set[int]:
+        rows = select(Role.id, Permission.id).join(Permission, any_of(Permission.id, permission_ids)).where(
+            any_of(Role.id, role_ids)
+        )
+        stmt = insert(RolePermissions).from_select(["role_id", "permission_id"], rows).on_conflict_do_nothing()
+        result = await self.session.execute(stmt.returning(RolePermissions.role_id))
+        return set(result.scalars())
+
+    async def remove_permissions(self, role_ids: Iterable[int], permission_ids: Iterable[int]) -> set[int]:
+        stmt = delete(RolePermissions).where(
+            any_of(RolePermissions.role_id, role_ids), any_of(RolePermissions.permission_id, permission_ids)
+        )
+        result = await self.session.execute(stmt.returning(RolePermissions.role_id))
+        return set(result.scalars())
+
     async def create(self, role: Role) -> None:
         self.session.add(role)
 
@@ -51,6 +76,16 @@ class RoleInvalidateRepository:
         value = str(now_utc().timestamp())
         await self.client.set(key, value=value, ex=expiration)
 
+    async def invalidate_roles(self, role_names: Iterable[str], expiration: timedelta | None = None) -> None:
+        if expiration is None:
+            expiration = timedelta(days=8)
+
+        value = str(now_utc().timestamp())
+        pipe = self.client.pipeline(transaction=False)
+        for role_name in role_names:
+            pipe.set(f"invalid_role:{role_name}", value=value, ex=expiration)
+        await pipe.execute()
+
     async def get_role_invalidation_time(self, role_name: str) -> str | None:
         key = f"invalid_role:{role_name}"
         return await self.client.get(key)
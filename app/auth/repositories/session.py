@@ -1,30 +1,36 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from redis.asyncio import Redis
-from sqlalchemy import Select, select, update
+from sqlalchemy import Select, bindparam, select, update
 
 from app.auth.config import auth_config
 from app.auth.filters.sessions import SessionFilter
 from app.auth.models.session import Session
 from app.core.db.repository import IRepository
+from app.core.db.statements import hot_statements
 from app.core.utils import fromtimestamp, now_utc
 
+GET_BY_ID = hot_statements.register("session.get_by_id", select(Session).where(Session.id == bindparam("session_id")))
+GET_ACTIVE_BY_DEVICE = hot_statements.register(
+    "session.get_active_by_device",
+    select(Session).where(
+        Session.user_id == bindparam("user_id"),
+        Session.device_id == bindparam("device_id"),
+        Session.is_active,
+    ),
+)
+
 
 @dataclass
 class SessionRepository(IRepository[Session, SessionFilter]):
     async def get_by_id(self, session_id: int) -> Session | None:
-        query = select(Session).where(Session.id == session_id)
-        result = await self.session.execute(query)
+        result = await self.session.execute(GET_BY_ID, {"session_id": session_id})
         return result.scalar()
 
     async def get_active_by_device(self, user_id: int, device_id: str) -> Session | None:
-        query = select(Session).where(
-            Session.user_id == user_id,
-            Session.device_id == device_id,
-            Session.is_active
-        )
-        result = await self.session.execute(query)
+        result = await self.session.execute(GET_ACTIVE_BY_DEVICE, {"user_id": user_id, "device_id": device_id})
         return result.scalar()
 
     async def get_active_by_user(self, user_id: int) -> list[Session]:
@@ -63,6 +69,16 @@ class TokenBlacklistRepository:
             f"user:{user_id}",  str(now_utc().timestamp()), ex=expiration
         )
 
+    async def add_users(self, user_ids: Iterable[int], expiration: timedelta | None=None) -> None:
+        if expiration is None:
+            expiration = timedelta(minutes=auth_config.ACCESS_TOKEN_EXPIRE_MINUTES + 1)
+
+        value = str(now_utc().timestamp())
+        pipe = self.client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.set(f"user:{user_id}", value, ex=expiration)
+        await pipe.execute()
+
     async def get_user_backlist(self, user_id: int)  -> datetime:
         time_str = await self.client.get(f"user:{user_id}") or "0"
         return fromtimestamp(float(time_str))
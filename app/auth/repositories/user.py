@@ -1,13 +1,58 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, cast
 
-from sqlalchemy import Select, select
+from sqlalchemy import Boolean, Column, Integer, Select, String, Table, bindparam, delete, select, true
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import selectinload
 
 from app.auth.filters.users import UserFilter
+from app.auth.models.effective_permissions import UserEffectivePermissions
 from app.auth.models.permission import Permission
-from app.auth.models.role import Role
-from app.auth.models.user import User
+from app.auth.models.role import Role, UserRoles
+from app.auth.models.user import User, UserArchive, UserPermissions
+from app.core.db.bulk import any_of
+from app.core.db.copy import copy_records, create_staging_table, drop_staging_table, staging_table
 from app.core.db.repository import CacheRepository, IRepository
+from app.core.db.statements import hot_statements
+
+ARCHIVED_COLUMNS = (
+    "id", "email", "username", "password_hash", "is_active", "is_verified", "created_at", "updated_at", "deleted_at"
+)
+
+USERS_IMPORT = staging_table(
+    "users_import",
+    Column("line", Integer),
+    Column("email", String),
+    Column("username", String),
+    Column("password_hash", String),
+    Column("is_verified", Boolean),
+)
+
+
+_AUTHORIZATION = select(User, UserEffectivePermissions).join(
+    UserEffectivePermissions, UserEffectivePermissions.user_id == User.id
+).where(User.deleted_at.is_(None)).execution_options(populate_existing=True)
+
+GET_BY_EMAIL = hot_statements.register(
+    "user.get_by_email", User.select_not_deleted().where(User.email == bindparam("email"))
+)
+GET_BY_USERNAME = hot_statements.register(
+    "user.get_by_username", User.select_not_deleted().where(User.username == bindparam("username"))
+)
+GET_BY_ID = hot_statements.register(
+    "user.get_by_id", User.select_not_deleted().where(User.id == bindparam("user_id"))
+)
+GET_AUTHORIZATION_BY_EMAIL = hot_statements.register(
+    "user.get_authorization_by_email", _AUTHORIZATION.where(User.email == bindparam("email"))
+)
+GET_AUTHORIZATION_BY_USERNAME = hot_statements.register(
+    "user.get_authorization_by_username", _AUTHORIZATION.where(User.username == bindparam("username"))
+)
+GET_AUTHORIZATION_BY_ID = hot_statements.register(
+    "user.get_authorization_by_id", _AUTHORIZATION.where(User.id == bindparam("user_id"))
+)
 
 
 @dataclass
@@ -15,31 +60,15 @@ class UserRepository(IRepository[User, UserFilter], CacheRepository):
     _LIST_VERSION_KEY = "user:list"
 
     async def get_by_email(self, email: str) -> (User | None):
-        result = await self.session.execute(User.select_not_deleted().where(User.email == email))
-        return result.scalar()
-
-    async def get_with_roles_by_email(self, email: str) -> (User | None):
-        result = await self.session.execute(
-            User.select_not_deleted().options(
-                selectinload(User.permissions), selectinload(User.roles).selectinload(Role.permissions)
-            ).where(User.email == email)
-        )
+        result = await self.session.execute(GET_BY_EMAIL, {"email": email})
         return result.scalar()
 
     async def get_by_username(self, username: str) -> (User | None):
-        result = await self.session.execute(User.select_not_deleted().where(User.username == username))
-        return result.scalar()
-
-    async def get_with_roles_by_username(self, username: str) -> (User | None):
-        result = await self.session.execute(
-            User.select_not_deleted().options(
-                selectinload(User.permissions), selectinload(User.roles).selectinload(Role.permissions)
-            ).where(User.username == username)
-        )
+        result = await self.session.execute(GET_BY_USERNAME, {"username": username})
         return result.scalar()
 
     async def get_by_id(self, user_id: int) -> (User | None):
-        result = await self.session.execute(User.select_not_deleted().where(User.id == user_id))
+        result = await self.session.execute(GET_BY_ID, {"user_id": user_id})
         return result.scalars().first()
 
     async def get_user_with_roles_by_id(self, user_id: int) -> User | None:
@@ -54,6 +83,89 @@ class UserRepository(IRepository[User, UserFilter], CacheRepository):
         results = await self.session.execute(query)
         return results.scalar()
 
+    async def get_authorization_by_email(self, email: str) -> tuple[User, UserEffectivePermissions] | None:
+        return await self._get_authorization(GET_AUTHORIZATION_BY_EMAIL, {"email": email})
+
+    async def get_authorization_by_username(self, username: str) -> tuple[User, UserEffectivePermissions] | None:
+        return await self._get_authorization(GET_AUTHORIZATION_BY_USERNAME, {"username": username})
+
+    async def get_authorization_by_id(self, user_id: int) -> tuple[User, UserEffectivePermissions] | None:
+        return await self._get_authorization(GET_AUTHORIZATION_BY_ID, {"user_id": user_id})
+
+    async def _get_authorization(
+        self, statement: Select[User, UserEffectivePermissions], params: dict[str, Any]
+    ) -> tuple[User, UserEffectivePermissions] | None:
+        result = await self.session.execute(statement, params)
+        row = result.first()
+        return None if row is None else (row[0], row[1])
+
+    async def get_existing_ids(self, user_ids: Iterable[int]) -> set[int]:
+        query = select(User.id).where(any_of(User.id, user_ids), User.deleted_at.is_(None))
+        result = await self.session.execute(query)
+        return set(result.scalars())
+
+    async def add_roles(self, user_ids: Iterable[int], role_ids: Iterable[int]) -> set[int]:
+        rows = select(User.id, Role.id).join(Role, any_of(Role.id, role_ids)).where(
+            any_of(User.id, user_ids), User.deleted_at.is_(None)
+        )
+        stmt = insert(UserRoles).from_select(["user_id", "role_id"], rows).on_conflict_do_nothing()
+        result = await self.session.execute(stmt.returning(UserRoles.user_id))
+        return set(result.scalars())
+
+    async def remove_roles(self, user_ids: Iterable[int], role_ids: Iterable[int]) -> set[int]:
+        stmt = delete(UserRoles).where(any_of(UserRoles.user_id, user_ids), any_of(UserRoles.role_id, role_ids))
+        result = await self.session.execute(stmt.returning(UserRoles.user_id))
+        return set(result.scalars())
+
+    async def add_permissions(self, user_ids: Iterable[int], permission_ids: Iterable[int]) -> set[int]:
+        rows = select(User.id, Permission.id).join(Permission, any_of(Permission.id, permission_ids)).where(
+            any_of(User.id, user_ids), User.deleted_at.is_(None)
+        )
+        stmt = insert(UserPermissions).from_select(["user_id", "permission_id"], rows).on_conflict_do_nothing()
+        result = await self.session.execute(stmt.returning(UserPermissions.user_id))
+        return set(result.scalars())
+
+    async def remove_permissions(self, user_ids: Iterable[int], permission_ids: Iterable[int]) -> set[int]:
+        stmt = delete(UserPermissions).where(
+            any_of(UserPermissions.user_id, user_ids), any_of(UserPermissions.permission_id, permission_ids)
+        )
+        result = await self.session.execute(stmt.returning(UserPermissions.user_id))
+        return set(result.scalars())
+
+    async def get_taken_emails(self, emails: Iterable[str]) -> set[str]:
+        result = await self.session.execute(
+            select(User.email).where(any_of(User.email, emails), User.deleted_at.is_(None))
+        )
+        return set(result.scalars())
+
+    async def stage_import(self, records: Iterable[tuple[int, str, str, str | None, bool]]) -> int:
+        await create_staging_table(self.session, USERS_IMPORT)
+        return await copy_records(self.session, USERS_IMPORT, records)
+
+    async def merge_import(self) -> list[tuple[int, str, str, bool]]:
+        staged = USERS_IMPORT.c
+        rows = select(
+            staged.email, staged.username, staged.password_hash, staged.is_verified, true()
+        ).order_by(staged.line)
+        stmt = insert(User).from_select(
+            ["email", "username", "password_hash", "is_verified", "is_active"], rows
+        ).on_conflict_do_nothing()
+        result = await self.session.execute(stmt.returning(User.id, User.email, User.username, User.is_verified))
+        created = [(row.id, row.email, row.username, row.is_verified) for row in result]
+        await drop_staging_table(self.session, USERS_IMPORT)
+        return created
+
+    async def archive_deleted(self, deleted_before: datetime, limit: int) -> int:
+        table = cast(Table, User.__table__)
+        users = table.c
+        batch = select(users.id).where(users.deleted_at < deleted_before).order_by(users.deleted_at).limit(limit)
+        moved = delete(table).where(
+            users.id.in_(batch.with_for_update(skip_locked=True).scalar_subquery())
+        ).returning(*(users[name] for name in ARCHIVED_COLUMNS)).cte("moved")
+        stmt = insert(UserArchive).from_select(ARCHIVED_COLUMNS, select(*moved.c)).returning(UserArchive.id)
+        result = await self.session.execute(stmt)
+        return len(result.all())
+
     async def create(self, user: User) -> None:
         self.session.add(user)
 
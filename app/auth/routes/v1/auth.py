@@ -56,7 +56,7 @@ router = APIRouter(route_class=DishkaRoute)
     responses={
         400: create_response(WrongLoginDataError(username="aboba"))
     },
-    dependencies=[Depends(ConfigurableRateLimiter(times=4, seconds=5*60))]
+    dependencies=[Depends(ConfigurableRateLimiter("auth.login"))]
 )
 async def login(
     mediator: FromDishka[BaseMediator],
@@ -87,7 +87,7 @@ async def login(
         400: create_response([InvalidTokenError(), ExpiredTokenError()]),
         404: create_response(NotFoundOrInactiveSessionError())
     },
-    dependencies=[Depends(ConfigurableRateLimiter(times=4, seconds=5*60))]
+    dependencies=[Depends(ConfigurableRateLimiter("auth.refresh"))]
 )
 async def refresh(
     mediator: FromDishka[BaseMediator],
@@ -134,7 +134,7 @@ async def logout(
     responses={
         404: create_response(NotFoundUserError(user_by="test@test.com", user_field="email"))
     },
-    dependencies=[Depends(ConfigurableRateLimiter(times=3, seconds=60*60))],
+    dependencies=[Depends(ConfigurableRateLimiter("auth.send_verify_code"))],
 )
 async def send_verify_code(
     mediator: FromDishka[BaseMediator],
@@ -152,7 +152,7 @@ async def send_verify_code(
     responses={
         404: create_response(NotFoundUserError(user_by="test@test.com", user_field="email"))
     },
-    dependencies=[Depends(ConfigurableRateLimiter(times=3, seconds=60*60))]
+    dependencies=[Depends(ConfigurableRateLimiter("auth.send_reset_password_code"))]
 )
 async def send_reset_password_code(
     mediator: FromDishka[BaseMediator],
@@ -172,7 +172,7 @@ async def send_reset_password_code(
         400: create_response(InvalidTokenError()),
         404: create_response(NotFoundUserError(user_by=1, user_field="id"))
     },
-    dependencies=[Depends(ConfigurableRateLimiter(times=3, seconds=60*60))]
+    dependencies=[Depends(ConfigurableRateLimiter("auth.verify_email"))]
 )
 async def verify_email(
     mediator: FromDishka[BaseMediator],
@@ -190,7 +190,7 @@ async def verify_email(
         400: create_response([InvalidTokenError(), PasswordMismatchError()]),
         404: create_response(NotFoundUserError(user_by=1, user_field="id"))
     },
-    dependencies=[Depends(ConfigurableRateLimiter(times=3, seconds=60*60))]
+    dependencies=[Depends(ConfigurableRateLimiter("auth.reset_password"))]
 )
 async def reset_password(
     mediator: FromDishka[BaseMediator],
@@ -212,7 +212,7 @@ async def reset_password(
     responses={
         400: create_response(NotExistProviderOAuthError(provider="test"))
     },
-    dependencies=[Depends(ConfigurableRateLimiter(times=4, seconds=5*60))]
+    dependencies=[Depends(ConfigurableRateLimiter("auth.oauth_authorize"))]
 )
 async def oauth_authorize(
     mediator: FromDishka[BaseMediator],
@@ -232,7 +232,7 @@ async def oauth_authorize(
     responses={
         400: create_response(NotExistProviderOAuthError(provider="test"))
     },
-    dependencies=[Depends(ConfigurableRateLimiter(times=4, seconds=5*60))]
+    dependencies=[Depends(ConfigurableRateLimiter("auth.oauth_authorize_connect"))]
 )
 async def oauth_authorize_connect(
     mediator: FromDishka[BaseMediator],
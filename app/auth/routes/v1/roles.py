@@ -4,6 +4,8 @@ from dishka.integrations.fastapi import DishkaRoute, FromDishka
 from fastapi import APIRouter, Query, status
 
 from app.auth.commands.roles.add_permissions import AddPermissionRoleCommand
+from app.auth.commands.roles.bulk_add_permissions import BulkAddPermissionRoleCommand
+from app.auth.commands.roles.bulk_delete_permissions import BulkDeletePermissionRoleCommand
 from app.auth.commands.roles.create import CreateRoleCommand
 from app.auth.commands.roles.delete_permissions import DeletePermissionRoleCommand
 from app.auth.deps import AuthCurrentUserJWTData
@@ -13,10 +15,16 @@ from app.auth.exceptions import (
     InvalidRoleNameError,
     NotFoundPermissionsError,
     NotFoundRoleError,
+    NotFoundRolesError,
     ProtectedPermissionError,
 )
 from app.auth.queries.roles.get_list import GetListRolesQuery
-from app.auth.schemas.roles.requests import GetRolesRequest, RoleCreateRequest, RolePermissionRequest
+from app.auth.schemas.roles.requests import (
+    BulkRolePermissionRequest,
+    GetRolesRequest,
+    RoleCreateRequest,
+    RolePermissionRequest,
+)
 from app.core.api.builder import create_response
 from app.core.db.repository import PageResult
 from app.core.mediators.base import BaseMediator
@@ -133,3 +141,56 @@ async def delete_permission_role(
         )
     )
 
+
+@router.post(
+    "/permissions/bulk",
+    summary="Adding permissions to many roles",
+    description="Adding permissions to many roles with a single set-based insert",
+    response_model=None,
+    status_code=status.HTTP_200_OK,
+    responses={
+        403: create_response(AccessDeniedError(need_permissions={"string" })),
+        404: create_response([
+            NotFoundRolesError(missing={"string"}), NotFoundPermissionsError(missing={"string"})
+        ])
+    }
+)
+async def bulk_add_permission_roles(
+    role_request: BulkRolePermissionRequest,
+    mediator: FromDishka[BaseMediator],
+    user_jwt_data: AuthCurrentUserJWTData
+) -> None:
+    await mediator.handle_command(
+        BulkAddPermissionRoleCommand(
+            role_names=role_request.role_names,
+            permissions=role_request.permissions,
+            user_jwt_data=user_jwt_data
+        )
+    )
+
+
+@router.delete(
+    "/permissions/bulk",
+    summary="Removing permissions from many roles",
+    description="Removing permissions from many roles with a single set-based delete",
+    response_model=None,
+    status_code=status.HTTP_200_OK,
+    responses={
+        403: create_response(AccessDeniedError(need_permissions={"string" })),
+        404: create_response([
+            NotFoundRolesError(missing={"string"}), NotFoundPermissionsError(missing={"string"})
+        ])
+    }
+)
+async def bulk_delete_permission_roles(
+    role_request: BulkRolePermissionRequest,
+    mediator: FromDishka[BaseMediator],
+    user_jwt_data: AuthCurrentUserJWTData
+) -> None:
+    await mediator.handle_command(
+        BulkDeletePermissionRoleCommand(
+            role_names=role_request.role_names,
+            permissions=role_request.permissions,
+            user_jwt_data=user_jwt_data
+        )
+    )
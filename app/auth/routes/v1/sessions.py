@@ -2,15 +2,20 @@ from typing import Annotated
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
 from fastapi import APIRouter, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.auth.commands.sessions.deactivate_session import UserDeactivateSessionCommand
 from app.auth.deps import AuthCurrentUserJWTData
 from app.auth.dtos.sessions import SessionDTO
 from app.auth.exceptions import NotFoundOrInactiveSessionError
+from app.auth.queries.sessions.export import ExportSessionsQuery
 from app.auth.queries.sessions.get_list import GetListSessionQuery
-from app.auth.schemas.sessions.requests import GetSessionsRequest
+from app.auth.schemas.sessions.requests import ExportSessionsRequest, GetSessionsRequest
 from app.core.api.builder import create_response
+from app.core.api.export import ExportLimiter, export_response
+from app.core.configs.app import app_config
 from app.core.db.repository import PageResult
+from app.core.exceptions import ServiceOverloadedError
 from app.core.mediators.base import BaseMediator
 from app.core.services.auth.exceptions import AccessDeniedError
 
@@ -18,6 +23,39 @@ router = APIRouter(route_class=DishkaRoute)
 
 
 
+@router.get(
+    "/export",
+    summary="Export sessions",
+    description="Stream every session matching the filter as NDJSON or CSV",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        403: create_response(AccessDeniedError(need_permissions={"string" })),
+        503: create_response(ServiceOverloadedError(retry_after=app_config.EXPORT_RETRY_AFTER)),
+    }
+)
+async def export_sessions(
+    user_jwt_data: AuthCurrentUserJWTData,
+    mediator: FromDishka[BaseMediator],
+    export_limiter: FromDishka[ExportLimiter],
+    params: Annotated[ExportSessionsRequest, Query()],
+) -> StreamingResponse:
+    batches = await mediator.handle_query(
+        ExportSessionsQuery(
+            session_filter=params.to_session_filter(),
+            user_jwt_data=user_jwt_data,
+            batch_size=app_config.EXPORT_BATCH_SIZE
+        )
+    )
+    return export_response(
+        batches,
+        export_format=params.format,
+        columns=tuple(SessionDTO.model_fields),
+        filename="sessions",
+        limiter=export_limiter,
+    )
+
+
 @router.delete(
     "/{session_id}",
     summary="Log out of session",
@@ -3,30 +3,48 @@ from typing import Annotated
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.auth.commands.permissions.add_permission_user import AddPermissionToUserCommand
+from app.auth.commands.permissions.bulk_add_permission_users import BulkAddPermissionToUsersCommand
+from app.auth.commands.permissions.bulk_remove_permission_users import BulkDeletePermissionToUsersCommand
 from app.auth.commands.permissions.remove_permission_user import DeletePermissionToUserCommand
 from app.auth.commands.roles.assign_role_to_user import AssignRoleCommand
+from app.auth.commands.roles.bulk_assign_roles import BulkAssignRoleCommand
+from app.auth.commands.roles.bulk_remove_roles import BulkRemoveRoleCommand
 from app.auth.commands.roles.remove_role_user import RemoveRoleCommand
 from app.auth.commands.users.register import RegisterCommand
 from app.auth.deps import ActiveUserModel, AuthCurrentUserJWTData
 from app.auth.dtos.sessions import SessionDTO
-from app.auth.dtos.user import UserDTO
+from app.auth.dtos.user import UserDTO, UserFieldsDTO
 from app.auth.exceptions import (
     DuplicateUserError,
     NotFoundPermissionsError,
     NotFoundRoleError,
+    NotFoundRolesError,
     NotFoundUserError,
+    NotFoundUsersError,
     PasswordMismatchError,
 )
 from app.auth.queries.sessions.get_list_by_user import GetListSessionsUserQuery
+from app.auth.queries.users.export import ExportUsersQuery
 from app.auth.queries.users.get_list import GetListUserQuery
 from app.auth.schemas.roles.requests import RoleAssignRequest
-from app.auth.schemas.users.requests import GetUsersRequest, UserCreateRequest, UserPermissionRequest
+from app.auth.schemas.users.requests import (
+    BulkUserPermissionsRequest,
+    BulkUserRolesRequest,
+    ExportUsersRequest,
+    GetUsersRequest,
+    UserCreateRequest,
+    UserPermissionRequest,
+)
 from app.auth.schemas.users.responses import UserResponse
 from app.core.api.builder import create_response
+from app.core.api.export import ExportLimiter, export_response
 from app.core.api.rate_limiter import ConfigurableRateLimiter
+from app.core.configs.app import app_config
 from app.core.db.repository import PageResult
+from app.core.exceptions import ServiceOverloadedError
 from app.core.mediators.base import BaseMediator
 from app.core.services.auth.exceptions import AccessDeniedError, InvalidTokenError
 
@@ -42,7 +60,7 @@ router = APIRouter(route_class=DishkaRoute)
         400: create_response(PasswordMismatchError()),
         409: create_response(DuplicateUserError(field="string", value="string"))
     },
-    dependencies=[Depends(ConfigurableRateLimiter(times=4, seconds=5*60))]
+    dependencies=[Depends(ConfigurableRateLimiter("users.register"))]
 )
 async def register_user(
     mediator: FromDishka[BaseMediator],
@@ -194,12 +212,117 @@ async def delete_permissions_to_user(
         )
     )
 
+@router.post(
+    "/roles/bulk",
+    summary="Adding roles to many users",
+    description="Adding roles to many users with a single set-based insert",
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: create_response(InvalidTokenError()),
+        403: create_response(AccessDeniedError(need_permissions={"string" })),
+        404: create_response(
+            [NotFoundRolesError(missing={"admin"}), NotFoundUsersError(missing={1})]
+        )
+    }
+)
+async def bulk_assign_roles(
+    roles_request: BulkUserRolesRequest,
+    mediator: FromDishka[BaseMediator],
+    user_jwt_data: AuthCurrentUserJWTData
+) -> None:
+    await mediator.handle_command(
+        BulkAssignRoleCommand(
+            user_ids=roles_request.user_ids,
+            role_names=roles_request.role_names,
+            user_jwt_data=user_jwt_data
+        )
+    )
+
+@router.delete(
+    "/roles/bulk",
+    summary="Removing roles from many users",
+    description="Removing roles from many users with a single set-based delete",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        400: create_response(InvalidTokenError()),
+        403: create_response(AccessDeniedError(need_permissions={"string" })),
+        404: create_response(
+            [NotFoundRolesError(missing={"admin"}), NotFoundUsersError(missing={1})]
+        )
+    }
+)
+async def bulk_remove_roles(
+    roles_request: BulkUserRolesRequest,
+    mediator: FromDishka[BaseMediator],
+    user_jwt_data: AuthCurrentUserJWTData
+) -> None:
+    await mediator.handle_command(
+        BulkRemoveRoleCommand(
+            user_ids=roles_request.user_ids,
+            role_names=roles_request.role_names,
+            user_jwt_data=user_jwt_data
+        )
+    )
+
+@router.post(
+    "/permissions/bulk",
+    summary="Adding permissions to many users",
+    description="Adding permissions to many users with a single set-based insert",
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: create_response(InvalidTokenError()),
+        403: create_response(AccessDeniedError(need_permissions={"string" })),
+        404: create_response(
+            [NotFoundPermissionsError(missing={"string" }), NotFoundUsersError(missing={1})]
+        )
+    }
+)
+async def bulk_add_permissions_to_users(
+    permissions_request: BulkUserPermissionsRequest,
+    mediator: FromDishka[BaseMediator],
+    user_jwt_data: AuthCurrentUserJWTData
+) -> None:
+    await mediator.handle_command(
+        BulkAddPermissionToUsersCommand(
+            user_ids=permissions_request.user_ids,
+            permissions=permissions_request.permissions,
+            user_jwt_data=user_jwt_data
+        )
+    )
+
+@router.delete(
+    "/permissions/bulk",
+    summary="Removing permissions from many users",
+    description="Removing permissions from many users with a single set-based delete",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        400: create_response(InvalidTokenError()),
+        403: create_response(AccessDeniedError(need_permissions={"string" })),
+        404: create_response(
+            [NotFoundPermissionsError(missing={"string" }), NotFoundUsersError(missing={1})]
+        )
+    }
+)
+async def bulk_delete_permissions_to_users(
+    permissions_request: BulkUserPermissionsRequest,
+    mediator: FromDishka[BaseMediator],
+    user_jwt_data: AuthCurrentUserJWTData
+) -> None:
+    await mediator.handle_command(
+        BulkDeletePermissionToUsersCommand(
+            user_ids=permissions_request.user_ids,
+            permissions=permissions_request.permissions,
+            user_jwt_data=user_jwt_data
+        )
+    )
+
 
 @router.get(
     "/",
     summary="Get a list of users",
-    description="Get a list of users",
+    description="Get a list of users. Use `fields` to return only the listed attributes",
     status_code=status.HTTP_200_OK,
+    response_model_exclude_unset=True,
     responses={
         400: create_response(InvalidTokenError()),
         403: create_response(AccessDeniedError(need_permissions={"string" })),
@@ -209,8 +332,8 @@ async def get_list_user(
     user_jwt_data: AuthCurrentUserJWTData,
     mediator: FromDishka[BaseMediator],
     params: Annotated[GetUsersRequest, Query()],
-) -> PageResult[UserDTO]:
-    list_user: PageResult[UserDTO] = await mediator.handle_query(
+) -> PageResult[UserDTO] | PageResult[UserFieldsDTO]:
+    list_user: PageResult[UserDTO] | PageResult[UserFieldsDTO] = await mediator.handle_query(
         GetListUserQuery(
             user_jwt_data=user_jwt_data,
             user_filter=params.to_user_filter()
@@ -219,6 +342,41 @@ async def get_list_user(
     return list_user
 
 
+@router.get(
+    "/export",
+    summary="Export users",
+    description="Stream every user matching the filter as NDJSON or CSV",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        400: create_response(InvalidTokenError()),
+        403: create_response(AccessDeniedError(need_permissions={"string" })),
+        503: create_response(ServiceOverloadedError(retry_after=app_config.EXPORT_RETRY_AFTER)),
+    }
+)
+async def export_users(
+    user_jwt_data: AuthCurrentUserJWTData,
+    mediator: FromDishka[BaseMediator],
+    export_limiter: FromDishka[ExportLimiter],
+    params: Annotated[ExportUsersRequest, Query()],
+) -> StreamingResponse:
+    user_filter = params.to_user_filter()
+    batches = await mediator.handle_query(
+        ExportUsersQuery(
+            user_jwt_data=user_jwt_data,
+            user_filter=user_filter,
+            batch_size=app_config.EXPORT_BATCH_SIZE
+        )
+    )
+    return export_response(
+        batches,
+        export_format=params.format,
+        columns=user_filter.fields or tuple(UserDTO.model_fields),
+        filename="users",
+        limiter=export_limiter,
+    )
+
+
 @router.get(
     "/sessions",
     summary="Get active user sessions",
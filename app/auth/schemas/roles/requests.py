@@ -24,6 +24,11 @@ class RolePermissionRequest(BaseModel):
     permission: set[str] = Field(default_factory=set)
 
 
+class BulkRolePermissionRequest(BaseModel):
+    role_names: set[str] = Field(min_length=1)
+    permissions: set[str] = Field(min_length=1)
+
+
 class GetRolesRequest(BaseModel):
     name: str | None = None
     security_level: int | None = None
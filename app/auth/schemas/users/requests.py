@@ -1,14 +1,17 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
-from app.auth.dtos.user import BaseUser
+from app.auth.dtos.user import BaseUser, UserFieldsDTO
 from app.auth.filters.users import UserFilter
 from app.auth.schemas.base import PasswordMixinSchema
+from app.core.api.export import ExportFormat
 from app.core.api.filter_mapper import FilterMapper
 from app.core.filters.pagination import Pagination
 from app.core.filters.sort import SortDirection
 
+BULK_MAX_USERS = 10_000
+
 
 class UserCreateRequest(BaseUser, PasswordMixinSchema):
     ...
@@ -17,7 +20,17 @@ class UserPermissionRequest(BaseModel):
     permissions: set[str] = Field(default_factory=set)
 
 
-class GetUsersRequest(BaseModel):
+class BulkUserRolesRequest(BaseModel):
+    user_ids: set[int] = Field(min_length=1, max_length=BULK_MAX_USERS)
+    role_names: set[str] = Field(min_length=1)
+
+
+class BulkUserPermissionsRequest(BaseModel):
+    user_ids: set[int] = Field(min_length=1, max_length=BULK_MAX_USERS)
+    permissions: set[str] = Field(min_length=1)
+
+
+class UserFilterRequest(BaseModel):
     email: str | None = None
     username: str | None = None
     is_active: bool | None = None
@@ -31,14 +44,24 @@ class GetUsersRequest(BaseModel):
     has_sessions: bool | None = None
     role_names: list[str] | None = None
     permission_names: list[str] | None = None
-
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
+    search: str | None = Field(default=None, min_length=1, examples=["john example.com"])
 
     sort: str | None = Field(default=None, examples=["created_at:desc,username:asc"])
+    fields: str | None = Field(default=None, examples=["id,username,email"])
 
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, value: str | None) -> str | None:
+        fields = FilterMapper.parse_fields_string(value)
+        if fields is None:
+            return None
 
-    def to_user_filter(self) -> UserFilter:
+        unknown = set(fields) - UserFieldsDTO.model_fields.keys()
+        if not fields or unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}" if unknown else "Fields must not be empty")
+        return ",".join(fields)
+
+    def build_user_filter(self, default_sort: str, direction: SortDirection) -> UserFilter:
         user_filter = UserFilter(
             email=self.email,
             username=self.username,
@@ -52,17 +75,36 @@ class GetUsersRequest(BaseModel):
             has_oauth_accounts=self.has_oauth_accounts,
             has_sessions=self.has_sessions,
             role_names=self.role_names,
-            permission_names=self.permission_names
+            permission_names=self.permission_names,
+            search=self.search
         )
 
-        pagination = Pagination(page=self.page, page_size=self.page_size)
-        user_filter.set_pagination(pagination)
+        user_filter.set_fields(FilterMapper.parse_fields_string(self.fields))
 
         sort_fields = FilterMapper.parse_sort_string(self.sort)
         for sort_field in sort_fields:
             user_filter.add_sort(sort_field.field, sort_field.direction)
 
-        if not sort_fields:
-            user_filter.add_sort("created_at", SortDirection.DESC)
+        if not sort_fields and self.search is None:
+            user_filter.add_sort(default_sort, direction)
+
+        return user_filter
+
+
+class GetUsersRequest(UserFilterRequest):
+    page: int = Field(1, ge=1)
+    page_size: int = Field(20, ge=1, le=100)
+
+    def to_user_filter(self) -> UserFilter:
+        user_filter = self.build_user_filter("created_at", SortDirection.DESC)
 
+        pagination = Pagination(page=self.page, page_size=self.page_size)
+        user_filter.set_pagination(pagination)
         return user_filter
+
+
+class ExportUsersRequest(UserFilterRequest):
+    format: ExportFormat = ExportFormat.NDJSON
+
+    def to_user_filter(self) -> UserFilter:
+        return self.build_user_filter("id", SortDirection.ASC)
@@ -0,0 +1,100 @@
+import asyncio
+import csv
+import itertools
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Executor
+from enum import StrEnum
+from functools import cache
+from typing import Any, TextIO
+
+import orjson
+from passlib.context import CryptContext
+from pydantic import Field, ValidationError, field_validator
+
+from app.auth.dtos.user import BaseUser, ImportInvalidRowDTO
+from app.auth.schemas.base import PasswordMixinSchema
+
+
+class ImportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ImportUserRow(BaseUser):
+    password: str | None = Field(default=None, min_length=8, max_length=128)
+    is_verified: bool = False
+
+    @field_validator("password")
+    @classmethod
+    def validate_password(cls, value: str | None) -> str | None:
+        if value is None:
+            return None
+        return PasswordMixinSchema.validate_password(value)
+
+
+def read_rows(source: TextIO, import_format: ImportFormat) -> Iterator[tuple[int, dict[str, Any] | None]]:
+    if import_format == ImportFormat.CSV:
+        reader = csv.DictReader(source)
+        for row in reader:
+            yield reader.line_num, {key: value for key, value in row.items() if value != ""}
+        return
+
+    for line, raw in enumerate(source, start=1):
+        if not raw.strip():
+            continue
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            data = None
+        yield line, data if isinstance(data, dict) else None
+
+
+def validate_rows(
+    batch: Sequence[tuple[int, dict[str, Any] | None]],
+) -> tuple[list[tuple[int, ImportUserRow]], list[ImportInvalidRowDTO]]:
+    rows: list[tuple[int, ImportUserRow]] = []
+    invalid: list[ImportInvalidRowDTO] = []
+    for line, data in batch:
+        if data is None:
+            invalid.append(ImportInvalidRowDTO(line=line, errors=["Malformed row"]))
+            continue
+        try:
+            rows.append((line, ImportUserRow.model_validate(data)))
+        except ValidationError as exc:
+            invalid.append(ImportInvalidRowDTO(
+                line=line,
+                errors=[f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in exc.errors()],
+            ))
+    return rows, invalid
+
+
+@cache
+def _crypt_context(schemes: tuple[str, ...]) -> CryptContext:
+    return CryptContext(schemes=list(schemes), deprecated="auto")
+
+
+def hash_passwords(schemes: tuple[str, ...], passwords: Sequence[str]) -> list[str]:
+    context = _crypt_context(schemes)
+    return [context.hash(password) for password in passwords]
+
+
+async def hash_passwords_in_pool(
+    pool: Executor,
+    schemes: tuple[str, ...],
+    passwords: Sequence[str | None],
+    chunks: int,
+) -> list[str | None]:
+    indexes = [idx for idx, password in enumerate(passwords) if password is not None]
+    plain = [password for password in passwords if password is not None]
+    size = max(1, -(-len(plain) // max(chunks, 1)))
+
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*(
+        loop.run_in_executor(pool, hash_passwords, schemes, plain[start:start + size])
+        for start in range(0, len(plain), size)
+    ))
+
+    hashes: list[str | None] = [None] * len(passwords)
+    for idx, password_hash in zip(indexes, itertools.chain.from_iterable(results), strict=True):
+        hashes[idx] = password_hash
+    return hashes
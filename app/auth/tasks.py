@@ -1,6 +1,24 @@
+from dataclasses import dataclass
+
+from dishka import FromDishka
+from dishka.integrations.taskiq import inject
 from taskiq import AsyncBroker
 
+from app.auth.commands.users.archive_deleted import ArchiveDeletedUsersCommand
+from app.auth.config import auth_config
+from app.core.mediators.base import BaseMediator
 from app.core.services.mail.aiosmtplib.task import SendEmail
+from app.core.services.queues.task import BaseTask
+
+
+@dataclass
+class ArchiveDeletedUsers(BaseTask):
+    __task_name__ = "auth.users.archive_deleted"
+
+    @staticmethod
+    @inject
+    async def run(mediator: FromDishka[BaseMediator]) -> None:
+        await mediator.handle_command(ArchiveDeletedUsersCommand())
 
 
 def register_auth_tasks(broker: AsyncBroker) -> None:
@@ -10,3 +28,8 @@ def register_auth_tasks(broker: AsyncBroker) -> None:
         task_name=SendEmail.get_name()
     )
 
+    broker.register_task(
+        ArchiveDeletedUsers.run,
+        task_name=ArchiveDeletedUsers.get_name(),
+        schedule=[{"cron": auth_config.USER_ARCHIVE_CRON}],
+    )
@@ -14,6 +14,8 @@ from app.core.configs.app import app_config
 from app.core.di.container import create_container
 from app.core.log.init import configure_logging
 from app.core.message_brokers.base import BaseMessageBroker
+from app.core.message_brokers.lag import ConsumerLagReporter
+from app.core.message_brokers.metrics import CONSUMER_LAG
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +26,12 @@ async def lifespan(context: ContextRepo) -> AsyncGenerator[None]:
     container = context.get("container__")
     message_broker = await container.get(BaseMessageBroker)
     await message_broker.start()
+    lag_reporter: ConsumerLagReporter = context.get("lag_reporter__")
+    lag_reporter.start()
 
     yield
 
+    await lag_reporter.close()
     await message_broker.close()
 
 
@@ -36,6 +41,7 @@ def setup_router(broker: KafkaBroker) -> None:
 def init_app() -> AsgiFastStream:
     configure_logging()
     registry = CollectorRegistry()
+    registry.register(CONSUMER_LAG)
     log = structlog.get_logger("main")
     broker = KafkaBroker(
         app_config.BROKER_URL,
@@ -57,6 +63,9 @@ def init_app() -> AsgiFastStream:
     setup_router(broker)
     container = create_container(FastStreamProvider())
     app.context.set_global("container__", container)
+    app.context.set_global(
+        "lag_reporter__", ConsumerLagReporter(broker=broker, interval=app_config.BROKER_CONSUMER_LAG_INTERVAL)
+    )
 
     setup_dishka(container=container, broker=broker, auto_inject=True)
 
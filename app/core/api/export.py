@@ -0,0 +1,113 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.core.db.query_budget import untracked_queries
+from app.core.exceptions import ServiceOverloadedError
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+@dataclass(eq=False)
+class ExportLimiter:
+    max_concurrent: int = 2
+    retry_after: int = 5
+    active: int = field(default=0, init=False)
+
+    def acquire(self) -> ExportSlot:
+        if self.active >= self.max_concurrent:
+            raise ServiceOverloadedError(retry_after=self.retry_after)
+
+        self.active += 1
+        return ExportSlot(limiter=self)
+
+
+@dataclass(eq=False)
+class ExportSlot:
+    limiter: ExportLimiter
+    released: bool = False
+
+    def release(self) -> None:
+        if not self.released:
+            self.released = True
+            self.limiter.active -= 1
+
+
+class ExportStreamingResponse(StreamingResponse):
+    def __init__(self, content: AsyncIterator[bytes], slot: ExportSlot, **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self.slot = slot
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            with untracked_queries():
+                await super().__call__(scope, receive, send)
+        finally:
+            self.slot.release()
+
+
+def encode_ndjson(items: Sequence[BaseModel]) -> bytes:
+    return b"".join(orjson.dumps(item.model_dump(mode="json", exclude_unset=True)) + b"\n" for item in items)
+
+
+def encode_csv(items: Sequence[BaseModel], columns: Sequence[str], header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+
+    for item in items:
+        data = item.model_dump(mode="json", include=set(columns))
+        writer.writerow(
+            orjson.dumps(value).decode() if isinstance(value, list | dict) else value
+            for value in (data.get(column) for column in columns)
+        )
+    return buffer.getvalue().encode()
+
+
+async def encode_export(
+    batches: AsyncIterator[Sequence[BaseModel]],
+    export_format: ExportFormat,
+    columns: Sequence[str],
+) -> AsyncIterator[bytes]:
+    if export_format == ExportFormat.CSV:
+        yield encode_csv((), columns, header=True)
+
+    async for items in batches:
+        if export_format == ExportFormat.CSV:
+            yield encode_csv(items, columns)
+        else:
+            yield encode_ndjson(items)
+
+
+def export_response(
+    batches: AsyncIterator[Sequence[BaseModel]],
+    export_format: ExportFormat,
+    columns: Sequence[str],
+    filename: str,
+    limiter: ExportLimiter,
+) -> ExportStreamingResponse:
+    slot = limiter.acquire()
+    return ExportStreamingResponse(
+        encode_export(batches, export_format, columns),
+        slot=slot,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
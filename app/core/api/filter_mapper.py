@@ -26,3 +26,10 @@ class FilterMapper:
             sort_fields.append(SortField(field=field.strip(), direction=sort_direction))
 
         return sort_fields
+
+    @staticmethod
+    def parse_fields_string(fields_string: str | None) -> list[str] | None:
+        if fields_string is None:
+            return None
+
+        return list(dict.fromkeys(part for part in map(str.strip, fields_string.split(",")) if part))
@@ -1,9 +1,53 @@
-from fastapi import Request
-from fastapi_limiter.depends import RateLimiter
-from starlette.responses import Response
+import math
 
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import Depends, Request
+from fastapi.security import HTTPAuthorizationCredentials
 
-class ConfigurableRateLimiter(RateLimiter):
-    # Можно сделать глабальные настройки для проекта, но пока тут их нет(
-    async def __call__(self, request: Request, response: Response) -> None:
-        await super().__call__(request=request, response=response)
+from app.core.api.utils import get_ip_from_request
+from app.core.configs.app import app_config
+from app.core.exceptions import ApplicationError
+from app.core.services.auth.depends import security
+from app.core.services.auth.jwt_manager import JWTManager
+from app.core.services.rate_limit.base import BaseRateLimiter
+from app.core.services.rate_limit.exceptions import TooManyRequestsError
+
+
+class ConfigurableRateLimiter:
+    def __init__(self, policy: str) -> None:
+        if policy not in app_config.RATE_LIMITS:
+            raise KeyError(f"Unknown rate limit policy: {policy}")
+        self.policy = policy
+
+    @inject
+    async def __call__(
+        self,
+        request: Request,
+        rate_limiter: FromDishka[BaseRateLimiter],
+        jwt_manager: FromDishka[JWTManager],
+        credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    ) -> None:
+        if not app_config.RATE_LIMITER_ENABLED:
+            return
+
+        rule = app_config.RATE_LIMITS[self.policy]
+        identity = self._get_identity(request, jwt_manager, credentials, rule.get("key", "ip"))
+        result = await rate_limiter.hit(self.policy, identity, rule)
+        if not result.allowed:
+            raise TooManyRequestsError(retry_after=max(math.ceil(result.retry_after), 1))
+
+    def _get_identity(
+        self,
+        request: Request,
+        jwt_manager: JWTManager,
+        credentials: HTTPAuthorizationCredentials | None,
+        key: str,
+    ) -> str:
+        if key == "user" and credentials is not None:
+            try:
+                sub = jwt_manager.decode(credentials.credentials).get("sub")
+            except ApplicationError:
+                sub = None
+            if sub:
+                return f"user:{sub}"
+        return f"ip:{get_ip_from_request(request)}"
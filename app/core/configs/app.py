@@ -2,8 +2,11 @@ from typing import Annotated, ClassVar, Literal
 
 from pydantic import BeforeValidator, PostgresDsn, computed_field, model_validator
 from pydantic_core import MultiHostUrl
+from pydantic_settings import NoDecode
 
 from app.core.configs.base import BaseConfig
+from app.core.configs.db_pool import DEFAULT_DB_POOLS, DBPoolRule, merge_db_pools
+from app.core.configs.rate_limit import DEFAULT_RATE_LIMITS, RateLimitRule, merge_rate_limits
 
 
 class AppConfig(BaseConfig):
@@ -29,12 +32,49 @@ class AppConfig(BaseConfig):
     SECRET_KEY: str = ""
     BACKEND_CORS_ORIGINS: ClassVar[Annotated[list[str] | str, BeforeValidator(BaseConfig.parse_list)]] = []
     RATE_LIMITER_ENABLED: bool = True
+    RATE_LIMIT_PREFIX: str = "rate_limit"
+    RATE_LIMIT_LOCAL_PRECHECK: bool = True
+    RATE_LIMIT_LOCAL_MAX_KEYS: int = 10_000
+    REQUEST_TIMING_ENABLED: bool = True
+    SERVER_TIMING_HEADER: bool = True
+    QUERY_BUDGET_ENABLED: bool = True
+    QUERY_BUDGET_DEFAULT: int = 30
+    QUERY_BUDGETS: dict[str, int] = {}
+    QUERY_REPEAT_THRESHOLD: int = 5
+    QUERY_BUDGET_RAISE: bool = False
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.01
+    PROFILING_ROUTE_PATTERN: str | None = None
+    PROFILING_SLOW_THRESHOLD: float = 0.5
+    PROFILING_INTERVAL: float = 0.001
+    PROFILING_MAX_CONCURRENT: int = 1
+    PROFILING_MAX_CAPTURES: int = 50
+    PROFILING_CAPTURE_TTL: int = 24 * 60 * 60
+    LOAD_SHEDDING_ENABLED: bool = True
+    LOAD_SHEDDING_INITIAL_LIMIT: int = 20
+    LOAD_SHEDDING_MIN_LIMIT: int = 5
+    LOAD_SHEDDING_MAX_LIMIT: int = 200
+    LOAD_SHEDDING_LATENCY_TARGET: float = 1.0
+    LOAD_SHEDDING_BACKOFF: float = 0.9
+    LOAD_SHEDDING_RETRY_AFTER: int = 1
+    EXPORT_MAX_CONCURRENT: int = 2
+    EXPORT_BATCH_SIZE: int = 1000
+    EXPORT_RETRY_AFTER: int = 5
+    RATE_LIMITS: Annotated[dict[str, RateLimitRule], BeforeValidator(merge_rate_limits)] = DEFAULT_RATE_LIMITS
 
     POSTGRES_SERVER: str = ""
     POSTGRES_PORT: int = 5432
     POSTGRES_USER: str = ""
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    POSTGRES_REPLICA_HOSTS: Annotated[list[str], NoDecode, BeforeValidator(BaseConfig.parse_list)] = []
+    DB_REPLICA_MAX_LAG: float = 5.0
+    DB_REPLICA_CHECK_INTERVAL: float = 5.0
+    DB_READ_YOUR_WRITES_WINDOW: float = 5.0
+    DB_POOL_MODE: Literal["internal", "external"] = "internal"
+    DB_POOL_ROLE: Literal["api", "consumer", "worker"] = "api"
+    DB_POOLS: Annotated[dict[str, DBPoolRule], BeforeValidator(merge_db_pools)] = DEFAULT_DB_POOLS
+    DB_WARM_STATEMENTS: bool = True
     SQL_ECHO: bool = False
 
     @computed_field
@@ -56,6 +96,25 @@ class AppConfig(BaseConfig):
             path=self.POSTGRES_DB,
         ) # type: ignore
 
+    @property
+    def db_pool(self) -> DBPoolRule:
+        return self.DB_POOLS[f"{self.DB_POOL_MODE}.{self.DB_POOL_ROLE}"]
+
+    @property
+    def postgres_replica_urls(self) -> list[str]:
+        urls = []
+        for replica in self.POSTGRES_REPLICA_HOSTS:
+            host, _, port = replica.partition(":")
+            urls.append(str(MultiHostUrl.build(
+                scheme="postgresql+asyncpg",
+                username=self.POSTGRES_USER,
+                password=self.POSTGRES_PASSWORD,
+                host=host,
+                port=int(port) if port else self.POSTGRES_PORT,
+                path=self.POSTGRES_DB,
+            )))
+        return urls
+
     REDIS_HOST: str = ""
     REDIS_PORT: int = 6379
 
@@ -77,6 +136,19 @@ class AppConfig(BaseConfig):
 
     BROKER_URL: str = ""
     GROUP_ID: str = ""
+    BROKER_LINGER_MS: int = 5
+    BROKER_MAX_BATCH_SIZE: int = 64 * 1024
+    BROKER_COMPRESSION_TYPE: Literal["gzip", "snappy", "lz4", "zstd"] | None = None
+    BROKER_CONSUMER_MAX_RECORDS: int = 500
+    BROKER_CONSUMER_FETCH_TIMEOUT_MS: int = 1000
+    BROKER_CONSUMER_QUEUE_SIZE: int = 1000
+    BROKER_CONSUMER_LANES_PER_PARTITION: int = 1
+    BROKER_CONSUMER_MAX_RETRIES: int = 3
+    BROKER_CONSUMER_RETRY_BACKOFF_MS: int = 500
+    BROKER_CONSUMER_DEAD_LETTER_SUFFIX: str = ".dlq"
+    BROKER_CONSUMER_LAG_INTERVAL: float = 15.0
+    EVENTS_REPLAY_BATCH_SIZE: int = 500
+    EVENTS_REPLAY_RATE_LIMIT: int = 0
 
     SMTP_TLS: bool = True
     SMTP_SSL: bool = False
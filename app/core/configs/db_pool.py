@@ -0,0 +1,24 @@
+from typing import Any, NotRequired, TypedDict
+
+
+class DBPoolRule(TypedDict):
+    pool_size: int
+    max_overflow: int
+    pool_timeout: NotRequired[float]
+    pool_recycle: NotRequired[int]
+
+
+DEFAULT_DB_POOLS: dict[str, DBPoolRule] = {
+    "internal.api": {"pool_size": 10, "max_overflow": 15, "pool_timeout": 30, "pool_recycle": 3600},
+    "internal.consumer": {"pool_size": 5, "max_overflow": 5, "pool_timeout": 30, "pool_recycle": 3600},
+    "internal.worker": {"pool_size": 3, "max_overflow": 2, "pool_timeout": 30, "pool_recycle": 3600},
+    "external.api": {"pool_size": 2, "max_overflow": 3, "pool_timeout": 10, "pool_recycle": 300},
+    "external.consumer": {"pool_size": 1, "max_overflow": 1, "pool_timeout": 10, "pool_recycle": 300},
+    "external.worker": {"pool_size": 0, "max_overflow": 0},
+}
+
+
+def merge_db_pools(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {**DEFAULT_DB_POOLS, **value}
+    return value
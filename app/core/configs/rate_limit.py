@@ -0,0 +1,27 @@
+from typing import Any, Literal, NotRequired, TypedDict
+
+
+class RateLimitRule(TypedDict):
+    times: int
+    seconds: int
+    algorithm: NotRequired[Literal["sliding_window", "token_bucket"]]
+    key: NotRequired[Literal["ip", "user"]]
+
+
+DEFAULT_RATE_LIMITS: dict[str, RateLimitRule] = {
+    "auth.login": {"times": 4, "seconds": 5 * 60},
+    "auth.refresh": {"times": 4, "seconds": 5 * 60},
+    "auth.send_verify_code": {"times": 3, "seconds": 60 * 60},
+    "auth.send_reset_password_code": {"times": 3, "seconds": 60 * 60},
+    "auth.verify_email": {"times": 3, "seconds": 60 * 60},
+    "auth.reset_password": {"times": 3, "seconds": 60 * 60},
+    "auth.oauth_authorize": {"times": 4, "seconds": 5 * 60},
+    "auth.oauth_authorize_connect": {"times": 4, "seconds": 5 * 60, "key": "user"},
+    "users.register": {"times": 4, "seconds": 5 * 60},
+}
+
+
+def merge_rate_limits(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {**DEFAULT_RATE_LIMITS, **value}
+    return value
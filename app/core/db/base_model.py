@@ -2,7 +2,7 @@ import copy
 from datetime import datetime
 from typing import Any, Self
 
-from sqlalchemy import DateTime, Select, select
+from sqlalchemy import DateTime, Index, Select, select, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column, reconstructor
 from sqlalchemy.sql import func
 
@@ -59,3 +59,11 @@ class SoftDeleteMixin:
 
     def is_deleted(self) -> bool:
         return self.deleted_at is not None
+
+
+def not_deleted_unique_index(table_name: str, column: str) -> Index:
+    return Index(f"ix_{table_name}_{column}", column, unique=True, postgresql_where=text("deleted_at IS NULL"))
+
+
+def deleted_index(table_name: str) -> Index:
+    return Index(f"ix_{table_name}_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL"))
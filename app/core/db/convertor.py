@@ -1,9 +1,20 @@
+from collections.abc import Callable
 from typing import Any
 
-from sqlalchemy import ColumnElement
-from sqlalchemy.orm import InstrumentedAttribute, joinedload, lazyload, selectinload, subqueryload
+from sqlalchemy import ColumnElement, inspect
+from sqlalchemy.orm import (
+    ColumnProperty,
+    InstrumentedAttribute,
+    Mapper,
+    joinedload,
+    lazyload,
+    load_only,
+    selectinload,
+    subqueryload,
+)
 
 from app.core.db.exceptions import AttributeNotExistError
+from app.core.db.search import search_condition, search_rank
 from app.core.filters.base import BaseFilter
 from app.core.filters.condition import FilterCondition, FilterOperator
 from app.core.filters.loading_strategy import LoadingConfig, LoadingStrategyType, RelationshipLoading
@@ -27,6 +38,13 @@ operators_map = {
     FilterOperator.IS_NOT_NULL: lambda a, v: a.is_not(None),
     FilterOperator.IS_NULL_FROM: lambda a, v: ~a.any(),
     FilterOperator.IS_NOT_NULL_FROM: lambda a, v: a.any(),
+    FilterOperator.SEARCH: search_condition,
+}
+
+search_operators_map: dict[FilterOperator, Callable[[InstrumentedAttribute[Any], Any], ColumnElement[bool]]] = {
+    FilterOperator.CONTAINS: lambda a, v: a.icontains(v, autoescape=True),
+    FilterOperator.STARTS_WITH: lambda a, v: a.istartswith(v, autoescape=True),
+    FilterOperator.ENDS_WITH: lambda a, v: a.iendswith(v, autoescape=True),
 }
 
 strategy_map = {
@@ -54,13 +72,16 @@ class SQLAlchemyFilterConverter:
     @staticmethod
     def condition_to_sqlalchemy(
         model: type,
-        condition: FilterCondition
+        condition: FilterCondition,
+        searchable_fields: frozenset[str] = frozenset()
     ) -> ColumnElement[bool]:
         try:
             attr = SQLAlchemyFilterConverter.get_model_attribute(model, condition.field)
         except AttributeError as err:
             raise AttributeNotExistError(field=condition.field) from err
 
+        if condition.field in searchable_fields and condition.operator in search_operators_map:
+            return search_operators_map[condition.operator](attr, condition.value)
         return operators_map[condition.operator](attr, condition.value)
 
     @staticmethod
@@ -71,8 +92,19 @@ class SQLAlchemyFilterConverter:
         if not filters.has_conditions():
             return []
         return [
-            SQLAlchemyFilterConverter.condition_to_sqlalchemy(model, cond)
+            SQLAlchemyFilterConverter.condition_to_sqlalchemy(model, cond, filters.searchable_fields)
+            for cond in filters.conditions
+        ]
+
+    @staticmethod
+    def get_search_rank_attributes(
+        model: type,
+        filters: BaseFilter
+    ) -> list[Any]:
+        return [
+            search_rank(SQLAlchemyFilterConverter.get_model_attribute(model, cond.field), cond.value).desc()
             for cond in filters.conditions
+            if cond.operator == FilterOperator.SEARCH
         ]
 
     @staticmethod
@@ -92,6 +124,23 @@ class SQLAlchemyFilterConverter:
 
         return sort_clauses
 
+    @staticmethod
+    def get_projection_columns(model: type, fields: tuple[str, ...]) -> list[InstrumentedAttribute]:
+        columns: list[InstrumentedAttribute] = []
+        for name in fields:
+            attr = getattr(model, name, None)
+            if not isinstance(attr, InstrumentedAttribute) or not isinstance(attr.property, ColumnProperty):
+                raise AttributeNotExistError(field=name)
+            columns.append(attr)
+        return columns
+
+    @staticmethod
+    def build_load_only(model: type, fields: tuple[str, ...]) -> Any:
+        columns = SQLAlchemyFilterConverter.get_projection_columns(model, fields)
+        mapper: Mapper[Any] = inspect(model)
+        primary_key = [mapper.get_property_by_column(column).class_attribute for column in mapper.primary_key]
+        return load_only(*dict.fromkeys([*primary_key, *columns]))
+
     @staticmethod
     def apply_loading_strategy(
         model: type,
@@ -0,0 +1,33 @@
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import Column, MetaData, Table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+staging_metadata = MetaData()
+
+
+def staging_table(name: str, *columns: Column[Any]) -> Table:
+    return Table(name, staging_metadata, *columns, prefixes=["TEMPORARY"], postgresql_on_commit="DROP")
+
+
+async def create_staging_table(session: AsyncSession, table: Table) -> None:
+    connection = await session.connection()
+    await connection.run_sync(table.create)
+
+
+async def drop_staging_table(session: AsyncSession, table: Table) -> None:
+    connection = await session.connection()
+    await connection.run_sync(table.drop)
+
+
+async def copy_records(session: AsyncSession, table: Table, records: Iterable[tuple[Any, ...]]) -> int:
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if driver_connection is None:
+        raise RuntimeError("Connection is not established")
+    status = await driver_connection.copy_records_to_table(
+        table.name, records=records, columns=[column.name for column in table.columns]
+    )
+    return int(status.rsplit(" ", 1)[-1])
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import UUID as SAUUID
+from sqlalchemy import UUID as SAUUID, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,3 +14,6 @@ class EventLog(BaseModel, DateMixin):
     payload: Mapped[dict] = mapped_column(JSONB, default={})
     meta_data: Mapped[dict] = mapped_column(JSONB, default={})
 
+    __table_args__ = (
+        Index("ix_events_log_created_at_event_id", "created_at", "event_id"),
+    )
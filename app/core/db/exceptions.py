@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from sqlalchemy.exc import IntegrityError
+
 from app.core.exceptions import ApplicationError
 
 
@@ -18,3 +20,24 @@ class AttributeNotExistError(ApplicationError):
         return {
             "attribute": self.field
         }
+
+
+@dataclass(eq=False, kw_only=True)
+class QueryBudgetExceededError(ApplicationError):
+    count: int
+    budget: int
+    route: str | None = None
+    code: str = "QUERY_BUDGET_EXCEEDED"
+    status: int = 500
+
+    @property
+    def message(self) -> str:
+        return "Query budget exceeded"
+
+    @property
+    def detail(self) -> dict:
+        return {"count": self.count, "budget": self.budget, "route": self.route}
+
+
+def violated_constraint(exc: IntegrityError) -> str | None:
+    return getattr(getattr(exc.orig, "__cause__", None), "constraint_name", None)
@@ -0,0 +1,111 @@
+import time
+from typing import Any
+from uuid import uuid4
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import AsyncAdaptedQueuePool, Engine, NullPool, event, exc
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+from app.core.configs.db_pool import DBPoolRule
+
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool",
+    ["role", "engine"],
+    multiprocess_mode="livesum",
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections opened above pool_size",
+    ["role", "engine"],
+    multiprocess_mode="livesum",
+)
+POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent acquiring a connection from the pool",
+    ["role", "engine"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Pool checkouts that failed with pool_timeout",
+    ["role", "engine"],
+)
+
+
+def unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+EXTERNAL_POOL_CONNECT_ARGS: dict[str, Any] = {
+    "statement_cache_size": 0,
+    "prepared_statement_cache_size": 0,
+    "prepared_statement_name_func": unique_statement_name,
+}
+
+
+class InstrumentedPoolMixin(QueuePool):
+    metric_labels: dict[str, str] = {"role": "unknown", "engine": "unknown"}
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            POOL_TIMEOUTS.labels(**self.metric_labels).inc()
+            raise
+        finally:
+            POOL_WAIT.labels(**self.metric_labels).observe(time.perf_counter() - started)
+            POOL_OVERFLOW.labels(**self.metric_labels).set(max(self.overflow(), 0))
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        POOL_OVERFLOW.labels(**self.metric_labels).set(max(self.overflow(), 0))
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedPoolMixin):
+            pool.metric_labels = self.metric_labels
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(rule: DBPoolRule, external: bool = False) -> dict[str, Any]:
+    options: dict[str, Any] = {}
+    if rule["pool_size"] <= 0:
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=rule["pool_size"],
+            max_overflow=rule["max_overflow"],
+            pool_timeout=rule.get("pool_timeout", 30),
+            pool_recycle=rule.get("pool_recycle", -1),
+            pool_pre_ping=True,
+        )
+
+    if external:
+        options["connect_args"] = dict(EXTERNAL_POOL_CONNECT_ARGS)
+    return options
+
+
+def instrument_pool(engine: Engine, role: str, name: str) -> None:
+    labels = {"role": role, "engine": name}
+    if isinstance(engine.pool, InstrumentedPoolMixin):
+        engine.pool.metric_labels = labels
+    checked_out = POOL_CHECKED_OUT.labels(**labels)
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection: Any, record: ConnectionPoolEntry, proxy: Any) -> None:
+        if record.record_info is not None:
+            record.record_info["checked_out"] = True
+            checked_out.inc()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        # checkin also fires when the first connect attempt fails, before any checkout
+        if record.record_info is not None and record.record_info.pop("checked_out", False):
+            checked_out.dec()
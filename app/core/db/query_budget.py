@@ -0,0 +1,112 @@
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.db.exceptions import QueryBudgetExceededError
+
+
+@dataclass(eq=False)
+class QueryStats:
+    budget: int | None = None
+    raise_on_exceed: bool = False
+    route: str | None = None
+    parent: QueryStats | None = None
+    resolve_budget: Callable[[], tuple[str | None, int | None]] | None = None
+    count: int = 0
+    lazy_loads: Counter[str] = field(default_factory=Counter)
+    statements: Counter[str] = field(default_factory=Counter)
+    exceeded: bool = False
+
+    def record(self, statement: str) -> None:
+        if self.resolve_budget is not None:
+            self.route, self.budget = self.resolve_budget()
+            self.resolve_budget = None
+
+        self.count += 1
+        self.statements[statement] += 1
+        if self.parent is not None:
+            self.parent.record(statement)
+
+        if self.budget is not None and self.count > self.budget and not self.exceeded:
+            self.exceeded = True
+            if self.raise_on_exceed:
+                raise QueryBudgetExceededError(count=self.count, budget=self.budget, route=self.route)
+
+    def record_lazy_load(self, path: str) -> None:
+        self.lazy_loads[path] += 1
+        if self.parent is not None:
+            self.parent.record_lazy_load(path)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+    def report(self, threshold: int = 2) -> str:
+        lines = [f"{self.count} queries"]
+        lines.extend(f"  x{count}: {statement}" for statement, count in self.repeated(threshold))
+        lines.extend(f"  lazy x{count}: {path}" for path, count in self.lazy_loads.items())
+        return "\n".join(lines)
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(
+    budget: int | None = None,
+    raise_on_exceed: bool = False,
+    resolve_budget: Callable[[], tuple[str | None, int | None]] | None = None,
+) -> Iterator[QueryStats]:
+    install_query_counter()
+    stats = QueryStats(
+        budget=budget,
+        raise_on_exceed=raise_on_exceed,
+        parent=query_stats.get(),
+        resolve_budget=resolve_budget,
+    )
+
+    token = query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats.reset(token)
+
+
+@contextmanager
+def untracked_queries() -> Iterator[None]:
+    token = query_stats.set(None)
+    try:
+        yield
+    finally:
+        query_stats.reset(token)
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    stats = query_stats.get()
+    if stats is not None:
+        stats.record(statement)
+
+
+def _do_orm_execute(state: ORMExecuteState) -> None:
+    stats = query_stats.get()
+    if stats is None or state.lazy_loaded_from is None:
+        return
+
+    prop = getattr(state.loader_strategy_path, "prop", None)
+    owner = state.lazy_loaded_from.class_.__name__
+    stats.record_lazy_load(f"{owner}.{prop.key}" if prop is not None else owner)
+
+
+def install_query_counter() -> None:
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    if not event.contains(Session, "do_orm_execute", _do_orm_execute):
+        event.listen(Session, "do_orm_execute", _do_orm_execute)
@@ -1,6 +1,6 @@
 import hashlib
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from dataclasses import dataclass, field
 from typing import Any, ParamSpec, TypeVar
 
@@ -51,42 +51,52 @@ class IRepository[T, F: BaseFilter](ABC):
     session: AsyncSession
 
     async def find_by_filter(self, model: type[T], filters: F) -> PageResult[T]:
-        if issubclass(model, SoftDeleteMixin):
-            stmt = model.select_not_deleted()
-        else:
-            stmt = select(model)
-
-        loading_options = SQLAlchemyFilterConverter.build_loading_options(model, filters.loading_config)
-
-        if loading_options:
-            stmt = stmt.options(*loading_options)
+        stmt = self._apply_conditions(model, self._select_entities(model, filters), filters)
+        total = await self._count(stmt)
 
-        conditions = SQLAlchemyFilterConverter.filter_to_sqlalchemy_conditions(model, filters)
+        result = await self.session.execute(self._paginate(model, stmt, filters))
+        items = result.scalars().all()
 
-        stmt = self.apply_relationship_filters(stmt, filters)
+        return PageResult(
+            items=list(items),
+            total=total,
+            page=filters.pagination.page,
+            page_size=filters.pagination.page_size
+        )
 
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
+    async def find_rows_by_filter(self, model: type[T], filters: F) -> PageResult[dict[str, Any]]:
+        columns = SQLAlchemyFilterConverter.get_projection_columns(model, filters.column_fields)
+        stmt = select(*columns).select_from(model)
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar_one()
+        if issubclass(model, SoftDeleteMixin):
+            stmt = stmt.where(model.deleted_at.is_(None))
 
-        sort_clauses = SQLAlchemyFilterConverter.get_sort_attributes(model, filters.sort_fields)
-        if sort_clauses:
-            stmt = stmt.order_by(*sort_clauses)
+        stmt = self._apply_conditions(model, stmt, filters)
+        total = await self._count(stmt)
 
-        stmt = stmt.offset(filters.pagination.offset).limit(filters.pagination.limit)
-        result = await self.session.execute(stmt)
-        items = result.scalars().all()
+        result = await self.session.execute(self._paginate(model, stmt, filters))
+        items = result.mappings().all()
 
         return PageResult(
-            items=list(items),
+            items=[dict(row) for row in items],
             total=total,
             page=filters.pagination.page,
             page_size=filters.pagination.page_size
         )
 
+    async def stream_by_filter(
+        self, model: type[T], filters: F, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[T]]:
+        stmt = self._apply_conditions(model, self._select_entities(model, filters), filters)
+        stmt = self._sort(model, stmt, filters)
+
+        result = await self.session.stream_scalars(stmt.execution_options(yield_per=batch_size))
+        try:
+            async for items in result.partitions():
+                yield items
+        finally:
+            await result.close()
+
     async def count_by_filter(self, model: type[T], filters: F) -> int:
         if issubclass(model, SoftDeleteMixin):
             stmt = select(func.count()).select_from(model.select_not_deleted().subquery())
@@ -102,6 +112,48 @@ class IRepository[T, F: BaseFilter](ABC):
         result = await self.session.execute(stmt)
         return result.scalar_one()
 
+    def _select_entities(self, model: type[T], filters: F) -> Select:
+        if issubclass(model, SoftDeleteMixin):
+            stmt = model.select_not_deleted()
+        else:
+            stmt = select(model)
+
+        loading_options = SQLAlchemyFilterConverter.build_loading_options(model, filters.loading_config)
+
+        if filters.has_projection():
+            loading_options.append(SQLAlchemyFilterConverter.build_load_only(model, filters.column_fields))
+
+        if loading_options:
+            stmt = stmt.options(*loading_options)
+        return stmt
+
+    def _apply_conditions(self, model: type[T], stmt: Select, filters: F) -> Select:
+        conditions = SQLAlchemyFilterConverter.filter_to_sqlalchemy_conditions(model, filters)
+
+        stmt = self.apply_relationship_filters(stmt, filters)
+
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        return stmt
+
+    async def _count(self, stmt: Select) -> int:
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        total_result = await self.session.execute(count_stmt)
+        return total_result.scalar_one()
+
+    def _sort(self, model: type[T], stmt: Select, filters: F) -> Select:
+        sort_clauses = (
+            SQLAlchemyFilterConverter.get_sort_attributes(model, filters.sort_fields)
+            or SQLAlchemyFilterConverter.get_search_rank_attributes(model, filters)
+        )
+        if sort_clauses:
+            stmt = stmt.order_by(*sort_clauses)
+        return stmt
+
+    def _paginate(self, model: type[T], stmt: Select, filters: F) -> Select:
+        stmt = self._sort(model, stmt, filters)
+        return stmt.offset(filters.pagination.offset).limit(filters.pagination.limit)
+
     @abstractmethod
     def apply_relationship_filters(self, stmt: Select, filters: F) -> Select:
         ...
@@ -180,7 +232,7 @@ class CacheRepository:
         if data is None:
             data = await func(*args, **kwargs)
             payload = {
-                "items": [item.model_dump_json() for item in data.items],
+                "items": [item.model_dump_json(exclude_unset=True) for item in data.items],
                 "total": data.total,
                 "page": data.page,
                 "page_size": data.page_size
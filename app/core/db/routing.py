@@ -0,0 +1,180 @@
+import asyncio
+import itertools
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+from prometheus_client import Counter, Gauge
+from redis.asyncio import Redis
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from app.core.queries import BaseQuery
+
+logger = logging.getLogger(__name__)
+
+REPLICA_HEALTHY = Gauge("db_replica_healthy", "Replica passed the last health check", ["replica"])
+QUERY_ROUTES = Counter("db_query_routes_total", "Mediator queries by database target", ["target"])
+
+LAG_STATEMENT = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() IS NULL "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+class DBRoute(StrEnum):
+    PRIMARY = "primary"
+    REPLICA = "replica"
+
+
+db_route: ContextVar[DBRoute | None] = ContextVar("db_route", default=None)
+db_identity: ContextVar[str | None] = ContextVar("db_identity", default=None)
+
+
+@contextmanager
+def route_to(route: DBRoute) -> Iterator[None]:
+    token = db_route.set(route)
+    try:
+        yield
+    finally:
+        db_route.reset(token)
+
+
+def bind_db_identity(identity: str | int) -> None:
+    db_identity.set(str(identity))
+
+
+@dataclass(eq=False)
+class ReplicaPool:
+    engines: list[AsyncEngine] = field(default_factory=list)
+    max_lag: float = 5.0
+    check_interval: float = 5.0
+    check_timeout: float = 2.0
+    healthy: list[AsyncEngine] = field(default_factory=list, init=False)
+    _counter: Iterator[int] = field(default_factory=itertools.count, init=False)
+    _task: asyncio.Task | None = field(default=None, init=False)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> AsyncEngine | None:
+        healthy = self.healthy
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    async def check(self) -> None:
+        results = await asyncio.gather(*(self._check_engine(engine) for engine in self.engines))
+        self.healthy = [engine for engine, ok in zip(self.engines, results, strict=True) if ok]
+
+    async def start(self) -> None:
+        if not self.enabled:
+            return
+
+        await self.check()
+        self._task = asyncio.create_task(self._run(), name="db:replica-health")
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        for engine in self.engines:
+            await engine.dispose(close=True)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.check()
+
+    async def _check_engine(self, engine: AsyncEngine) -> bool:
+        replica = engine.url.host or "unknown"
+        try:
+            async with asyncio.timeout(self.check_timeout), engine.connect() as conn:
+                lag = float((await conn.execute(LAG_STATEMENT)).scalar_one() or 0)
+        except Exception:
+            logger.warning("Replica health check failed", extra={"replica": replica}, exc_info=True)
+            REPLICA_HEALTHY.labels(replica=replica).set(0)
+            return False
+
+        ok = lag <= self.max_lag
+        if not ok:
+            logger.warning("Replica lag exceeded", extra={"replica": replica, "lag": lag})
+        REPLICA_HEALTHY.labels(replica=replica).set(int(ok))
+        return ok
+
+
+class RoutingSession(Session):
+    def __init__(self, *args: Any, replicas: ReplicaPool | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.replica: AsyncEngine | None = None
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine | Connection:
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+        if self.replicas is None or db_route.get() is not DBRoute.REPLICA or self._flushing:
+            return primary
+
+        if clause is not None and (
+            getattr(clause, "is_dml", False) or getattr(clause, "_for_update_arg", None) is not None
+        ):
+            return primary
+
+        if self.replica is None:
+            self.replica = self.replicas.choose()
+        return self.replica.sync_engine if self.replica is not None else primary
+
+
+class BaseWriteTracker(ABC):
+    @abstractmethod
+    async def mark_write(self, identity: str) -> None:
+        ...
+
+    @abstractmethod
+    async def recently_wrote(self, identity: str) -> bool:
+        ...
+
+
+@dataclass
+class RedisWriteTracker(BaseWriteTracker):
+    client: Redis
+    window: float = 5.0
+    prefix: str = "db:ryw"
+
+    async def mark_write(self, identity: str) -> None:
+        await self.client.set(f"{self.prefix}:{identity}", 1, px=int(self.window * 1000))
+
+    async def recently_wrote(self, identity: str) -> bool:
+        return bool(await self.client.exists(f"{self.prefix}:{identity}"))
+
+
+@dataclass
+class ReadRouter:
+    replicas: ReplicaPool
+    tracker: BaseWriteTracker
+
+    async def route_for_query(self, query: BaseQuery) -> DBRoute:
+        if not self.replicas.enabled or db_route.get() is not None or not query.read_from_replica:
+            return db_route.get() or DBRoute.PRIMARY
+
+        identity = db_identity.get()
+        if identity is not None and await self.tracker.recently_wrote(identity):
+            QUERY_ROUTES.labels(target="primary_after_write").inc()
+            return DBRoute.PRIMARY
+
+        QUERY_ROUTES.labels(target=DBRoute.REPLICA).inc()
+        return DBRoute.REPLICA
+
+    async def after_command(self) -> None:
+        identity = db_identity.get()
+        if self.replicas.enabled and identity is not None:
+            await self.tracker.mark_write(identity)
@@ -0,0 +1,50 @@
+from typing import Any
+
+from sqlalchemy import DDL, ColumnElement, Computed, Index, event, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import InstrumentedAttribute, MappedColumn, mapped_column
+
+from app.core.db.base_model import BaseModel
+
+SEARCH_CONFIG = "simple"
+TRIGRAM_OPS = "gin_trgm_ops"
+
+event.listen(
+    BaseModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),  # type: ignore[no-untyped-call]
+)
+
+
+def trigram_index(table_name: str, column: str) -> Index:
+    return Index(
+        f"ix_{table_name}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: TRIGRAM_OPS},
+    )
+
+
+def search_vector_column(*columns: str) -> MappedColumn[Any]:
+    document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+    return mapped_column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{SEARCH_CONFIG}'::regconfig, {document})", persisted=True),
+        deferred=True,
+    )
+
+
+def search_vector_index(table_name: str, column: str = "search_vector") -> Index:
+    return Index(f"ix_{table_name}_{column}", column, postgresql_using="gin")
+
+
+def search_query(value: str) -> ColumnElement[Any]:
+    return func.websearch_to_tsquery(SEARCH_CONFIG, value)
+
+
+def search_condition(attr: InstrumentedAttribute[Any], value: str) -> ColumnElement[bool]:
+    return attr.bool_op("@@")(search_query(value))
+
+
+def search_rank(attr: InstrumentedAttribute[Any], value: str) -> ColumnElement[float]:
+    return func.ts_rank_cd(attr, search_query(value))
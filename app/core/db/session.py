@@ -1,32 +1,52 @@
-from sqlalchemy import AsyncAdaptedQueuePool, NullPool
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.configs.app import app_config
+from app.core.configs.db_pool import DBPoolRule
+from app.core.db.pool import instrument_pool, pool_options
+from app.core.db.routing import ReplicaPool, RoutingSession
+from app.core.db.statements import warm_statements
+from app.core.timing import instrument_engine
 
 
-def create_engine() -> AsyncEngine:
+def create_engine(url: str | None = None, name: str = "primary") -> AsyncEngine:
+    rule: DBPoolRule = app_config.db_pool
     if app_config.ENVIRONMENT == "testing":
-        pool_class = NullPool
-        pool_size = 0
-        max_overflow = 0
-    else:
-        pool_class = AsyncAdaptedQueuePool
-        pool_size = 10
-        max_overflow = 15
-
-    return create_async_engine(
-        str(app_config.postgres_url),
-        pool_pre_ping=True,
-        pool_size=pool_size,
-        poolclass=pool_class,
-        max_overflow=max_overflow,
+        rule = {"pool_size": 0, "max_overflow": 0}
+
+    external = app_config.DB_POOL_MODE == "external"
+    engine = create_async_engine(
+        url or str(app_config.postgres_url),
         echo=app_config.SQL_ECHO,
-        pool_recycle=3600,
-        pool_timeout=30,
         future=True,
+        **pool_options(rule, external=external),
     )
+    instrument_pool(engine.sync_engine, role=app_config.DB_POOL_ROLE, name=name)
+    if app_config.DB_WARM_STATEMENTS and not external and rule["pool_size"] > 0:
+        warm_statements(engine.sync_engine)
+    if app_config.REQUEST_TIMING_ENABLED:
+        instrument_engine(engine)
+    return engine
+
+def create_replica_engines() -> list[AsyncEngine]:
+    return [
+        create_engine(url, name=f"replica:{make_url(url).host}")
+        for url in app_config.postgres_replica_urls
+    ]
+
+def create_async_maker(
+    engine: AsyncEngine, replicas: ReplicaPool | None = None
+) -> async_sessionmaker[AsyncSession]:
+    if replicas is not None and replicas.enabled:
+        return async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            replicas=replicas,
+            expire_on_commit=False,
+            autoflush=False,
+        )
 
-def create_async_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     return async_sessionmaker(
             bind=engine,
             class_=AsyncSession,
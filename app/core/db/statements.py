@@ -0,0 +1,55 @@
+import logging
+from collections.abc import Iterator
+from typing import Any
+
+from sqlalchemy import Dialect, Engine, event
+from sqlalchemy.pool import ConnectionPoolEntry
+from sqlalchemy.sql import Executable
+
+logger = logging.getLogger(__name__)
+
+
+class StatementRegistry:
+    def __init__(self) -> None:
+        self._statements: dict[str, Any] = {}
+        self._compiled: dict[str, list[tuple[str, int]]] = {}
+
+    def register[T: Executable](self, name: str, statement: T) -> T:
+        if name in self._statements:
+            raise ValueError(f"Statement {name!r} is already registered")
+        self._statements[name] = statement
+        self._compiled.clear()
+        return statement
+
+    def __iter__(self) -> Iterator[tuple[str, Executable]]:
+        return iter(self._statements.items())
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def compiled(self, dialect: Dialect) -> list[tuple[str, int]]:
+        if dialect.name not in self._compiled:
+            sqls = []
+            for _, statement in self:
+                compiled = statement.compile(dialect=dialect)  # type: ignore[attr-defined]
+                sqls.append((str(compiled), len(compiled.positiontup or ())))
+            self._compiled[dialect.name] = sqls
+        return self._compiled[dialect.name]
+
+
+hot_statements = StatementRegistry()
+
+
+def warm_statements(engine: Engine, registry: StatementRegistry = hot_statements) -> None:
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        # running each statement once with NULL parameters fills the driver's per-connection prepared cache
+        cursor = dbapi_connection.cursor()
+        try:
+            for sql, params in registry.compiled(engine.dialect):
+                cursor.execute(sql, (None,) * params)
+        except Exception:
+            logger.warning("Statement warm-up failed", exc_info=True)
+        finally:
+            cursor.close()
+            dbapi_connection.rollback()
@@ -8,7 +8,9 @@ from app.core.di.db import DBProvider
 from app.core.di.events import EventProvider
 from app.core.di.mail import MailProvider
 from app.core.di.mediator import MediatorProvider
+from app.core.di.profiling import ProfilingProvider
 from app.core.di.queues import QueueProvider
+from app.core.di.rate_limit import RateLimitProvider
 
 
 def get_core_providers() -> list[Provider]:
@@ -22,4 +24,6 @@ def get_core_providers() -> list[Provider]:
         QueueProvider(),
         MailProvider(),
         AuthServicesProvider(),
+        RateLimitProvider(),
+        ProfilingProvider(),
     ]
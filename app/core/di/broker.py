@@ -15,7 +15,13 @@ class BrokerProvider(Provider):
             consumer=AIOKafkaConsumer(
                 bootstrap_servers=app_config.BROKER_URL,
                 metadata_max_age_ms=30000,
-                group_id=app_config.GROUP_ID
+                group_id=app_config.GROUP_ID,
+                enable_auto_commit=False,
             ),
-            producer=AIOKafkaProducer(bootstrap_servers=app_config.BROKER_URL)
+            producer=AIOKafkaProducer(
+                bootstrap_servers=app_config.BROKER_URL,
+                linger_ms=app_config.BROKER_LINGER_MS,
+                max_batch_size=app_config.BROKER_MAX_BATCH_SIZE,
+                compression_type=app_config.BROKER_COMPRESSION_TYPE,
+            )
         )
@@ -2,6 +2,7 @@
 from dishka import Provider, Scope, provide
 from minio import Minio
 
+from app.core.api.export import ExportLimiter
 from app.core.configs.app import app_config
 from app.core.services.storage.aminio.policy import Policy
 from app.core.services.storage.aminio.service import MinioStorageService
@@ -32,3 +33,10 @@ class CoreProvider(Provider):
             bucket_policy=bucket_policy
         )
 
+
+    @provide(scope=Scope.APP)
+    def export_limiter(self) -> ExportLimiter:
+        return ExportLimiter(
+            max_concurrent=app_config.EXPORT_MAX_CONCURRENT,
+            retry_after=app_config.EXPORT_RETRY_AFTER,
+        )
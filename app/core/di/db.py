@@ -6,7 +6,9 @@ from sqlalchemy.ext.asyncio.engine import AsyncEngine
 from sqlalchemy.ext.asyncio.session import AsyncSession, async_sessionmaker
 
 from app.core.configs.app import app_config
-from app.core.db.session import create_async_maker, create_engine
+from app.core.db.routing import ReadRouter, RedisWriteTracker, ReplicaPool
+from app.core.db.session import create_async_maker, create_engine, create_replica_engines
+from app.core.timing import TimedRedis
 
 
 class DBProvider(Provider):
@@ -19,8 +21,28 @@ class DBProvider(Provider):
         await engine.dispose(close=True)
 
     @provide(scope=Scope.APP)
-    async def get_marker(self, engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
-        return create_async_maker(engine=engine)
+    async def get_replica_pool(self) -> AsyncIterable[ReplicaPool]:
+        replicas = ReplicaPool(
+            engines=create_replica_engines(),
+            max_lag=app_config.DB_REPLICA_MAX_LAG,
+            check_interval=app_config.DB_REPLICA_CHECK_INTERVAL,
+        )
+        await replicas.start()
+        yield replicas
+        await replicas.close()
+
+    @provide(scope=Scope.APP)
+    async def get_marker(
+        self, engine: AsyncEngine, replicas: ReplicaPool
+    ) -> async_sessionmaker[AsyncSession]:
+        return create_async_maker(engine=engine, replicas=replicas)
+
+    @provide(scope=Scope.APP)
+    def get_read_router(self, replicas: ReplicaPool, redis: Redis) -> ReadRouter:
+        return ReadRouter(
+            replicas=replicas,
+            tracker=RedisWriteTracker(client=redis, window=app_config.DB_READ_YOUR_WRITES_WINDOW),
+        )
 
     @provide(scope=Scope.REQUEST)
     async def get_session(
@@ -31,4 +53,5 @@ class DBProvider(Provider):
 
     @provide(scope=Scope.APP)
     async def get_redis(self) -> Redis:
-        return Redis.from_url(app_config.redis_url, max_connections=50, decode_responses=True)
+        redis_class = TimedRedis if app_config.REQUEST_TIMING_ENABLED else Redis
+        return redis_class.from_url(app_config.redis_url, max_connections=50, decode_responses=True)
@@ -1,5 +1,6 @@
 from dishka import AsyncContainer, Provider, Scope, provide
 
+from app.core.db.routing import ReadRouter
 from app.core.mediators.base import BaseMediator, CommandRegistry, QueryRegistry
 from app.core.mediators.imediator import DishkaMediator
 
@@ -23,11 +24,13 @@ class MediatorProvider(Provider):
         container: AsyncContainer,
         command_registry: CommandRegistry,
         query_registry: QueryRegistry,
+        read_router: ReadRouter,
     ) -> BaseMediator:
         mediator = DishkaMediator(
             container=container,
             query_registry=query_registry,
-            command_registry=command_registry
+            command_registry=command_registry,
+            read_router=read_router,
         )
 
         return mediator
@@ -0,0 +1,17 @@
+from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
+
+from app.core.configs.app import app_config
+from app.core.profiling.store import BaseProfileStore, RedisProfileStore
+
+
+class ProfilingProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def get_profile_store(self, redis: Redis) -> BaseProfileStore:
+        return RedisProfileStore(
+            client=redis,
+            max_captures=app_config.PROFILING_MAX_CAPTURES,
+            ttl=app_config.PROFILING_CAPTURE_TTL,
+        )
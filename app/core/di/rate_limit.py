@@ -0,0 +1,18 @@
+from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
+
+from app.core.configs.app import app_config
+from app.core.services.rate_limit.base import BaseRateLimiter
+from app.core.services.rate_limit.local import LocalRateLimitCache
+from app.core.services.rate_limit.service import RedisRateLimiter
+
+
+class RateLimitProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def get_rate_limiter(self, redis: Redis) -> BaseRateLimiter:
+        local = None
+        if app_config.RATE_LIMIT_LOCAL_PRECHECK:
+            local = LocalRateLimitCache(max_keys=app_config.RATE_LIMIT_LOCAL_MAX_KEYS)
+        return RedisRateLimiter(redis=redis, prefix=app_config.RATE_LIMIT_PREFIX, local=local)
@@ -14,12 +14,12 @@ class MediatorEventBus(BaseEventBus):
     message_broker: BaseMessageBroker
 
     async def publish(self, events: Iterable[BaseEvent]) -> None:
-        for event in events:
-            type_handlers = self.event_registy.get_handler_types([event])
-            if not type_handlers:
-                continue
+        handled = [(event, handlers) for event in events if (handlers := self.event_registy.get_handler_types([event]))]
+        if not handled:
+            return
 
-            async with self.container() as requests_container:
+        async with self.container() as requests_container:
+            for event, type_handlers in handled:
                 for type_handler in type_handlers:
                     handler = await requests_container.get(type_handler)
                     await handler(event)
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import orjson
+from redis.asyncio import Redis
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db.event import EventLog
+from app.core.events.event import BaseEvent
+from app.core.exceptions import UnknownEventError
+from app.core.message_brokers.base import BaseMessageBroker
+from app.core.message_brokers.converters import convert_broker_message_to_event
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ReplayCheckpoint:
+    created_at: datetime
+    event_id: UUID
+
+    def dump(self) -> str:
+        return orjson.dumps({"created_at": self.created_at, "event_id": self.event_id}).decode()
+
+    @classmethod
+    def load(cls, raw: str | bytes) -> ReplayCheckpoint:
+        data = orjson.loads(raw)
+        return cls(created_at=datetime.fromisoformat(data["created_at"]), event_id=UUID(data["event_id"]))
+
+
+@dataclass
+class ReplayResult:
+    published: int = 0
+    skipped: int = 0
+    checkpoint: ReplayCheckpoint | None = None
+
+
+class BaseReplayCheckpointStore(ABC):
+    @abstractmethod
+    async def get(self, name: str) -> ReplayCheckpoint | None:
+        ...
+
+    @abstractmethod
+    async def save(self, name: str, checkpoint: ReplayCheckpoint) -> None:
+        ...
+
+    @abstractmethod
+    async def reset(self, name: str) -> None:
+        ...
+
+
+@dataclass
+class RedisReplayCheckpointStore(BaseReplayCheckpointStore):
+    client: Redis
+    prefix: str = "events_replay"
+
+    async def get(self, name: str) -> ReplayCheckpoint | None:
+        raw = await self.client.get(f"{self.prefix}:{name}")
+        return ReplayCheckpoint.load(raw) if raw else None
+
+    async def save(self, name: str, checkpoint: ReplayCheckpoint) -> None:
+        await self.client.set(f"{self.prefix}:{name}", checkpoint.dump())
+
+    async def reset(self, name: str) -> None:
+        await self.client.delete(f"{self.prefix}:{name}")
+
+
+@dataclass
+class EventReplayer:
+    session: AsyncSession
+    message_broker: BaseMessageBroker
+    checkpoints: BaseReplayCheckpointStore
+    batch_size: int = 500
+    rate_limit: int = 0
+    _started: float = field(default=0.0, init=False)
+
+    async def replay(
+        self,
+        name: str,
+        topic: str,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        event_names: list[str] | None = None,
+    ) -> ReplayResult:
+        result = ReplayResult(checkpoint=await self.checkpoints.get(name))
+        stmt = self._build_query(result.checkpoint, since, until, event_names)
+
+        self._started = time.monotonic()
+        stream = await self.session.stream_scalars(stmt.execution_options(yield_per=self.batch_size))
+        async for rows in stream.partitions():
+            events = []
+            for row in rows:
+                event = self._to_event(row)
+                if event is None:
+                    result.skipped += 1
+                    continue
+                events.append(event)
+
+            if events:
+                await self.message_broker.send_events_batch(topic, events)
+                result.published += len(events)
+
+            result.checkpoint = ReplayCheckpoint(created_at=rows[-1].created_at, event_id=rows[-1].event_id)
+            await self.checkpoints.save(name, result.checkpoint)
+            await self._throttle(result.published + result.skipped)
+
+        logger.info(
+            "Events replay finished",
+            extra={"name": name, "topic": topic, "published": result.published, "skipped": result.skipped}
+        )
+        return result
+
+    def _build_query(
+        self,
+        checkpoint: ReplayCheckpoint | None,
+        since: datetime | None,
+        until: datetime | None,
+        event_names: list[str] | None,
+    ) -> Select[EventLog]:
+        stmt = select(EventLog).order_by(EventLog.created_at, EventLog.event_id)
+        if checkpoint is not None:
+            stmt = stmt.where(
+                tuple_(EventLog.created_at, EventLog.event_id) > tuple_(checkpoint.created_at, checkpoint.event_id)
+            )
+        if since is not None:
+            stmt = stmt.where(EventLog.created_at >= since)
+        if until is not None:
+            stmt = stmt.where(EventLog.created_at < until)
+        if event_names:
+            event_name = func.coalesce(EventLog.payload["event_name"].astext, EventLog.meta_data["event_name"].astext)
+            stmt = stmt.where(event_name.in_(event_names))
+        return stmt
+
+    def _to_event(self, row: EventLog) -> BaseEvent | None:
+        data: dict[str, Any] = {"event_id": row.event_id, "created_at": row.created_at, **row.payload}
+        data.setdefault("event_name", row.meta_data.get("event_name"))
+
+        try:
+            return convert_broker_message_to_event(data)
+        except (UnknownEventError, TypeError):
+            logger.warning(
+                "Events replay skipped row",
+                extra={"event_id": str(row.event_id), "event_name": data["event_name"]}
+            )
+            return None
+
+    async def _throttle(self, processed: int) -> None:
+        if self.rate_limit <= 0:
+            return
+
+        delay = processed / self.rate_limit - (time.monotonic() - self._started)
+        if delay > 0:
+            await asyncio.sleep(delay)
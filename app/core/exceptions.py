@@ -15,6 +15,10 @@ class ApplicationError(Exception):
     def detail(self) -> dict[str, Any] | list[dict[str, Any]]:
         return {}
 
+    @property
+    def headers(self) -> dict[str, str] | None:
+        return None
+
 
 @dataclass(kw_only=True)
 class NotHandlerRegisterError(ApplicationError):
@@ -61,3 +65,52 @@ class ValidationError(ApplicationError):
             "msg": "string",
             "type": "string"
         }]
+
+
+@dataclass(kw_only=True)
+class UnknownEventError(ApplicationError):
+    event_name: str
+    code: str = "INTERNAL_EXCEPTION"
+    status: int = 500
+
+    @property
+    def message(self) -> str:
+        return "Unknown event"
+
+    @property
+    def detail(self) -> dict[str, Any]:
+        return {"event_name": self.event_name}
+
+
+@dataclass(kw_only=True)
+class ServiceOverloadedError(ApplicationError):
+    retry_after: int
+    code: str = "SERVICE_OVERLOADED"
+    status: int = 503
+
+    @property
+    def message(self) -> str:
+        return "Service is overloaded, retry later"
+
+    @property
+    def detail(self) -> dict[str, Any]:
+        return {"retry_after": self.retry_after}
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Retry-After": str(self.retry_after)}
+
+
+@dataclass(kw_only=True)
+class NotFoundProfileCaptureError(ApplicationError):
+    capture_id: str
+    code: str = "NOT_FOUND_PROFILE_CAPTURE"
+    status: int = 404
+
+    @property
+    def message(self) -> str:
+        return "Profile capture not found"
+
+    @property
+    def detail(self) -> dict[str, Any]:
+        return {"capture_id": self.capture_id}
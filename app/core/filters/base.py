@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 
 from app.core.filters.condition import FilterCondition, FilterOperator
 from app.core.filters.loading_strategy import LoadingConfig, LoadingStrategyType, RelationshipLoading
@@ -10,10 +11,13 @@ from app.core.filters.sort import SortDirection, SortField
 
 @dataclass
 class BaseFilter(ABC):
+    searchable_fields: ClassVar[frozenset[str]] = frozenset()
+
     _conditions: list[FilterCondition] = field(default_factory=list, init=False)
     _sort_fields: list[SortField] = field(default_factory=list, init=False)
     _pagination: Pagination = field(default_factory=Pagination.default, init=False)
     _relation: dict[str, RelationshipLoading] = field(default_factory=dict, init=False)
+    _fields: tuple[str, ...] | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
         self.build_condition()
@@ -36,8 +40,23 @@ class BaseFilter(ABC):
 
     @property
     def loading_config(self) -> LoadingConfig:
-        cfg = LoadingConfig(tuple(self._relation.values()))
-        return cfg
+        if self._fields is None:
+            return LoadingConfig(tuple(self._relation.values()))
+        return LoadingConfig(tuple(self._relation[name] for name in self._fields if name in self._relation))
+
+    @property
+    def fields(self) -> tuple[str, ...] | None:
+        return self._fields
+
+    @property
+    def column_fields(self) -> tuple[str, ...]:
+        return tuple(name for name in self._fields or () if name not in self._relation)
+
+    def has_projection(self) -> bool:
+        return self._fields is not None
+
+    def has_relation_fields(self) -> bool:
+        return any(name in self._relation for name in self._fields or ())
 
     def add_condition(
         self,
@@ -57,6 +76,10 @@ class BaseFilter(ABC):
 
         return self
 
+    def set_fields(self, fields: Iterable[str] | None) -> BaseFilter:
+        self._fields = tuple(dict.fromkeys(fields)) if fields is not None else None
+        return self
+
     def set_pagination(self, pagination: Pagination) -> BaseFilter:
         self._pagination = pagination
         return self
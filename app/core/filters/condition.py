@@ -25,6 +25,7 @@ class FilterOperator(StrEnum):
     IS_NOT_NULL = "is_not_null"
     IS_NULL_FROM = "is_null_from"
     IS_NOT_NULL_FROM = "is_not_null_from"
+    SEARCH = "search"
 
 
 null_set = {
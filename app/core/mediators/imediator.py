@@ -4,29 +4,39 @@ from typing import Any
 from dishka import AsyncContainer
 
 from app.core.commands import BaseCommand
+from app.core.db.routing import DBRoute, ReadRouter, route_to
 from app.core.exceptions import NotHandlerRegisterError
 from app.core.mediators.base import BaseMediator
 from app.core.queries import BaseQuery
+from app.core.timing import measure
 
 
 @dataclass(eq=False)
 class DishkaMediator(BaseMediator):
     container: AsyncContainer
+    read_router: ReadRouter | None = None
 
     async def handle_command(self, command: BaseCommand) -> Any:
         handler_type = self.command_registry.get_handler_types(command)
         if not handler_type:
             raise NotHandlerRegisterError(classes=[command.__class__.__name__])
 
-        async with self.container() as requests_container:
-            handler = await requests_container.get(handler_type)
-            return await handler.handle(command)
+        with measure("mediator"), route_to(DBRoute.PRIMARY):
+            async with self.container() as requests_container:
+                handler = await requests_container.get(handler_type)
+                result = await handler.handle(command)
+
+        if self.read_router is not None:
+            await self.read_router.after_command()
+        return result
 
     async def handle_query(self, query: BaseQuery) -> Any:
         handler_type = self.query_registry.get_handler_types(query)
         if handler_type is None:
             raise NotHandlerRegisterError(classes=[query.__class__.__name__])
 
-        async with self.container() as requests_container:
-            handler = await requests_container.get(handler_type)
-            return await handler.handle(query)
+        route = await self.read_router.route_for_query(query) if self.read_router else DBRoute.PRIMARY
+        with measure("mediator"), route_to(route):
+            async with self.container() as requests_container:
+                handler = await requests_container.get(handler_type)
+                return await handler.handle(query)
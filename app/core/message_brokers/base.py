@@ -2,12 +2,14 @@ from abc import (
     ABC,
     abstractmethod,
 )
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from typing import Any
 
 from app.core.events.event import BaseEvent
 
+type MessageHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
 
 @dataclass
 class BaseMessageBroker(ABC):
@@ -32,10 +34,22 @@ class BaseMessageBroker(ABC):
     async def send_event(self, key: str, topic: str, event: BaseEvent) -> None:
         ...
 
+    @abstractmethod
+    async def send_events_batch(self, topic: str, events: Iterable[BaseEvent]) -> None:
+        ...
+
+    @abstractmethod
+    async def flush(self) -> None:
+        ...
+
     @abstractmethod
     def start_consuming(self, topic: list[str]) -> AsyncIterator[dict]:
         ...
 
+    @abstractmethod
+    async def consume(self, topics: list[str], handler: MessageHandler) -> None:
+        ...
+
     @abstractmethod
     async def stop_consuming(self) -> None:
         ...
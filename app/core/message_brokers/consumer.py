@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import time
+import zlib
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+import orjson
+from aiokafka import AIOKafkaConsumer, ConsumerRecord, TopicPartition
+
+from app.core.message_brokers.base import MessageHandler
+from app.core.message_brokers.metrics import (
+    CONSUMER_BATCH_DURATION,
+    CONSUMER_FAILED,
+    CONSUMER_LAG,
+    CONSUMER_PARKED,
+    CONSUMER_PROCESSED,
+)
+
+logger = logging.getLogger(__name__)
+
+type DeadLetterHandler = Callable[[ConsumerRecord], Awaitable[None]]
+
+
+@dataclass(eq=False)
+class PartitionLane:
+    queue: asyncio.Queue[ConsumerRecord]
+    task: asyncio.Task | None = None
+    failed_offset: int | None = None
+
+
+@dataclass(eq=False)
+class PartitionedConsumer:
+    consumer: AIOKafkaConsumer
+    handler: MessageHandler
+    max_records: int = 500
+    fetch_timeout_ms: int = 1000
+    queue_size: int = 1000
+    lanes_per_partition: int = 1
+    max_retries: int = 3
+    retry_backoff_ms: int = 500
+    dead_letter: DeadLetterHandler | None = None
+    lanes: dict[tuple[TopicPartition, int], PartitionLane] = field(default_factory=dict, init=False)
+    retries: dict[TopicPartition, tuple[int, int]] = field(default_factory=dict, init=False)
+    paused: dict[TopicPartition, float] = field(default_factory=dict, init=False)
+    running: bool = field(default=False, init=False)
+
+    async def run(self, topics: list[str]) -> None:
+        self.consumer.subscribe(topics=topics)
+        self.running = True
+
+        try:
+            while self.running and self.consumer.subscription():
+                self._resume_due()
+                batch = await self.consumer.getmany(
+                    timeout_ms=self.fetch_timeout_ms,
+                    max_records=self.max_records,
+                )
+                if batch:
+                    await self.process_batch(batch)
+        finally:
+            await self.close_lanes()
+
+    def stop(self) -> None:
+        self.running = False
+
+    async def process_batch(self, batch: dict[TopicPartition, list[ConsumerRecord]]) -> None:
+        started = time.perf_counter()
+        routed: dict[PartitionLane, list[ConsumerRecord]] = defaultdict(list)
+        partition_lanes: dict[TopicPartition, set[PartitionLane]] = defaultdict(set)
+
+        for tp, records in batch.items():
+            for record in records:
+                lane = self._get_lane(tp, record.key)
+                routed[lane].append(record)
+                partition_lanes[tp].add(lane)
+
+        await asyncio.gather(*(self._feed(lane, records) for lane, records in routed.items()))
+
+        offsets: dict[TopicPartition, int] = {}
+        for tp, lanes in partition_lanes.items():
+            failed = [lane.failed_offset for lane in lanes if lane.failed_offset is not None]
+            if not failed:
+                self.retries.pop(tp, None)
+                offsets[tp] = batch[tp][-1].offset + 1
+            elif await self._park(tp, batch[tp], min(failed)):
+                offsets[tp] = min(failed) + 1
+
+        if offsets:
+            await self.consumer.commit(offsets)
+
+        self._report_lag(offsets)
+        CONSUMER_BATCH_DURATION.observe(time.perf_counter() - started)
+
+    async def close_lanes(self) -> None:
+        tasks = [lane.task for lane in self.lanes.values() if lane.task is not None]
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.lanes.clear()
+
+    async def _park(self, tp: TopicPartition, records: list[ConsumerRecord], offset: int) -> bool:
+        last_offset, attempt = self.retries.get(tp, (offset, 0))
+        attempt = attempt + 1 if last_offset == offset else 1
+
+        if attempt <= self.max_retries:
+            self.retries[tp] = (offset, attempt)
+            self._retry_later(tp, offset, self.retry_backoff_ms * 2 ** (attempt - 1) / 1000)
+            return False
+
+        record = next(record for record in records if record.offset == offset)
+        if self.dead_letter is not None:
+            try:
+                await self.dead_letter(record)
+            except Exception:
+                logger.exception(
+                    "Kafka dead letter failed", extra={"topic": tp.topic, "partition": tp.partition, "offset": offset}
+                )
+                self._retry_later(tp, offset, self.retry_backoff_ms * 2 ** (attempt - 1) / 1000)
+                return False
+
+        self.retries.pop(tp, None)
+        self.consumer.seek(tp, offset + 1)
+        CONSUMER_PARKED.labels(topic=tp.topic).inc()
+        logger.error(
+            "Kafka message parked after retries",
+            extra={"topic": tp.topic, "partition": tp.partition, "offset": offset, "attempts": attempt}
+        )
+        return True
+
+    def _retry_later(self, tp: TopicPartition, offset: int, delay: float) -> None:
+        # only this partition waits out the backoff, the others keep flowing
+        self.consumer.seek(tp, offset)
+        self.consumer.pause(tp)
+        self.paused[tp] = time.monotonic() + delay
+
+    def _resume_due(self) -> None:
+        now = time.monotonic()
+        due = [tp for tp, resume_at in self.paused.items() if resume_at <= now]
+        if due:
+            self.consumer.resume(*due)
+            for tp in due:
+                del self.paused[tp]
+
+    def _get_lane(self, tp: TopicPartition, key: bytes | None) -> PartitionLane:
+        slot = zlib.crc32(key) % self.lanes_per_partition if key and self.lanes_per_partition > 1 else 0
+        lane = self.lanes.get((tp, slot))
+        if lane is None:
+            lane = PartitionLane(queue=asyncio.Queue(maxsize=self.queue_size))
+            lane.task = asyncio.create_task(self._drain(tp, lane), name=f"kafka:{tp.topic}:{tp.partition}:{slot}")
+            self.lanes[(tp, slot)] = lane
+        return lane
+
+    async def _feed(self, lane: PartitionLane, records: list[ConsumerRecord]) -> None:
+        lane.failed_offset = None
+        for record in records:
+            await lane.queue.put(record)
+        await lane.queue.join()
+
+    async def _drain(self, tp: TopicPartition, lane: PartitionLane) -> None:
+        while True:
+            record = await lane.queue.get()
+            try:
+                if lane.failed_offset is None:
+                    await self.handler(orjson.loads(record.value))
+                    CONSUMER_PROCESSED.labels(topic=tp.topic).inc()
+            except Exception:
+                lane.failed_offset = record.offset
+                CONSUMER_FAILED.labels(topic=tp.topic).inc()
+                logger.exception(
+                    "Kafka handler failed",
+                    extra={"topic": tp.topic, "partition": tp.partition, "offset": record.offset}
+                )
+            finally:
+                lane.queue.task_done()
+
+    def _report_lag(self, offsets: dict[TopicPartition, int]) -> None:
+        for tp, offset in offsets.items():
+            highwater = self.consumer.highwater(tp)
+            if highwater is None:
+                continue
+
+            CONSUMER_LAG.labels(topic=tp.topic, partition=str(tp.partition)).set(max(highwater - offset, 0))
@@ -1,15 +1,121 @@
-from dataclasses import asdict
-from typing import Any
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, get_type_hints
+from uuid import UUID
 
 import orjson
 
 from app.core.events.event import BaseEvent
+from app.core.exceptions import UnknownEventError
+
+FIELD_DECODERS: dict[Any, Callable[[Any], Any]] = {
+    UUID: UUID,
+    datetime: datetime.fromisoformat,
+}
+
+
+@dataclass(frozen=True)
+class EventSerializer:
+    event_type: type[BaseEvent]
+    event_name: str
+    field_names: tuple[str, ...]
+    getter: Callable[[BaseEvent], tuple[Any, ...]]
+    decoders: tuple[tuple[str, Callable[[Any], Any]], ...]
+    init_fields: frozenset[str]
+
+    @classmethod
+    def compile(cls, event_type: type[BaseEvent]) -> EventSerializer:
+        event_fields = fields(event_type)
+        field_names = tuple(f.name for f in event_fields)
+        hints = get_type_hints(event_type)
+
+        getter: Callable[[BaseEvent], tuple[Any, ...]] = attrgetter(*field_names)
+        if len(field_names) == 1:
+            single = getter
+            getter = lambda event: (single(event),) # noqa: E731
+
+        return cls(
+            event_type=event_type,
+            event_name=event_type.get_name(),
+            field_names=field_names,
+            getter=getter,
+            decoders=tuple(
+                (f.name, FIELD_DECODERS[hints[f.name]])
+                for f in event_fields
+                if f.init and hints.get(f.name) in FIELD_DECODERS
+            ),
+            init_fields=frozenset(f.name for f in event_fields if f.init),
+        )
+
+    def to_dict(self, event: BaseEvent) -> dict[str, Any]:
+        data = dict(zip(self.field_names, self.getter(event), strict=True))
+        data["event_name"] = self.event_name
+        return data
+
+    def encode(self, event: BaseEvent) -> bytes:
+        return orjson.dumps(self.to_dict(event))
+
+    def from_dict(self, data: dict[str, Any]) -> BaseEvent:
+        kwargs = {name: value for name, value in data.items() if name in self.init_fields}
+        for name, decoder in self.decoders:
+            value = kwargs.get(name)
+            if isinstance(value, str):
+                kwargs[name] = decoder(value)
+        return self.event_type(**kwargs)
+
+
+@dataclass
+class EventSerializerRegistry:
+    by_type: dict[type[BaseEvent], EventSerializer] = field(default_factory=dict)
+    by_name: dict[str, EventSerializer] = field(default_factory=dict)
+
+    def register(self, event_type: type[BaseEvent]) -> EventSerializer:
+        serializer = EventSerializer.compile(event_type)
+        self.by_type[event_type] = serializer
+        self.by_name[serializer.event_name] = serializer
+        return serializer
+
+    def get(self, event_type: type[BaseEvent]) -> EventSerializer:
+        serializer = self.by_type.get(event_type)
+        if serializer is None:
+            serializer = self.register(event_type)
+        return serializer
+
+    def get_by_name(self, event_name: str) -> EventSerializer:
+        serializer = self.by_name.get(event_name)
+        if serializer is None:
+            self._discover()
+            serializer = self.by_name.get(event_name)
+        if serializer is None:
+            raise UnknownEventError(event_name=event_name)
+        return serializer
+
+    def encode(self, event: BaseEvent) -> bytes:
+        return self.get(type(event)).encode(event)
+
+    def decode(self, data: bytes | dict[str, Any]) -> BaseEvent:
+        payload: dict[str, Any] = data if isinstance(data, dict) else orjson.loads(data)
+        return self.get_by_name(payload["event_name"]).from_dict(payload)
+
+    def _discover(self) -> None:
+        pending = BaseEvent.__subclasses__()
+        while pending:
+            subclass = pending.pop()
+            if subclass not in self.by_type and getattr(subclass, "__event_name__", None) is not None:
+                self.register(subclass)
+            pending.extend(subclass.__subclasses__())
+
+
+event_serializers = EventSerializerRegistry()
 
 
 def convert_event_to_broker_message(event: BaseEvent) -> bytes:
-    data = asdict(event)
-    data["event_name"] = event.get_name()
-    return orjson.dumps(data)
+    return event_serializers.encode(event)
+
+def convert_broker_message_to_event(data: bytes | dict[str, Any]) -> BaseEvent:
+    return event_serializers.decode(data)
 
 def convert_event_to_json(event: BaseEvent) -> dict[str, Any]:
     return asdict(event)
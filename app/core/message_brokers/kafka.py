@@ -1,23 +1,32 @@
-from collections.abc import AsyncGenerator
-from dataclasses import dataclass
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, Iterable
+from dataclasses import dataclass, field
 from typing import Any
 
 import orjson
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, ConsumerRecord
 from aiokafka.producer import AIOKafkaProducer
 
+from app.core.configs.app import app_config
 from app.core.events.event import BaseEvent
-from app.core.message_brokers.base import BaseMessageBroker
+from app.core.message_brokers.base import BaseMessageBroker, MessageHandler
+from app.core.message_brokers.consumer import PartitionedConsumer
 from app.core.message_brokers.converters import convert_dict_to_broker_message, convert_event_to_broker_message
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class KafkaMessageBroker(BaseMessageBroker):
     producer: AIOKafkaProducer
     consumer: AIOKafkaConsumer
+    pending_deliveries: set[asyncio.Future] = field(default_factory=set, kw_only=True)
+    partitioned_consumer: PartitionedConsumer | None = field(default=None, kw_only=True)
 
     async def send_message(self, key: bytes, topic: str, value: bytes) -> None:
-        await self.producer.send(topic=topic, key=key, value=value)
+        fut = await self.producer.send(topic=topic, key=key, value=value)
+        self._track_delivery(fut)
 
     async def send_data(self, key: str, topic: str, data: dict[str, Any]) -> None:
         data["key"] = key
@@ -27,18 +36,83 @@ class KafkaMessageBroker(BaseMessageBroker):
 
     async def send_event(self, key: str, topic: str, event: BaseEvent) -> None:
         value = convert_event_to_broker_message(event)
-        await self.producer.send(topic=topic, key=key.encode(), value=value)
+        fut = await self.producer.send(topic=topic, key=key.encode(), value=value)
+        self._track_delivery(fut)
+
+    async def send_events_batch(self, topic: str, events: Iterable[BaseEvent]) -> None:
+        futures = []
+        for event in events:
+            fut = await self.producer.send(
+                topic=topic,
+                key=event.get_partition_key().encode(),
+                value=convert_event_to_broker_message(event),
+            )
+            futures.append(fut)
+
+        if futures:
+            await asyncio.gather(*futures)
+
+    async def flush(self) -> None:
+        pending = tuple(self.pending_deliveries)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            self.pending_deliveries.difference_update(pending)
+
+    def _track_delivery(self, fut: asyncio.Future) -> None:
+        self.pending_deliveries.add(fut)
+        fut.add_done_callback(self._on_delivery)
+
+    def _on_delivery(self, fut: asyncio.Future) -> None:
+        self.pending_deliveries.discard(fut)
+        if fut.cancelled():
+            return
+
+        if (exc := fut.exception()) is not None:
+            logger.error("Kafka delivery failed", exc_info=exc)
 
     async def start_consuming(self, topic: list[str]) -> AsyncGenerator[dict[str, Any]]:
         self.consumer.subscribe(topics=topic)
 
-        async for message in self.consumer:
-            yield orjson.loads(message.value) # type: ignore
+        while self.consumer.subscription():
+            batch = await self.consumer.getmany(
+                timeout_ms=app_config.BROKER_CONSUMER_FETCH_TIMEOUT_MS,
+                max_records=app_config.BROKER_CONSUMER_MAX_RECORDS,
+            )
+            for messages in batch.values():
+                for message in messages:
+                    yield orjson.loads(message.value)
+
+            if batch:
+                await self.consumer.commit()
+
+    async def consume(self, topics: list[str], handler: MessageHandler) -> None:
+        self.partitioned_consumer = PartitionedConsumer(
+            consumer=self.consumer,
+            handler=handler,
+            max_records=app_config.BROKER_CONSUMER_MAX_RECORDS,
+            fetch_timeout_ms=app_config.BROKER_CONSUMER_FETCH_TIMEOUT_MS,
+            queue_size=app_config.BROKER_CONSUMER_QUEUE_SIZE,
+            lanes_per_partition=app_config.BROKER_CONSUMER_LANES_PER_PARTITION,
+            max_retries=app_config.BROKER_CONSUMER_MAX_RETRIES,
+            retry_backoff_ms=app_config.BROKER_CONSUMER_RETRY_BACKOFF_MS,
+            dead_letter=self._send_to_dead_letter if app_config.BROKER_CONSUMER_DEAD_LETTER_SUFFIX else None,
+        )
+        await self.partitioned_consumer.run(topics)
+
+    async def _send_to_dead_letter(self, record: ConsumerRecord) -> None:
+        topic = f"{record.topic}{app_config.BROKER_CONSUMER_DEAD_LETTER_SUFFIX}"
+        fut = await self.producer.send(topic=topic, key=record.key, value=record.value, headers=record.headers)
+        await fut
 
     async def stop_consuming(self) -> None:
+        if self.partitioned_consumer is not None:
+            self.partitioned_consumer.stop()
+            self.partitioned_consumer = None
+
         self.consumer.unsubscribe()
 
     async def close(self) -> None:
+        await self.flush()
         await self.consumer.stop()
         await self.producer.stop()
 
@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from aiokafka import AIOKafkaConsumer
+from faststream.kafka import KafkaBroker
+
+from app.core.message_brokers.metrics import CONSUMER_LAG
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class ConsumerLagReporter:
+    broker: KafkaBroker
+    interval: float = 15.0
+    task: asyncio.Task | None = None
+    reported: set[tuple[str, str]] = field(default_factory=set)
+
+    def start(self) -> None:
+        self.task = asyncio.create_task(self._run(), name="kafka:lag")
+
+    async def close(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+    async def report(self) -> None:
+        current: set[tuple[str, str]] = set()
+        for consumer in self._consumers():
+            for tp in consumer.assignment():
+                highwater = consumer.highwater(tp)
+                if highwater is None:
+                    continue
+
+                labels = (tp.topic, str(tp.partition))
+                position = await consumer.position(tp)
+                CONSUMER_LAG.labels(*labels).set(max(highwater - position, 0))
+                current.add(labels)
+
+        # partitions moved to another member stop reporting here
+        for labels in self.reported - current:
+            CONSUMER_LAG.remove(*labels)
+        self.reported = current
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.report()
+            except Exception:
+                logger.warning("Consumer lag report failed", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+    def _consumers(self) -> Iterator[AIOKafkaConsumer]:
+        for subscriber in self.broker.subscribers:
+            consumers = getattr(subscriber, "consumer_subgroup", None) or [getattr(subscriber, "consumer", None)]
+            yield from (consumer for consumer in consumers if consumer is not None)
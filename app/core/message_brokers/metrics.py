@@ -0,0 +1,37 @@
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+CONSUMER_LAG = Gauge(
+    "kafka_consumer_lag",
+    "Messages between the partition high watermark and the committed offset",
+    ["topic", "partition"],
+    registry=None,
+)
+CONSUMER_PROCESSED = Counter(
+    "kafka_consumer_processed",
+    "Messages handled successfully",
+    ["topic"],
+    registry=None,
+)
+CONSUMER_FAILED = Counter(
+    "kafka_consumer_failed",
+    "Messages whose handler raised; the partition is rewound to them",
+    ["topic"],
+    registry=None,
+)
+CONSUMER_PARKED = Counter(
+    "kafka_consumer_parked",
+    "Messages skipped after exhausting handler retries",
+    ["topic"],
+    registry=None,
+)
+CONSUMER_BATCH_DURATION = Histogram(
+    "kafka_consumer_batch_duration_seconds",
+    "Time from a getmany batch arriving to its offsets being committed",
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    registry=None,
+)
+
+
+def register_consumer_metrics(registry: CollectorRegistry) -> None:
+    for collector in (CONSUMER_LAG, CONSUMER_PROCESSED, CONSUMER_FAILED, CONSUMER_PARKED, CONSUMER_BATCH_DURATION):
+        registry.register(collector)
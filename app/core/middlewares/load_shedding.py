@@ -0,0 +1,151 @@
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from enum import IntEnum
+from uuid import uuid4
+
+from prometheus_client import Counter, Gauge
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.api.schemas import ErrorDetail, ErrorResponse, ORJSONResponse
+from app.core.configs.app import app_config
+from app.core.exceptions import ServiceOverloadedError
+from app.core.utils import now_utc
+
+CONCURRENCY_LIMIT = Gauge(
+    "http_concurrency_limit",
+    "Current adaptive concurrency limit",
+)
+IN_FLIGHT = Gauge(
+    "http_in_flight_requests",
+    "Requests currently admitted by the load shedder",
+)
+SHED_REQUESTS = Counter(
+    "http_shed_requests",
+    "Requests rejected with 503 because the service was saturated",
+    ["priority"],
+)
+
+
+class RequestPriority(IntEnum):
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+
+PRIORITY_SHARES: dict[RequestPriority, float] = {
+    RequestPriority.HIGH: 1.0,
+    RequestPriority.NORMAL: 0.8,
+    RequestPriority.LOW: 0.5,
+}
+
+DEFAULT_ROUTE_PRIORITIES: tuple[tuple[str, RequestPriority], ...] = (
+    (r"^GET /(health|metrics)$", RequestPriority.CRITICAL),
+    (rf"^POST {app_config.API_V1_STR}/auth/(refresh|login)$", RequestPriority.HIGH),
+    (rf"^GET {app_config.API_V1_STR}/(users|roles|permissions|sessions)/?$", RequestPriority.LOW),
+)
+
+
+@dataclass
+class AIMDLimiter:
+    limit: float = 20
+    min_limit: int = 5
+    max_limit: int = 200
+    latency_target: float = 1.0
+    backoff: float = 0.9
+    in_flight: int = 0
+    last_decrease: float = field(default=0.0, init=False)
+
+    def __post_init__(self) -> None:
+        CONCURRENCY_LIMIT.set(self.limit)
+
+    def try_acquire(self, priority: RequestPriority) -> bool:
+        if self.in_flight >= self.limit * PRIORITY_SHARES[priority]:
+            return False
+
+        self.in_flight += 1
+        IN_FLIGHT.inc()
+        return True
+
+    def release(self, latency: float, dropped: bool = False, now: float | None = None) -> None:
+        if dropped or latency > self.latency_target:
+            now = time.monotonic() if now is None else now
+            if now - self.last_decrease >= self.latency_target:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self.last_decrease = now
+        elif self.in_flight * 2 >= self.limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+        self.in_flight -= 1
+        IN_FLIGHT.dec()
+        CONCURRENCY_LIMIT.set(self.limit)
+
+
+class LoadSheddingMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: AIMDLimiter | None = None,
+        route_priorities: Iterable[tuple[str, RequestPriority]] = DEFAULT_ROUTE_PRIORITIES,
+        retry_after: int = 1,
+    ) -> None:
+        self.app = app
+        self.limiter = limiter or AIMDLimiter()
+        self.route_priorities = [(re.compile(pattern), priority) for pattern, priority in route_priorities]
+        self.retry_after = retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        priority = self.get_priority(scope["method"], scope["path"])
+        if priority is RequestPriority.CRITICAL:
+            await self.app(scope, receive, send)
+            return
+
+        if not self.limiter.try_acquire(priority):
+            SHED_REQUESTS.labels(priority=priority.name.lower()).inc()
+            await self._reject(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        latency: float | None = None
+        dropped = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal latency
+            if message["type"] == "http.response.start" and latency is None:
+                latency = time.perf_counter() - started
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            dropped = True
+            raise
+        finally:
+            self.limiter.release(time.perf_counter() - started if latency is None else latency, dropped)
+
+    def get_priority(self, method: str, path: str) -> RequestPriority:
+        route = f"{method} {path}"
+        for pattern, priority in self.route_priorities:
+            if pattern.match(route):
+                return priority
+        return RequestPriority.NORMAL
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send) -> None:
+        exc = ServiceOverloadedError(retry_after=self.retry_after)
+        response = ORJSONResponse(
+            status_code=exc.status,
+            content=ErrorResponse(
+                error=ErrorDetail(code=exc.code, message=exc.message, detail=exc.detail),
+                status=exc.status,
+                request_id=scope.get("state", {}).get("request_id") or uuid4(),
+                timestamp=now_utc().timestamp(),
+            ),
+            headers=exc.headers,
+        )
+        await response(scope, receive, send)
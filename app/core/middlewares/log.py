@@ -3,6 +3,8 @@ import time
 
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.core.timing import request_timings
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,16 +17,18 @@ class LoggingMiddleware:
             await self.app(scope, receive, send)
             return
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         async def send_wrapper(message: Message) -> None:
             if message["type"] == "http.response.start":
-                processing_time = time.time() - start_time
+                processing_time = (time.perf_counter_ns() - start_time) / 1e9
+                timings = request_timings.get()
                 logger.info("request", extra={
                     "method": scope["method"],
                     "path": scope["path"],
                     "status_code": message["status"],
-                    "processing_time": processing_time
+                    "processing_time": processing_time,
+                    **(timings.as_log_fields() if timings is not None else {}),
                 })
             await send(message)
 
@@ -0,0 +1,87 @@
+import logging
+import random
+import re
+import time
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+from pyinstrument import Profiler
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.profiling.store import BaseProfileStore, ProfileCapture
+from app.core.utils import now_utc
+
+logger = logging.getLogger(__name__)
+
+
+async def get_store_from_container(scope: Scope) -> BaseProfileStore:
+    store: BaseProfileStore = await scope["app"].state.dishka_container.get(BaseProfileStore)
+    return store
+
+
+class ProfilingMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        get_store: Callable[[Scope], Awaitable[BaseProfileStore]] = get_store_from_container,
+        sample_rate: float = 0.0,
+        route_pattern: str | None = None,
+        slow_threshold: float = 0.5,
+        interval: float = 0.001,
+        max_concurrent: int = 1,
+    ) -> None:
+        self.app = app
+        self.get_store = get_store
+        self.sample_rate = sample_rate
+        self.route_pattern = re.compile(route_pattern) if route_pattern else None
+        self.slow_threshold = slow_threshold
+        self.interval = interval
+        self.max_concurrent = max_concurrent
+        self.active = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.should_profile(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        self.active += 1
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            session = profiler.stop()
+            self.active -= 1
+
+        duration = time.perf_counter() - started
+        if duration >= self.slow_threshold:
+            await self._save(scope, duration, session.to_json())
+
+    def should_profile(self, path: str) -> bool:
+        if self.active >= self.max_concurrent:
+            return False
+        if self.route_pattern is not None and self.route_pattern.search(path):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def _save(self, scope: Scope, duration: float, session: dict) -> None:
+        capture = ProfileCapture(
+            id=uuid4().hex,
+            method=scope["method"],
+            path=scope["path"],
+            route=getattr(scope.get("route"), "path", None),
+            duration_ms=round(duration * 1000, 3),
+            created_at=now_utc(),
+        )
+        try:
+            store = await self.get_store(scope)
+            await store.save(capture, session)
+        except Exception:
+            logger.exception("Failed to save profile capture", extra={"path": capture.path})
+            return
+
+        logger.info(
+            "Slow request profiled",
+            extra={"capture_id": capture.id, "path": capture.path, "duration_ms": capture.duration_ms}
+        )
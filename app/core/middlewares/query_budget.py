@@ -0,0 +1,72 @@
+import logging
+
+from prometheus_client import Histogram
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.db.query_budget import QueryStats, track_queries
+
+logger = logging.getLogger(__name__)
+
+QUERIES_PER_REQUEST = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+
+
+class QueryBudgetMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_budget: int = 30,
+        budgets: dict[str, int] | None = None,
+        repeat_threshold: int = 5,
+        raise_on_exceed: bool = False,
+    ) -> None:
+        self.app = app
+        self.default_budget = default_budget
+        self.budgets = budgets or {}
+        self.repeat_threshold = repeat_threshold
+        self.raise_on_exceed = raise_on_exceed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        def resolve_budget() -> tuple[str | None, int | None]:
+            route = self.get_route(scope)
+            return route, self.budgets.get(route, self.default_budget)
+
+        with track_queries(raise_on_exceed=self.raise_on_exceed, resolve_budget=resolve_budget) as stats:
+            await self.app(scope, receive, send)
+
+        self._report(self.get_route(scope), stats)
+
+    @staticmethod
+    def get_route(scope: Scope) -> str:
+        route = scope.get("route")
+        return f"{scope['method']} {getattr(route, 'path', 'unmatched')}"
+
+    def _report(self, route: str, stats: QueryStats) -> None:
+        method, _, path = route.partition(" ")
+        QUERIES_PER_REQUEST.labels(method=method, route=path).observe(stats.count)
+
+        if stats.exceeded:
+            logger.warning(
+                "Query budget exceeded",
+                extra={"route": route, "count": stats.count, "budget": stats.budget}
+            )
+
+        repeated = stats.repeated(self.repeat_threshold)
+        if repeated or stats.lazy_loads:
+            logger.warning(
+                "Possible N+1 queries",
+                extra={
+                    "route": route,
+                    "count": stats.count,
+                    "repeated": [{"statement": statement[:300], "count": count} for statement, count in repeated],
+                    "lazy_loads": dict(stats.lazy_loads),
+                }
+            )
@@ -0,0 +1,49 @@
+from prometheus_client import Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.timing import RequestTimings, request_timings
+
+REQUEST_PHASE_DURATION = Histogram(
+    "http_request_phase_duration_seconds",
+    "Request time split by phase (total, db, redis, mediator)",
+    ["method", "route", "phase"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+class TimingMiddleware:
+    def __init__(self, app: ASGIApp, server_timing: bool = True) -> None:
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                total_ns = timings.total_ns()
+                self._observe(scope, timings, total_ns)
+                if self.server_timing:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", timings.server_timing(total_ns).encode()))
+                    message["headers"] = headers
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_timings.reset(token)
+
+    def _observe(self, scope: Scope, timings: RequestTimings, total_ns: int) -> None:
+        route = scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        method = scope["method"]
+        REQUEST_PHASE_DURATION.labels(method=method, route=path, phase="total").observe(total_ns / 1e9)
+        for phase, duration_ns in timings.durations_ns.items():
+            REQUEST_PHASE_DURATION.labels(method=method, route=path, phase=phase).observe(duration_ns / 1e9)
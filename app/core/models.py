@@ -5,6 +5,7 @@ from app.core.db.event import EventLog
 
 from app.auth.models.oauth import OAuthAccount
 from app.auth.models.session import Session
-from app.auth.models.user import User, UserPermissions
+from app.auth.models.user import User, UserArchive, UserPermissions
+from app.auth.models.effective_permissions import UserEffectivePermissions
 from app.auth.models.permission import Permission, RolePermissions
 from app.auth.models.role import Role, UserRoles
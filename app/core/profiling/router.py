@@ -0,0 +1,74 @@
+from dataclasses import asdict
+from typing import Literal
+
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, Query, Response, status
+from fastapi.responses import HTMLResponse
+from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+from pyinstrument.session import Session
+
+from app.core.api.builder import create_response
+from app.core.exceptions import NotFoundProfileCaptureError
+from app.core.profiling.schemas import ProfileCaptureResponse
+from app.core.profiling.store import BaseProfileStore
+from app.core.services.auth.depends import CurrentUserJWTData
+from app.core.services.auth.dto import UserJWTData
+from app.core.services.auth.exceptions import AccessDeniedError
+from app.core.services.auth.rbac import RBACManagerInterface
+
+PROFILING_PERMISSION = "system:manage_settings"
+
+router = APIRouter(route_class=DishkaRoute, tags=["profiling"])
+
+
+def check_access(rbac_manager: RBACManagerInterface, user_jwt_data: UserJWTData) -> None:
+    if not rbac_manager.check_permission(user_jwt_data, {PROFILING_PERMISSION}):
+        raise AccessDeniedError(need_permissions={PROFILING_PERMISSION} - set(user_jwt_data.permissions))
+
+
+@router.get(
+    "/captures",
+    summary="Last profiled slow requests",
+    description="Returns the last N captures of requests slower than PROFILING_SLOW_THRESHOLD",
+    status_code=status.HTTP_200_OK,
+    responses={
+        403: create_response(AccessDeniedError(need_permissions={PROFILING_PERMISSION})),
+    }
+)
+async def list_captures(
+    user_jwt_data: CurrentUserJWTData,
+    rbac_manager: FromDishka[RBACManagerInterface],
+    store: FromDishka[BaseProfileStore],
+    limit: int = Query(default=20, ge=1, le=100),
+) -> list[ProfileCaptureResponse]:
+    check_access(rbac_manager, user_jwt_data)
+    return [ProfileCaptureResponse(**asdict(capture)) for capture in await store.list(limit)]
+
+
+@router.get(
+    "/captures/{capture_id}",
+    summary="Profile capture flame graph",
+    description="Renders a capture as an interactive HTML report or speedscope JSON",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    responses={
+        403: create_response(AccessDeniedError(need_permissions={PROFILING_PERMISSION})),
+        404: create_response(NotFoundProfileCaptureError(capture_id="string")),
+    }
+)
+async def get_capture(
+    capture_id: str,
+    user_jwt_data: CurrentUserJWTData,
+    rbac_manager: FromDishka[RBACManagerInterface],
+    store: FromDishka[BaseProfileStore],
+    format: Literal["html", "speedscope"] = "html",
+) -> Response:
+    check_access(rbac_manager, user_jwt_data)
+    data = await store.get_session(capture_id)
+    if data is None:
+        raise NotFoundProfileCaptureError(capture_id=capture_id)
+
+    session = Session.from_json(data)
+    if format == "speedscope":
+        return Response(SpeedscopeRenderer().render(session), media_type="application/json")
+    return HTMLResponse(HTMLRenderer().render(session))
@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ProfileCaptureResponse(BaseModel):
+    id: str
+    method: str
+    path: str
+    route: str | None
+    duration_ms: float
+    created_at: datetime
@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+
+import orjson
+from redis.asyncio import Redis
+
+
+@dataclass(frozen=True)
+class ProfileCapture:
+    id: str
+    method: str
+    path: str
+    route: str | None
+    duration_ms: float
+    created_at: datetime
+
+    def dump(self) -> bytes:
+        return orjson.dumps(asdict(self))
+
+    @classmethod
+    def load(cls, raw: str | bytes) -> ProfileCapture:
+        data = orjson.loads(raw)
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        return cls(**data)
+
+
+class BaseProfileStore(ABC):
+    @abstractmethod
+    async def save(self, capture: ProfileCapture, session: dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    async def list(self, limit: int) -> list[ProfileCapture]:
+        ...
+
+    @abstractmethod
+    async def get_session(self, capture_id: str) -> dict[str, Any] | None:
+        ...
+
+
+@dataclass
+class RedisProfileStore(BaseProfileStore):
+    client: Redis
+    max_captures: int = 50
+    ttl: int = 24 * 60 * 60
+    prefix: str = "profiling"
+
+    async def save(self, capture: ProfileCapture, session: dict[str, Any]) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(f"{self.prefix}:session:{capture.id}", orjson.dumps(session), ex=self.ttl)
+            pipe.lpush(f"{self.prefix}:captures", capture.dump())
+            pipe.ltrim(f"{self.prefix}:captures", 0, self.max_captures - 1)
+            pipe.expire(f"{self.prefix}:captures", self.ttl)
+            await pipe.execute()
+
+    async def list(self, limit: int) -> list[ProfileCapture]:
+        raw = await self.client.lrange(f"{self.prefix}:captures", 0, limit - 1)
+        return [ProfileCapture.load(item) for item in raw]
+
+    async def get_session(self, capture_id: str) -> dict[str, Any] | None:
+        raw = await self.client.get(f"{self.prefix}:session:{capture_id}")
+        return orjson.loads(raw) if raw else None
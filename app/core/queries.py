@@ -1,11 +1,11 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar
 
 
 @dataclass(frozen=True)
 class BaseQuery:
-    ...
+    read_from_replica: ClassVar[bool] = True
 
 
 @dataclass(frozen=True)
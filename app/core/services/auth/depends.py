@@ -4,6 +4,7 @@ from dishka.integrations.fastapi import FromDishka, inject
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from app.core.db.routing import bind_db_identity
 from app.core.services.auth.dto import UserJWTData
 from app.core.services.auth.exceptions import InvalidTokenError
 from app.core.services.auth.jwt_manager import JWTManager
@@ -24,6 +25,7 @@ class UserJWTDataGetter:
         user_jwt_data = UserJWTData.create_from_token(
             await jwt_manager.validate_token(credentials.credentials)
         )
+        bind_db_identity(user_jwt_data.id)
         return user_jwt_data
 
 CurrentUserJWTData = Annotated[UserJWTData, Depends(UserJWTDataGetter())]
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from app.core.configs.rate_limit import RateLimitRule
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    remaining: int = 0
+    retry_after: float = 0.0
+
+
+class BaseRateLimiter(ABC):
+    @abstractmethod
+    async def hit(self, policy: str, identity: str, rule: RateLimitRule) -> RateLimitResult:
+        ...
+
+    @abstractmethod
+    async def reset(self, policy: str, identity: str) -> None:
+        ...
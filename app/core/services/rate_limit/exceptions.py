@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.exceptions import ApplicationError
+
+
+@dataclass(kw_only=True)
+class TooManyRequestsError(ApplicationError):
+    retry_after: int
+
+    code: str = "TOO_MANY_REQUESTS"
+    status: int = 429
+
+    @property
+    def message(self) -> str:
+        return "Too many requests"
+
+    @property
+    def detail(self) -> dict[str, Any]:
+        return {"retry_after": self.retry_after}
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Retry-After": str(self.retry_after)}
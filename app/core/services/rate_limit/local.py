@@ -0,0 +1,52 @@
+import time
+from dataclasses import dataclass, field
+
+from app.core.configs.rate_limit import RateLimitRule
+from app.core.services.rate_limit.base import RateLimitResult
+
+
+@dataclass
+class LocalRateLimitCache:
+    max_keys: int = 10_000
+    blocked: dict[str, float] = field(default_factory=dict)
+    windows: dict[str, tuple[float, int]] = field(default_factory=dict)
+
+    def check(self, key: str, rule: RateLimitRule, now: float | None = None) -> float:
+        now = time.monotonic() if now is None else now
+        until = self.blocked.get(key)
+        if until is not None:
+            if until > now:
+                return until - now
+            del self.blocked[key]
+
+        if rule.get("algorithm", "sliding_window") != "sliding_window":
+            return 0.0
+
+        window = self.windows.get(key)
+        if window is not None and now - window[0] < rule["seconds"] and window[1] >= rule["times"]:
+            return window[0] + rule["seconds"] - now
+        return 0.0
+
+    def record(self, key: str, rule: RateLimitRule, result: RateLimitResult, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        if not result.allowed:
+            self._put(self.blocked, key, now + result.retry_after)
+            return
+
+        if rule.get("algorithm", "sliding_window") != "sliding_window":
+            return
+
+        window = self.windows.get(key)
+        if window is None or now - window[0] >= rule["seconds"]:
+            self._put(self.windows, key, (now, 1))
+        else:
+            self.windows[key] = (window[0], window[1] + 1)
+
+    def reset(self, key: str) -> None:
+        self.blocked.pop(key, None)
+        self.windows.pop(key, None)
+
+    def _put[T](self, store: dict[str, T], key: str, value: T) -> None:
+        if key not in store and len(store) >= self.max_keys:
+            del store[next(iter(store))]
+        store[key] = value
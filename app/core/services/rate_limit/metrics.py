@@ -0,0 +1,7 @@
+from prometheus_client import Counter
+
+RATE_LIMIT_REJECTED = Counter(
+    "rate_limit_rejected",
+    "Requests rejected by the rate limiter",
+    ["policy", "source"],
+)
@@ -0,0 +1,53 @@
+import uuid
+from dataclasses import dataclass, field
+
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+
+from app.core.configs.rate_limit import RateLimitRule
+from app.core.services.rate_limit.base import BaseRateLimiter, RateLimitResult
+from app.core.services.rate_limit.local import LocalRateLimitCache
+from app.core.services.rate_limit.metrics import RATE_LIMIT_REJECTED
+from app.core.services.rate_limit.scripts import SLIDING_WINDOW_SCRIPT, TOKEN_BUCKET_SCRIPT
+
+
+@dataclass
+class RedisRateLimiter(BaseRateLimiter):
+    redis: Redis
+    prefix: str = "rate_limit"
+    local: LocalRateLimitCache | None = None
+    scripts: dict[str, AsyncScript] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.scripts = {
+            "sliding_window": self.redis.register_script(SLIDING_WINDOW_SCRIPT),
+            "token_bucket": self.redis.register_script(TOKEN_BUCKET_SCRIPT),
+        }
+
+    async def hit(self, policy: str, identity: str, rule: RateLimitRule) -> RateLimitResult:
+        key = f"{self.prefix}:{policy}:{identity}"
+        if self.local is not None:
+            retry_after = self.local.check(key, rule)
+            if retry_after > 0:
+                RATE_LIMIT_REJECTED.labels(policy=policy, source="local").inc()
+                return RateLimitResult(allowed=False, retry_after=retry_after)
+
+        algorithm = rule.get("algorithm", "sliding_window")
+        args: list[int | str] = [rule["times"], rule["seconds"] * 1000]
+        if algorithm == "sliding_window":
+            args.append(uuid.uuid4().hex)
+
+        allowed, remaining, retry_after_ms = await self.scripts[algorithm](keys=[key], args=args)
+        result = RateLimitResult(allowed=bool(allowed), remaining=remaining, retry_after=retry_after_ms / 1000)
+        if not result.allowed:
+            RATE_LIMIT_REJECTED.labels(policy=policy, source="redis").inc()
+
+        if self.local is not None:
+            self.local.record(key, rule, result)
+        return result
+
+    async def reset(self, policy: str, identity: str) -> None:
+        key = f"{self.prefix}:{policy}:{identity}"
+        if self.local is not None:
+            self.local.reset(key)
+        await self.redis.delete(key)
@@ -0,0 +1,91 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+PHASES = ("db", "redis", "mediator")
+
+
+@dataclass(eq=False)
+class RequestTimings:
+    started_ns: int = field(default_factory=time.perf_counter_ns)
+    durations_ns: dict[str, int] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    active: set[str] = field(default_factory=set)
+
+    def add(self, phase: str, duration_ns: int) -> None:
+        self.durations_ns[phase] = self.durations_ns.get(phase, 0) + duration_ns
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def total_ns(self) -> int:
+        return time.perf_counter_ns() - self.started_ns
+
+    def as_log_fields(self) -> dict[str, Any]:
+        fields: dict[str, Any] = {}
+        for phase, duration_ns in self.durations_ns.items():
+            fields[f"{phase}_time_ms"] = round(duration_ns / 1e6, 3)
+            fields[f"{phase}_count"] = self.counts[phase]
+        return fields
+
+    def server_timing(self, total_ns: int) -> str:
+        metrics = [
+            f'{phase};dur={duration_ns / 1e6:.3f};desc="{self.counts[phase]}"'
+            for phase, duration_ns in self.durations_ns.items()
+        ]
+        metrics.append(f"total;dur={total_ns / 1e6:.3f}")
+        return ", ".join(metrics)
+
+
+request_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def measure(phase: str) -> Iterator[None]:
+    timings = request_timings.get()
+    if timings is None or phase in timings.active:
+        yield
+        return
+
+    timings.active.add(phase)
+    started = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter_ns() - started)
+        timings.active.discard(phase)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        if context is not None and request_timings.get() is not None:
+            context._timing_started_ns = time.perf_counter_ns()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        started = getattr(context, "_timing_started_ns", None)
+        timings = request_timings.get()
+        if started is not None and timings is not None:
+            timings.add("db", time.perf_counter_ns() - started)
+
+
+class TimedPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        with measure("redis"):
+            return await super().execute(raise_on_error=raise_on_error)
+
+
+class TimedRedis(Redis):
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        with measure("redis"):
+            return await super().execute_command(*args, **options)  # type: ignore[no-untyped-call]
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> Pipeline:
+        return TimedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
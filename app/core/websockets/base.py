@@ -30,6 +30,10 @@ class BaseConnectionManager(ABC):
     async def bind_connection(self, websocket: WebSocket, key: str) -> None:
         ...
 
+    @abstractmethod
+    def mark_alive(self, websocket: WebSocket) -> None:
+        ...
+
     @abstractmethod
     async def bind_key_connections(self, source_key: str, target_key: str) -> None:
         ...
@@ -42,6 +46,14 @@ class BaseConnectionManager(ABC):
     async def remove_connection(self, websocket: WebSocket, key: str) -> None:
         ...
 
+    @abstractmethod
+    async def is_online(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def count_connections(self, key: str) -> int:
+        ...
+
     @abstractmethod
     async def send_all(self, key: str, bytes_: bytes) -> None:
         ...
@@ -0,0 +1,97 @@
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import orjson
+import ormsgpack
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None # type: ignore[assignment]
+
+type Frame = bytes | str
+
+FLAG_PLAIN = b"\x00"
+FLAG_COMPRESSED = b"\x01"
+
+
+@dataclass(eq=False)
+class OutboundMessage:
+    payload: Any = None
+    text: str | None = None
+    frames: dict[str | None, Frame] = field(default_factory=dict)
+
+    def get_payload(self) -> Any:
+        if self.payload is None and self.text is not None:
+            self.payload = orjson.loads(self.text)
+        return self.payload
+
+    def frame_for(self, codec: WebSocketCodec) -> Frame:
+        frame = self.frames.get(codec.subprotocol)
+        if frame is None:
+            frame = self.frames[codec.subprotocol] = codec.encode(self)
+        return frame
+
+
+class WebSocketCodec(ABC):
+    subprotocol: str | None
+
+    @abstractmethod
+    def encode(self, message: OutboundMessage) -> Frame:
+        ...
+
+
+class JsonCodec(WebSocketCodec):
+    subprotocol = None
+
+    def encode(self, message: OutboundMessage) -> Frame:
+        if message.text is not None:
+            return message.text
+        return orjson.dumps(message.payload).decode()
+
+
+@dataclass(eq=False)
+class MsgpackCodec(WebSocketCodec):
+    subprotocol: str | None = "msgpack"
+    compress: Callable[[bytes], bytes] | None = None
+    compress_threshold: int = 1024
+
+    def encode(self, message: OutboundMessage) -> Frame:
+        body = ormsgpack.packb(message.get_payload())
+        if self.compress is not None and len(body) >= self.compress_threshold:
+            return FLAG_COMPRESSED + self.compress(body)
+        return FLAG_PLAIN + body
+
+
+JSON_CODEC = JsonCodec()
+
+
+def deflate(data: bytes) -> bytes:
+    return zlib.compress(data, wbits=-15)
+
+
+def build_codecs(compress_threshold: int = 1024, zstd_dict: bytes | None = None) -> dict[str, WebSocketCodec]:
+    codecs: list[WebSocketCodec] = []
+    if zstd is not None:
+        options = zstd.ZstdDict(zstd_dict) if zstd_dict else None
+        codecs.append(MsgpackCodec(
+            subprotocol="msgpack+zstd",
+            compress=lambda data: zstd.compress(data, zstd_dict=options),
+            compress_threshold=compress_threshold,
+        ))
+    codecs.extend((
+        MsgpackCodec(subprotocol="msgpack+deflate", compress=deflate, compress_threshold=compress_threshold),
+        MsgpackCodec(subprotocol="msgpack"),
+    ))
+    return {codec.subprotocol: codec for codec in codecs if codec.subprotocol}
+
+
+def negotiate_codec(codecs: dict[str, WebSocketCodec], offered: Iterable[str]) -> WebSocketCodec:
+    offered = set(offered)
+    for subprotocol, codec in codecs.items():
+        if subprotocol in offered:
+            return codec
+    return JSON_CODEC
@@ -0,0 +1,78 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from fastapi import WebSocket
+
+from app.core.utils import now_utc
+from app.core.websockets.codecs import OutboundMessage
+from app.core.websockets.metrics import HEARTBEAT_DEAD, HEARTBEAT_SWEEP_DURATION
+
+
+@dataclass(eq=False)
+class HeartbeatWheel:
+    interval: float
+    on_ping: Callable[[WebSocket, OutboundMessage], None]
+    on_dead: Callable[[WebSocket], Awaitable[None]]
+    slots: int = 32
+    timeout: float | None = None
+    wheel: list[set[WebSocket]] = field(default_factory=list)
+    positions: dict[WebSocket, int] = field(default_factory=dict)
+    last_seen: dict[WebSocket, float] = field(default_factory=dict)
+    cursor: int = 0
+
+    def __post_init__(self) -> None:
+        self.wheel = [set() for _ in range(self.slots)]
+
+    def add(self, websocket: WebSocket) -> None:
+        if websocket in self.positions:
+            return
+
+        slot = (self.cursor - 1) % self.slots
+        self.wheel[slot].add(websocket)
+        self.positions[websocket] = slot
+        self.last_seen[websocket] = time.monotonic()
+
+    def remove(self, websocket: WebSocket) -> None:
+        slot = self.positions.pop(websocket, None)
+        if slot is not None:
+            self.wheel[slot].discard(websocket)
+        self.last_seen.pop(websocket, None)
+
+    def touch(self, websocket: WebSocket) -> None:
+        if websocket in self.last_seen:
+            self.last_seen[websocket] = time.monotonic()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        tick = self.interval / self.slots
+        next_tick = loop.time() + tick
+
+        while True:
+            await asyncio.sleep(max(next_tick - loop.time(), 0))
+            next_tick += tick
+            await self.sweep()
+
+    async def sweep(self) -> None:
+        slot = self.wheel[self.cursor]
+        self.cursor = (self.cursor + 1) % self.slots
+        if not slot:
+            return
+
+        started = time.perf_counter()
+        now = time.monotonic()
+        ping = OutboundMessage(payload={"type": "ping", "ts": now_utc()})
+        dead = []
+        for websocket in slot:
+            if self.timeout is not None and now - self.last_seen[websocket] > self.timeout:
+                dead.append(websocket)
+                continue
+            self.on_ping(websocket, ping)
+
+        for websocket in dead:
+            self.remove(websocket)
+            HEARTBEAT_DEAD.inc()
+            await self.on_dead(websocket)
+
+        HEARTBEAT_SWEEP_DURATION.observe(time.perf_counter() - started)
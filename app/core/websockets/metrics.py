@@ -0,0 +1,29 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+OUTBOUND_QUEUED = Gauge(
+    "ws_outbound_queued_frames",
+    "Frames waiting in per-connection outbound queues",
+)
+OUTBOUND_QUEUE_DEPTH = Histogram(
+    "ws_outbound_queue_depth",
+    "Per-connection outbound queue depth observed on enqueue",
+    buckets=(0, 1, 4, 16, 64, 128, 256, 512, 1024),
+)
+OUTBOUND_DROPPED = Counter(
+    "ws_outbound_dropped_frames",
+    "Frames dropped because a connection outbound queue was full",
+    ["policy"],
+)
+SLOW_CONSUMERS_EVICTED = Counter(
+    "ws_slow_consumers_evicted",
+    "Connections closed because their outbound queue overflowed",
+)
+HEARTBEAT_SWEEP_DURATION = Histogram(
+    "ws_heartbeat_sweep_duration_seconds",
+    "Time spent pinging one heartbeat wheel slot",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1),
+)
+HEARTBEAT_DEAD = Counter(
+    "ws_heartbeat_dead_connections",
+    "Connections closed because no message arrived within the heartbeat timeout",
+)
@@ -0,0 +1,125 @@
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+from fastapi import WebSocket
+
+from app.core.websockets.codecs import JSON_CODEC, Frame, WebSocketCodec
+from app.core.websockets.metrics import (
+    OUTBOUND_DROPPED,
+    OUTBOUND_QUEUE_DEPTH,
+    OUTBOUND_QUEUED,
+    SLOW_CONSUMERS_EVICTED,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FullQueuePolicy(StrEnum):
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+@dataclass(eq=False)
+class ConnectionOutbox:
+    websocket: WebSocket
+    on_close: Callable[[WebSocket, bool], Coroutine[Any, Any, None]]
+    maxsize: int = 256
+    policy: FullQueuePolicy = FullQueuePolicy.DROP_OLDEST
+    codec: WebSocketCodec = JSON_CODEC
+    keys: set[str] = field(default_factory=set)
+    frames: deque[tuple[str | None, Frame]] = field(default_factory=deque)
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    drained: asyncio.Event = field(default_factory=asyncio.Event)
+    writer: asyncio.Task | None = None
+    closed: bool = False
+
+    def start(self) -> None:
+        self.writer = asyncio.create_task(self._write(), name=f"ws:writer:{id(self.websocket)}")
+
+    def put(self, frame: Frame, key: str | None = None) -> bool:
+        if self.closed:
+            return False
+
+        if len(self.frames) >= self.maxsize:
+            match self.policy:
+                case FullQueuePolicy.DROP_OLDEST:
+                    self._discard(1)
+                case FullQueuePolicy.COALESCE:
+                    self._coalesce(key)
+                case FullQueuePolicy.DISCONNECT:
+                    SLOW_CONSUMERS_EVICTED.inc()
+                    self._shutdown(evicted=True)
+                    return False
+
+        OUTBOUND_QUEUE_DEPTH.observe(len(self.frames))
+        self.frames.append((key, frame))
+        OUTBOUND_QUEUED.inc()
+        self.drained.clear()
+        self.ready.set()
+        return True
+
+    async def drain(self, timeout: float) -> None:
+        if self.closed or self.writer is None:
+            return
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self.drained.wait(), timeout)
+
+    async def close(self) -> None:
+        self.closed = True
+        self._clear()
+        if self.writer is not None and self.writer is not asyncio.current_task():
+            self.writer.cancel()
+
+    async def _write(self) -> None:
+        while True:
+            if not self.frames:
+                self.drained.set()
+                self.ready.clear()
+                await self.ready.wait()
+                continue
+
+            _, frame = self.frames.popleft()
+            OUTBOUND_QUEUED.dec()
+            try:
+                if isinstance(frame, bytes):
+                    await self.websocket.send_bytes(frame)
+                else:
+                    await self.websocket.send_text(frame)
+            except Exception: # noqa: BLE001
+                self._shutdown(evicted=False)
+                return
+
+    def _discard(self, count: int) -> None:
+        for _ in range(count):
+            self.frames.popleft()
+        self._dropped(count)
+
+    def _coalesce(self, key: str | None) -> None:
+        # the incoming frame supersedes everything queued for its key; other keys keep their latest state
+        kept = deque(item for item in self.frames if key is None or item[0] != key)
+        dropped = len(self.frames) - len(kept)
+        if not dropped:
+            self._discard(1)
+            return
+        self.frames = kept
+        self._dropped(dropped)
+
+    def _dropped(self, count: int) -> None:
+        OUTBOUND_QUEUED.dec(count)
+        OUTBOUND_DROPPED.labels(policy=self.policy.value).inc(count)
+
+    def _clear(self) -> None:
+        OUTBOUND_QUEUED.dec(len(self.frames))
+        self.frames.clear()
+
+    def _shutdown(self, evicted: bool) -> None:
+        self.closed = True
+        self._clear()
+        asyncio.create_task(self.on_close(self.websocket, evicted)) # noqa: RUF006
@@ -0,0 +1,108 @@
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, cast
+
+from redis.asyncio import Redis
+
+_PIPELINE_BATCH_SIZE = 1000
+
+
+class BasePresenceRegistry(ABC):
+    @abstractmethod
+    async def set_count(self, key: str, count: int) -> None:
+        ...
+
+    @abstractmethod
+    async def refresh(self, counts: Mapping[str, int]) -> None:
+        ...
+
+    @abstractmethod
+    async def is_online(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def count(self, key: str) -> int:
+        ...
+
+    @abstractmethod
+    async def remote_keys(self, keys: Iterable[str]) -> list[str]:
+        ...
+
+    @abstractmethod
+    async def clear(self, keys: Iterable[str]) -> None:
+        ...
+
+
+@dataclass
+class RedisPresenceRegistry(BasePresenceRegistry):
+    client: Redis
+    node_id: str
+    ttl: int = 60
+    prefix: str = "ws:presence"
+
+    async def set_count(self, key: str, count: int) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        self._write(pipe, key, count, time.time())
+        await pipe.execute()
+
+    async def refresh(self, counts: Mapping[str, int]) -> None:
+        now = time.time()
+        items = tuple(counts.items())
+        for idx in range(0, len(items), _PIPELINE_BATCH_SIZE):
+            pipe = self.client.pipeline(transaction=False)
+            for key, count in items[idx:idx + _PIPELINE_BATCH_SIZE]:
+                self._write(pipe, key, count, now)
+            await pipe.execute()
+
+    async def is_online(self, key: str) -> bool:
+        return await self.client.zcount(self._nodes_key(key), time.time(), "+inf") > 0
+
+    async def count(self, key: str) -> int:
+        nodes = await self.client.zrangebyscore(self._nodes_key(key), time.time(), "+inf")
+        if not nodes:
+            return 0
+
+        counts = await self.client.hmget(self._counts_key(key), cast(list[bytes | str], nodes))
+        return sum(int(count) for count in counts if count)
+
+    async def remote_keys(self, keys: Iterable[str]) -> list[str]:
+        now = time.time()
+        keys = tuple(keys)
+        remote: list[str] = []
+        for idx in range(0, len(keys), _PIPELINE_BATCH_SIZE):
+            batch = keys[idx:idx + _PIPELINE_BATCH_SIZE]
+            pipe = self.client.pipeline(transaction=False)
+            for key in batch:
+                pipe.zrangebyscore(self._nodes_key(key), now, "+inf")
+            results = await pipe.execute()
+            remote.extend(
+                key for key, nodes in zip(batch, results, strict=True)
+                if any(self._decode(node) != self.node_id for node in nodes)
+            )
+        return remote
+
+    async def clear(self, keys: Iterable[str]) -> None:
+        await self.refresh(dict.fromkeys(keys, 0))
+
+    def _write(self, pipe: Any, key: str, count: int, now: float) -> None:
+        nodes_key, counts_key = self._nodes_key(key), self._counts_key(key)
+        if count <= 0:
+            pipe.zrem(nodes_key, self.node_id)
+            pipe.hdel(counts_key, self.node_id)
+            return
+
+        pipe.zadd(nodes_key, {self.node_id: now + self.ttl})
+        pipe.hset(counts_key, self.node_id, count)
+        pipe.expire(nodes_key, self.ttl)
+        pipe.expire(counts_key, self.ttl)
+
+    def _nodes_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _counts_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}:counts"
+
+    def _decode(self, value: bytes | str) -> str:
+        return value.decode() if isinstance(value, bytes) else value
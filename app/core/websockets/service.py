@@ -1,64 +1,108 @@
 import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import Any
+from uuid import uuid4
 
 import orjson
 from fastapi import WebSocket
 from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
 from starlette.websockets import WebSocketState
 
-from app.core.utils import now_utc
 from app.core.websockets.base import BaseConnectionManager
+from app.core.websockets.codecs import (
+    JSON_CODEC,
+    Frame,
+    OutboundMessage,
+    WebSocketCodec,
+    build_codecs,
+    negotiate_codec,
+)
+from app.core.websockets.heartbeat import HeartbeatWheel
+from app.core.websockets.outbox import ConnectionOutbox, FullQueuePolicy
+from app.core.websockets.presence import BasePresenceRegistry, RedisPresenceRegistry
 
 logger = logging.getLogger(__name__)
 _PUBLISH_BATCH_SIZE = 1000
+# relayed payloads start with "\x1ev1:<node_id>\x1e"; a JSON or text frame can never begin with \x1e
+RELAY_HEADER = "\x1ev1:"
+RELAY_SEPARATOR = "\x1e"
 
 
 @dataclass
 class ConnectionManager(BaseConnectionManager):
     redis: Redis
     lock_map: dict[str, asyncio.Lock] = field(default_factory=dict)
-
-    async def _heartbeat_loop(self) -> None:
-        while True:
-            await asyncio.sleep(self.heartbeat_interval)
-
-            all_sockets = set()
-            for conns in self.connections_map.values():
-                all_sockets.update(conns)
-
-            if not all_sockets:
-                continue
-
-            payload = {"type": "ping", "ts": now_utc().isoformat()}
-
-            await asyncio.gather(
-                *(ws.send_json(payload) for ws in all_sockets),
-                return_exceptions=True,
-            )
+    sharded_pubsub: bool = field(default=False, kw_only=True)
+    pubsub: PubSub | None = field(default=None, kw_only=True)
+    has_subscriptions: asyncio.Event = field(default_factory=asyncio.Event, kw_only=True)
+    send_queue_size: int = field(default=256, kw_only=True)
+    full_queue_policy: FullQueuePolicy = field(default=FullQueuePolicy.DROP_OLDEST, kw_only=True)
+    close_timeout: float = field(default=5.0, kw_only=True)
+    outboxes: dict[WebSocket, ConnectionOutbox] = field(default_factory=dict, kw_only=True)
+    heartbeat_slots: int = field(default=32, kw_only=True)
+    heartbeat_timeout: float | None = field(default=None, kw_only=True)
+    heartbeat: HeartbeatWheel = field(init=False)
+    node_id: str = field(default_factory=lambda: uuid4().hex, kw_only=True)
+    dispatch_workers: int = field(default=4, kw_only=True)
+    dispatch_queue_size: int = field(default=1024, kw_only=True)
+    dispatch_batch_size: int = field(default=64, kw_only=True)
+    presence_ttl: int | None = field(default=None, kw_only=True)
+    presence: BasePresenceRegistry | None = field(default=None, kw_only=True)
+    compress_threshold: int = field(default=1024, kw_only=True)
+    zstd_dict: bytes | None = field(default=None, kw_only=True)
+    codecs: dict[str, WebSocketCodec] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.codecs = build_codecs(compress_threshold=self.compress_threshold, zstd_dict=self.zstd_dict)
+        self.heartbeat = HeartbeatWheel(
+            interval=self.heartbeat_interval,
+            on_ping=self._enqueue,
+            on_dead=self._close_dead,
+            slots=self.heartbeat_slots,
+            timeout=self.heartbeat_timeout,
+        )
+        if self.presence is None and self.presence_ttl:
+            self.presence = RedisPresenceRegistry(client=self.redis, node_id=self.node_id, ttl=self.presence_ttl)
 
     def _ensure_heartbeat(self) -> None:
         if self.heartbeat_task and not self.heartbeat_task.done():
             return
 
         self.heartbeat_task = asyncio.create_task(
-            self._heartbeat_loop(), name="ws:heartbeat:sweeper"
+            self.heartbeat.run(), name="ws:heartbeat:wheel"
         )
 
     async def accept_connection(self, websocket: WebSocket, key: str, subprotocol: str | None=None) -> None:
+        if subprotocol is None:
+            codec = negotiate_codec(self.codecs, websocket.scope.get("subprotocols", ()))
+            subprotocol = codec.subprotocol
+        else:
+            codec = self.codecs.get(subprotocol, JSON_CODEC)
+
         await websocket.accept(subprotocol=subprotocol)
+        self._get_outbox(websocket, codec)
         await self.bind_connection(websocket=websocket, key=key)
 
     async def bind_connection(self, websocket: WebSocket, key: str) -> None:
         if websocket.client_state == WebSocketState.DISCONNECTED:
             return
 
-        if key not in self.lock_map:
-            self.lock_map[key] = asyncio.Lock()
-
-        async with self.lock_map[key]:
+        async with self._key_lock(key, create=True):
+            is_first = key not in self.connections_map
             self.connections_map[key].add(websocket)
+            self._get_outbox(websocket).keys.add(key)
+            if is_first:
+                await self._subscribe(key)
+            if self.presence is not None:
+                await self.presence.set_count(key, len(self.connections_map[key]))
+
+    def mark_alive(self, websocket: WebSocket) -> None:
+        self.heartbeat.touch(websocket)
 
     async def bind_key_connections(self, source_key: str, target_key: str) -> None:
         sockets = tuple(self.connections_map.get(source_key, ()))
@@ -71,86 +115,300 @@ class ConnectionManager(BaseConnectionManager):
             await self.remove_connection(websocket, target_key)
 
     async def remove_connection(self, websocket: WebSocket, key: str) -> None:
-        lock = self.lock_map.get(key)
-        if lock is None:
-            return
+        async with self._key_lock(key, create=False) as held:
+            if not held:
+                return
 
-        async with lock:
             self.connections_map[key].discard(websocket)
-            if not self.connections_map[key]:
+            await self._release_outbox(websocket, key)
+            count = len(self.connections_map[key])
+            if not count:
                 del self.connections_map[key]
+                await self._unsubscribe(key)
+            if self.presence is not None:
+                await self.presence.set_count(key, count)
+            if not count:
+                # retired only after UNSUBSCRIBE went out; waiters on it re-resolve the lock and subscribe again
                 del self.lock_map[key]
 
+    async def is_online(self, key: str) -> bool:
+        if self.presence is None:
+            return key in self.connections_map
+        return await self.presence.is_online(key)
+
+    async def count_connections(self, key: str) -> int:
+        if self.presence is None:
+            return len(self.connections_map.get(key, ()))
+        return await self.presence.count(key)
+
     async def send_all(self, key: str, bytes_: bytes) -> None:
-        for websocket in self.connections_map[key]:
-            try:
-                await websocket.send_bytes(bytes_)
-            except Exception: # noqa: BLE001
-                await self.remove_connection(websocket, key)
+        self._broadcast(key, bytes_)
 
     async def send_json_all(self, key: str, data: dict[str, Any]) -> None:
-        tasks = [
-            websocket.send_json(data)
-            for websocket in self.connections_map[key]
-        ]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        self._broadcast(key, OutboundMessage(payload=data))
 
     async def disconnect_all(self, key: str) -> None:
-        async with self.lock_map[key]:
-            for websocket in self.connections_map[key]:
-                await websocket.send_json({
-                    "message": "Abort connection",
-                })
-                await websocket.close()
+        async with self._key_lock(key, create=False) as held:
+            websockets = tuple(self.connections_map.get(key, ())) if held else ()
+
+        message = OutboundMessage(payload={"message": "Abort connection"})
+        for websocket in websockets:
+            self._enqueue(websocket, message, key)
+        await asyncio.gather(*(self._close_drained(websocket) for websocket in websockets))
 
     async def publish(self, key: str, payload: dict) -> None:
         if self.redis is None:
             raise RuntimeError("Manager not started")
 
-        await self.redis.publish(
-            f"ws:{key}",
-            orjson.dumps(payload),
-        )
+        data = orjson.dumps(payload)
+        self._broadcast(key, OutboundMessage(payload=payload, text=data.decode()))
+        await self._publish_command(self.redis)(self._channel(key), self._relay(data))
 
     async def publish_bulk(self, keys: list[str], payload: dict) -> None:
         if not keys:
             return
 
-        serialized_payload = orjson.dumps(payload)
+        data = orjson.dumps(payload)
+        message = OutboundMessage(payload=payload, text=data.decode())
+        relayed = self._relay(data)
         unique_keys = tuple(dict.fromkeys(keys))
+        for key in unique_keys:
+            self._broadcast(key, message)
+
+        if self.presence is not None:
+            unique_keys = tuple(await self.presence.remote_keys(unique_keys))
+
         for idx in range(0, len(unique_keys), _PUBLISH_BATCH_SIZE):
             batch = unique_keys[idx:idx + _PUBLISH_BATCH_SIZE]
             pipe = self.redis.pipeline(transaction=False)
+            publish = self._publish_command(pipe)
             for key in batch:
-                pipe.publish(f"ws:{key}", serialized_payload)
+                publish(self._channel(key), relayed)
             await pipe.execute()
 
     async def startup(self) -> None:
         self._ensure_heartbeat()
-        pubsub = self.redis.pubsub()
-        await pubsub.psubscribe("ws:*")
+        pubsub = self._get_pubsub()
+        queue: asyncio.Queue[tuple[str, list[str]]] = asyncio.Queue(maxsize=self.dispatch_queue_size)
+        workers = [
+            asyncio.create_task(self._dispatch_worker(queue), name=f"ws:dispatch:{idx}")
+            for idx in range(self.dispatch_workers)
+        ]
+        if self.presence is not None:
+            workers.append(asyncio.create_task(self._presence_loop(self.presence), name="ws:presence"))
 
         try:
-            async for message in pubsub.listen():
-                if message["type"] != "pmessage":
+            while True:
+                if not pubsub.subscribed:
+                    self.has_subscriptions.clear()
+                    await self.has_subscriptions.wait()
+                    continue
+
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is None:
                     continue
 
-                asyncio.create_task(self._dispatch(message))  # noqa: RUF006
+                batch = [message]
+                while len(batch) < self.dispatch_batch_size:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0)
+                    if message is None:
+                        break
+                    batch.append(message)
+
+                for group in self._group_by_channel(batch):
+                    await queue.put(group)
         finally:
-            await pubsub.unsubscribe()
+            for worker in workers:
+                worker.cancel()
+            await pubsub.aclose()  # type: ignore[no-untyped-call]
+            self.pubsub = None
 
-    async def _dispatch(self, message: dict) -> None:
-        channel = message["channel"].decode().removeprefix("ws:")
-        try:
-            payload = orjson.loads(message["data"])
-            await self.send_json_all(channel, payload)
-        except Exception:
-            logger.exception("Dispatch error for channel %s", channel)
+    async def _presence_loop(self, presence: BasePresenceRegistry) -> None:
+        interval = (self.presence_ttl or 60) / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await presence.refresh({key: len(conns) for key, conns in self.connections_map.items()})
+            except Exception:
+                logger.exception("Presence refresh failed")
+
+    async def _dispatch_worker(self, queue: asyncio.Queue[tuple[str, list[str]]]) -> None:
+        while True:
+            channel, frames = await queue.get()
+            try:
+                websockets = tuple(self.connections_map.get(channel, ()))
+                for frame in frames:
+                    message = OutboundMessage(text=frame)
+                    for websocket in websockets:
+                        self._enqueue(websocket, message, channel)
+            except Exception:
+                logger.exception("Dispatch error for channel %s", channel)
+            finally:
+                queue.task_done()
+
+    def _group_by_channel(self, messages: list[dict]) -> list[tuple[str, list[str]]]:
+        groups: list[tuple[str, list[str]]] = []
+        for message in messages:
+            if message["type"] not in ("message", "smessage"):
+                continue
+
+            frame = self._unrelay(message["data"])
+            if frame is None:
+                continue
+
+            channel = message["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            channel = channel.removeprefix("ws:")
+
+            if groups and groups[-1][0] == channel:
+                groups[-1][1].append(frame)
+            else:
+                groups.append((channel, [frame]))
+        return groups
+
+    def _relay(self, data: bytes) -> bytes:
+        return f"{RELAY_HEADER}{self.node_id}{RELAY_SEPARATOR}".encode() + data
+
+    def _unrelay(self, data: bytes | str) -> str | None:
+        if isinstance(data, bytes):
+            data = data.decode()
+        if not data.startswith(RELAY_HEADER):
+            return data
+
+        origin, separator, frame = data[len(RELAY_HEADER):].partition(RELAY_SEPARATOR)
+        if not separator:
+            return data
+        if origin == self.node_id:
+            return None
+        return frame
+
+    def _broadcast(self, key: str, frame: Frame | OutboundMessage) -> None:
+        for websocket in tuple(self.connections_map.get(key, ())):
+            self._enqueue(websocket, frame, key)
+
+    def _enqueue(self, websocket: WebSocket, frame: Frame | OutboundMessage, key: str | None = None) -> None:
+        outbox = self.outboxes.get(websocket)
+        if outbox is None:
+            return
+
+        if isinstance(frame, OutboundMessage):
+            frame = frame.frame_for(outbox.codec)
+        outbox.put(frame, key)
+
+    def _get_outbox(self, websocket: WebSocket, codec: WebSocketCodec = JSON_CODEC) -> ConnectionOutbox:
+        outbox = self.outboxes.get(websocket)
+        if outbox is None:
+            outbox = ConnectionOutbox(
+                websocket=websocket,
+                on_close=self._on_outbox_closed,
+                maxsize=self.send_queue_size,
+                policy=self.full_queue_policy,
+                codec=codec,
+            )
+            outbox.start()
+            self.outboxes[websocket] = outbox
+            self.heartbeat.add(websocket)
+        return outbox
+
+    async def _release_outbox(self, websocket: WebSocket, key: str) -> None:
+        outbox = self.outboxes.get(websocket)
+        if outbox is None:
+            return
+
+        outbox.keys.discard(key)
+        if not outbox.keys:
+            del self.outboxes[websocket]
+            self.heartbeat.remove(websocket)
+            await outbox.close()
+
+    async def _close_drained(self, websocket: WebSocket) -> None:
+        outbox = self.outboxes.get(websocket)
+        if outbox is not None:
+            await outbox.drain(self.close_timeout)
+
+        with contextlib.suppress(Exception):
+            await websocket.close()
+
+    async def _close_dead(self, websocket: WebSocket) -> None:
+        outbox = self.outboxes.get(websocket)
+        for key in tuple(outbox.keys if outbox else ()):
+            await self.remove_connection(websocket, key)
+
+        with contextlib.suppress(Exception):
+            await websocket.close(code=1001, reason="Heartbeat timeout")
+
+    async def _on_outbox_closed(self, websocket: WebSocket, evicted: bool) -> None:
+        outbox = self.outboxes.get(websocket)
+        if outbox is None:
+            return
+
+        keys = tuple(outbox.keys)
+        for key in keys:
+            await self.remove_connection(websocket, key)
+
+        if evicted:
+            logger.warning("Evicted slow websocket consumer", extra={"keys": keys})
+            with contextlib.suppress(Exception):
+                await websocket.close(code=1013, reason="Slow consumer")
+
+    @asynccontextmanager
+    async def _key_lock(self, key: str, create: bool) -> AsyncIterator[bool]:
+        while True:
+            lock = self.lock_map.setdefault(key, asyncio.Lock()) if create else self.lock_map.get(key)
+            if lock is None:
+                yield False
+                return
+
+            async with lock:
+                if self.lock_map.get(key) is lock:
+                    yield True
+                    return
+
+    def _channel(self, key: str) -> str:
+        return f"ws:{key}"
+
+    def _get_pubsub(self) -> PubSub:
+        if self.pubsub is None:
+            self.pubsub = self.redis.pubsub()
+        return self.pubsub
+
+    def _publish_command(self, client: Any) -> Any:
+        return client.spublish if self.sharded_pubsub else client.publish
+
+    async def _subscribe(self, key: str) -> None:
+        pubsub = self._get_pubsub()
+        if self.sharded_pubsub:
+            await pubsub.ssubscribe(self._channel(key))
+        else:
+            await pubsub.subscribe(self._channel(key))
+        self.has_subscriptions.set()
+
+    async def _unsubscribe(self, key: str) -> None:
+        if self.pubsub is None:
+            return
+
+        if self.sharded_pubsub:
+            await self.pubsub.sunsubscribe(self._channel(key))
+        else:
+            await self.pubsub.unsubscribe(self._channel(key))
 
     async def shutdown(self) -> None:
         if self.heartbeat_task and not self.heartbeat_task.done():
             self.heartbeat_task.cancel()
 
+        for outbox in tuple(self.outboxes.values()):
+            await outbox.close()
+        self.outboxes.clear()
+
+        if self.presence is not None:
+            with contextlib.suppress(Exception):
+                await self.presence.clear(tuple(self.connections_map))
+
+        if self.pubsub is not None:
+            await self.pubsub.aclose()  # type: ignore[no-untyped-call]
+            self.pubsub = None
+
         if self.redis:
             await self.redis.aclose()
 
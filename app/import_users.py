@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+from app.auth.commands.users.import_users import ImportUsersCommand
+from app.auth.config import auth_config
+from app.auth.dtos.user import ImportUsersReportDTO
+from app.auth.models.role_permission import RolesEnum
+from app.auth.services.user_import import ImportFormat
+from app.core.di.container import create_container
+from app.core.log.init import configure_logging
+from app.core.mediators.base import BaseMediator
+from app.core.message_brokers.base import BaseMessageBroker
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Bulk import users from CSV or NDJSON")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", type=ImportFormat, choices=list(ImportFormat), dest="import_format")
+    parser.add_argument("--role", default=RolesEnum.STANDARD_USER.value.name, help="role assigned to imported users")
+    parser.add_argument("--batch-size", type=int, default=auth_config.USER_IMPORT_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=auth_config.USER_IMPORT_HASH_WORKERS, help="hashing processes")
+    parser.add_argument("--report", type=Path, help="write invalid rows and conflicts as JSON")
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> ImportUsersReportDTO:
+    container = create_container()
+    message_broker = await container.get(BaseMessageBroker)
+    await message_broker.start()
+
+    try:
+        mediator = await container.get(BaseMediator)
+        report: ImportUsersReportDTO = await mediator.handle_command(ImportUsersCommand(
+            path=str(args.path),
+            import_format=args.import_format or ImportFormat(args.path.suffix.lstrip(".").lower()),
+            role_name=args.role,
+            batch_size=args.batch_size,
+            workers=args.workers,
+        ))
+    finally:
+        await message_broker.close()
+        await container.close()
+
+    if args.report is not None:
+        args.report.write_text(report.model_dump_json(indent=2))
+        logger.info("Import report written", extra={"path": str(args.report)})
+    return report
+
+
+def main() -> None:
+    configure_logging()
+    asyncio.run(run(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
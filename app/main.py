@@ -9,7 +9,6 @@ from fastapi import FastAPI, Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.utils import get_openapi
-from fastapi_limiter import FastAPILimiter
 from prometheus_fastapi_instrumentator.instrumentation import PrometheusFastApiInstrumentator
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.middleware.cors import CORSMiddleware
@@ -24,7 +23,12 @@ from app.core.exceptions import ApplicationError, ValidationError
 from app.core.log.init import configure_logging
 from app.core.message_brokers.base import BaseMessageBroker
 from app.core.middlewares.context import ContextMiddleware
+from app.core.middlewares.load_shedding import AIMDLimiter, LoadSheddingMiddleware
 from app.core.middlewares.log import LoggingMiddleware
+from app.core.middlewares.profiling import ProfilingMiddleware
+from app.core.middlewares.query_budget import QueryBudgetMiddleware
+from app.core.middlewares.timing import TimingMiddleware
+from app.core.profiling.router import router as profiling_router
 from app.core.routers import router as core_router
 from app.core.utils import now_utc
 from app.init_data import init_data
@@ -42,7 +46,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         await init_data(session)
 
     redis_client = await app.state.dishka_container.get(redis.Redis)
-    await FastAPILimiter.init(redis_client)
     message_broker: BaseMessageBroker = await app.state.dishka_container.get(BaseMessageBroker)
     await message_broker.start()
 
@@ -54,7 +57,26 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
 
 
 def setup_middleware(app: FastAPI) -> None:
+    if app_config.PROFILING_ENABLED:
+        app.add_middleware(
+            ProfilingMiddleware,
+            sample_rate=app_config.PROFILING_SAMPLE_RATE,
+            route_pattern=app_config.PROFILING_ROUTE_PATTERN,
+            slow_threshold=app_config.PROFILING_SLOW_THRESHOLD,
+            interval=app_config.PROFILING_INTERVAL,
+            max_concurrent=app_config.PROFILING_MAX_CONCURRENT,
+        )
+    if app_config.QUERY_BUDGET_ENABLED:
+        app.add_middleware(
+            QueryBudgetMiddleware,
+            default_budget=app_config.QUERY_BUDGET_DEFAULT,
+            budgets=app_config.QUERY_BUDGETS,
+            repeat_threshold=app_config.QUERY_REPEAT_THRESHOLD,
+            raise_on_exceed=app_config.QUERY_BUDGET_RAISE or app_config.ENVIRONMENT == "testing",
+        )
     app.add_middleware(LoggingMiddleware)
+    if app_config.REQUEST_TIMING_ENABLED:
+        app.add_middleware(TimingMiddleware, server_timing=app_config.SERVER_TIMING_HEADER)
     app.add_middleware(GZipMiddleware, minimum_size=1000)
 
     if app_config.BACKEND_CORS_ORIGINS:
@@ -66,11 +88,24 @@ def setup_middleware(app: FastAPI) -> None:
             allow_headers=["*"],
         )
 
+    if app_config.LOAD_SHEDDING_ENABLED:
+        app.add_middleware(
+            LoadSheddingMiddleware,
+            limiter=AIMDLimiter(
+                limit=app_config.LOAD_SHEDDING_INITIAL_LIMIT,
+                min_limit=app_config.LOAD_SHEDDING_MIN_LIMIT,
+                max_limit=app_config.LOAD_SHEDDING_MAX_LIMIT,
+                latency_target=app_config.LOAD_SHEDDING_LATENCY_TARGET,
+                backoff=app_config.LOAD_SHEDDING_BACKOFF,
+            ),
+            retry_after=app_config.LOAD_SHEDDING_RETRY_AFTER,
+        )
     app.add_middleware(ContextMiddleware)
 
 
 def setup_router(app: FastAPI) -> None:
     app.include_router(core_router)
+    app.include_router(profiling_router, prefix=f"{app_config.API_V1_STR}/profiling")
 
     app.include_router(auth_router_v1, prefix=app_config.API_V1_STR)
 
@@ -93,6 +128,7 @@ def handle_application_exception(request: Request, exc: ApplicationError) -> ORJ
             request_id=request.state.request_id,
             timestamp=now_utc().timestamp()
         ),
+        headers=exc.headers,
     )
 
 def handle_validation_exception(request: Request, exc: RequestValidationError) -> ORJSONResponse:
@@ -0,0 +1,67 @@
+import argparse
+import asyncio
+import logging
+from datetime import datetime
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs.app import app_config
+from app.core.di.container import create_container
+from app.core.events.replay import EventReplayer, RedisReplayCheckpointStore
+from app.core.log.init import configure_logging
+from app.core.message_brokers.base import BaseMessageBroker
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay events_log into the message broker")
+    parser.add_argument("--topic", required=True)
+    parser.add_argument("--name", default="default", help="checkpoint name, reuse it to resume a replay")
+    parser.add_argument("--since", type=datetime.fromisoformat)
+    parser.add_argument("--until", type=datetime.fromisoformat)
+    parser.add_argument("--event", action="append", dest="events", help="event_name filter, repeatable")
+    parser.add_argument("--batch-size", type=int, default=app_config.EVENTS_REPLAY_BATCH_SIZE)
+    parser.add_argument("--rate", type=int, default=app_config.EVENTS_REPLAY_RATE_LIMIT, help="events per second")
+    parser.add_argument("--reset", action="store_true", help="drop the checkpoint and start from the beginning")
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> None:
+    container = create_container()
+    message_broker = await container.get(BaseMessageBroker)
+    checkpoints = RedisReplayCheckpointStore(client=await container.get(Redis))
+    await message_broker.start()
+
+    try:
+        if args.reset:
+            await checkpoints.reset(args.name)
+
+        async with container() as request_container:
+            replayer = EventReplayer(
+                session=await request_container.get(AsyncSession),
+                message_broker=message_broker,
+                checkpoints=checkpoints,
+                batch_size=args.batch_size,
+                rate_limit=args.rate,
+            )
+            await replayer.replay(
+                name=args.name,
+                topic=args.topic,
+                since=args.since,
+                until=args.until,
+                event_names=args.events,
+            )
+    finally:
+        await message_broker.close()
+        await container.close()
+
+
+def main() -> None:
+    configure_logging()
+    asyncio.run(run(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
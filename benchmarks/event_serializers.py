@@ -0,0 +1,60 @@
+import argparse
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+import orjson
+
+from app.core.events.event import BaseEvent
+from app.core.message_brokers.converters import EventSerializerRegistry
+
+
+@dataclass(frozen=True)
+class BenchEvent(BaseEvent):
+    user_id: int
+    session_id: int
+    reason: str
+    old_value: str | None
+    new_value: str | None
+
+    __event_name__: str = "bench.session.suspicious"
+
+    def get_partition_key(self) -> str:
+        return str(self.user_id)
+
+
+def asdict_encode(event: BaseEvent) -> bytes:
+    data = asdict(event)
+    data["event_name"] = event.get_name()
+    return orjson.dumps(data)
+
+
+def measure(name: str, func: Callable[[], object], iterations: int) -> None:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - started
+    print(f"{name:<32} {iterations / elapsed:>12,.0f} ops/s  ({elapsed * 1e9 / iterations:,.0f} ns/op)")
+
+
+def run(iterations: int) -> None:
+    registry = EventSerializerRegistry()
+    event = BenchEvent(user_id=1, session_id=2, reason="ip_changed", old_value="10.0.0.1", new_value="10.0.0.2")
+    payload = registry.encode(event)
+    assert payload == asdict_encode(event)
+
+    measure("encode: asdict + orjson", lambda: asdict_encode(event), iterations)
+    measure("encode: precompiled", lambda: registry.encode(event), iterations)
+    measure("decode: precompiled", lambda: registry.decode(payload), iterations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Event serializer throughput")
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    run(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
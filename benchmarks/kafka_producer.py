@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.core.events.event import BaseEvent
+from app.core.message_brokers.kafka import KafkaMessageBroker
+
+
+@dataclass(frozen=True)
+class BenchEvent(BaseEvent):
+    user_id: int
+    username: str
+
+    __event_name__: str = "bench.user.created"
+
+    def get_partition_key(self) -> str:
+        return str(self.user_id)
+
+
+@dataclass
+class LocalKafkaStandIn:
+    rtt: float
+    linger: float
+    _batch: list[asyncio.Future] = field(default_factory=list)
+    _flusher: asyncio.Task | None = None
+
+    async def send(self, topic: str, key: bytes | None = None, value: bytes | None = None) -> asyncio.Future:
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._batch.append(fut)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush())
+        return fut
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(self.linger)
+        batch, self._batch = self._batch, []
+        await asyncio.sleep(self.rtt)
+        for fut in batch:
+            fut.set_result(None)
+
+    async def start(self) -> None:
+        ...
+
+    async def stop(self) -> None:
+        ...
+
+
+async def bench_send_data(broker: KafkaMessageBroker, events: list[BenchEvent]) -> None:
+    for event in events:
+        await broker.send_data(event.get_partition_key(), "bench", {"user_id": event.user_id})
+
+
+async def bench_send_event_flush(broker: KafkaMessageBroker, events: list[BenchEvent]) -> None:
+    for event in events:
+        await broker.send_event(event.get_partition_key(), "bench", event)
+    await broker.flush()
+
+
+async def bench_send_events_batch(broker: KafkaMessageBroker, events: list[BenchEvent]) -> None:
+    await broker.send_events_batch("bench", events)
+
+
+async def run(messages: int, rtt: float, linger: float) -> None:
+    events = [BenchEvent(user_id=i, username=f"user{i}") for i in range(messages)]
+    consumer: Any = None
+
+    for name, bench in (
+        ("send_data (await per message)", bench_send_data),
+        ("send_event + flush", bench_send_event_flush),
+        ("send_events_batch", bench_send_events_batch),
+    ):
+        broker = KafkaMessageBroker(producer=LocalKafkaStandIn(rtt=rtt, linger=linger), consumer=consumer) # type: ignore[arg-type]
+        started = time.perf_counter()
+        await bench(broker, events)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<32} {messages / elapsed:>12,.0f} msg/s  ({elapsed:.3f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="KafkaMessageBroker producer throughput")
+    parser.add_argument("--messages", type=int, default=2_000)
+    parser.add_argument("--rtt-ms", type=float, default=2.0)
+    parser.add_argument("--linger-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.messages, args.rtt_ms / 1000, args.linger_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
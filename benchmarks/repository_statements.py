@@ -0,0 +1,145 @@
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Select, select
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.auth.models.effective_permissions import UserEffectivePermissions
+from app.auth.models.permission import Permission
+from app.auth.models.role import Role
+from app.auth.models.session import Session
+from app.auth.models.user import User
+from app.auth.repositories import permission, role, session, user
+from app.core import models  # noqa: F401
+from app.core.db.statements import hot_statements, warm_statements
+
+
+@dataclass(frozen=True)
+class RepositoryCall:
+    name: str
+    build: Callable[[], Select]
+    statement: Select
+    params: dict[str, Any]
+
+
+def authorization() -> Select:
+    return select(User, UserEffectivePermissions).join(
+        UserEffectivePermissions, UserEffectivePermissions.user_id == User.id
+    ).where(User.deleted_at.is_(None)).execution_options(populate_existing=True)
+
+
+CALLS = (
+    RepositoryCall(
+        "user.get_authorization_by_id",
+        lambda: authorization().where(User.id == 1),
+        user.GET_AUTHORIZATION_BY_ID, {"user_id": 1},
+    ),
+    RepositoryCall(
+        "user.get_authorization_by_email",
+        lambda: authorization().where(User.email == "bench@example.com"),
+        user.GET_AUTHORIZATION_BY_EMAIL, {"email": "bench@example.com"},
+    ),
+    RepositoryCall(
+        "user.get_authorization_by_username",
+        lambda: authorization().where(User.username == "benchuser"),
+        user.GET_AUTHORIZATION_BY_USERNAME, {"username": "benchuser"},
+    ),
+    RepositoryCall(
+        "session.get_active_by_device",
+        lambda: select(Session).where(Session.user_id == 1, Session.device_id == "device", Session.is_active),
+        session.GET_ACTIVE_BY_DEVICE, {"user_id": 1, "device_id": "device"},
+    ),
+    RepositoryCall(
+        "user.get_by_email",
+        lambda: User.select_not_deleted().where(User.email == "bench@example.com"),
+        user.GET_BY_EMAIL, {"email": "bench@example.com"},
+    ),
+    RepositoryCall(
+        "user.get_by_username",
+        lambda: User.select_not_deleted().where(User.username == "benchuser"),
+        user.GET_BY_USERNAME, {"username": "benchuser"},
+    ),
+    RepositoryCall(
+        "user.get_by_id",
+        lambda: User.select_not_deleted().where(User.id == 1),
+        user.GET_BY_ID, {"user_id": 1},
+    ),
+    RepositoryCall(
+        "role.get_by_name",
+        lambda: select(Role).where(Role.name == "user"),
+        role.GET_BY_NAME, {"name": "user"},
+    ),
+    RepositoryCall(
+        "session.get_by_id",
+        lambda: select(Session).where(Session.id == 1),
+        session.GET_BY_ID, {"session_id": 1},
+    ),
+    RepositoryCall(
+        "permission.get_by_name",
+        lambda: select(Permission).where(Permission.name == "user:view"),
+        permission.GET_BY_NAME, {"name": "user:view"},
+    ),
+)
+
+
+def report(name: str, iterations: int, elapsed: float) -> None:
+    print(f"{name:<48} {iterations / elapsed:>12,.0f} ops/s  ({elapsed * 1e6 / iterations:,.1f} us/op)")
+
+
+def run_compile(iterations: int) -> None:
+    dialect = asyncpg_dialect()
+    cache: dict[Any, Any] = {}
+
+    def lookup(statement: Select) -> None:
+        # same path Connection.execute takes: cache key, then compiled cache lookup
+        statement._compile_w_cache(dialect=dialect, compiled_cache=cache, column_keys=[])
+
+    for call in CALLS:
+        for label, make in (("ad hoc", call.build), ("registered", lambda call=call: call.statement)):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                lookup(make())
+            report(f"{call.name} [{label}]", iterations, time.perf_counter() - started)
+
+
+async def run_database(dsn: str, iterations: int, warm: bool) -> None:
+    engine = create_async_engine(dsn, pool_size=1, max_overflow=0)
+    if warm:
+        warm_statements(engine.sync_engine)
+
+    async with AsyncSession(engine) as db:
+        for call in CALLS:
+            for label, execute in (
+                ("ad hoc", lambda call=call: db.execute(call.build())),
+                ("registered", lambda call=call: db.execute(call.statement, call.params)),
+            ):
+                await execute()
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    await execute()
+                report(f"{call.name} [{label}]", iterations, time.perf_counter() - started)
+            await db.rollback()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hot repository statements: ad hoc select() vs registry")
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--dsn", help="postgresql+asyncpg:// URL; without it only statement build and compile lookup")
+    parser.add_argument("--no-warm", action="store_true", help="do not prepare registered statements on connect")
+    args = parser.parse_args()
+
+    print(f"{len(hot_statements)} registered statements")
+    if args.dsn is None:
+        run_compile(args.iterations)
+    else:
+        asyncio.run(run_database(args.dsn, args.iterations, warm=not args.no_warm))
+
+
+if __name__ == "__main__":
+    main()
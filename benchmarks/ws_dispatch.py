@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
+
+import orjson
+
+from app.core.websockets.service import ConnectionManager
+from benchmarks.ws_fanout import LocalRedisStandIn, PatternConnectionManager, StandInWebSocket
+
+
+@dataclass
+class LegacyConnectionManager(PatternConnectionManager):
+    async def publish(self, key: str, payload: dict) -> None:
+        await self.redis.publish(self._channel(key), self._relay(orjson.dumps(payload)))
+
+    def _unrelay(self, data: bytes | str) -> str | None:
+        if isinstance(data, bytes):
+            data = data.decode()
+        return data.partition("|")[2]
+
+
+async def wait_delivered(sockets: list[StandInWebSocket], expected: int) -> None:
+    while sum(websocket.received for websocket in sockets) < expected:
+        await asyncio.sleep(0)
+
+
+async def run_burst(
+    manager_type: type[ConnectionManager], channels: int, sockets_per_channel: int, burst: int, remote: bool
+) -> float:
+    hub = LocalRedisStandIn()
+    manager = manager_type(redis=hub, heartbeat_interval=3600, send_queue_size=burst) # type: ignore[arg-type]
+    sockets = []
+    for channel in range(channels):
+        for _ in range(sockets_per_channel):
+            websocket = StandInWebSocket()
+            sockets.append(websocket)
+            await manager.bind_connection(websocket, f"room:{channel}") # type: ignore[arg-type]
+
+    listener = asyncio.create_task(manager.startup())
+    await asyncio.sleep(0)
+
+    payload = {"type": "tick", "value": 1}
+    relayed = b"remote|" + orjson.dumps(payload)
+    run_length = max(burst // (channels * 4), 1)
+    started = time.perf_counter()
+    for idx in range(burst):
+        key = f"room:{(idx // run_length) % channels}"
+        if remote:
+            await hub.publish(manager._channel(key), relayed)
+        else:
+            await manager.publish(key, payload)
+    await wait_delivered(sockets, burst * sockets_per_channel)
+    elapsed = time.perf_counter() - started
+
+    listener.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await listener
+    await manager.shutdown()
+    return elapsed
+
+
+async def run(channels: int, sockets_per_channel: int, burst: int) -> None:
+    print(f"channels={channels} sockets/channel={sockets_per_channel} burst={burst}")
+    for name, manager_type, remote in (
+        ("local: redis round-trip", LegacyConnectionManager, False),
+        ("local: fast path", ConnectionManager, False),
+        ("remote: task per message", LegacyConnectionManager, True),
+        ("remote: worker pool", ConnectionManager, True),
+    ):
+        elapsed = await run_burst(manager_type, channels, sockets_per_channel, burst, remote)
+        print(f"{name:<28} {burst / elapsed:>10,.0f} msg/s  ({elapsed:.3f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ConnectionManager burst delivery throughput")
+    parser.add_argument("--channels", type=int, default=8)
+    parser.add_argument("--sockets", type=int, default=1)
+    parser.add_argument("--burst", type=int, default=50_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.channels, args.sockets, args.burst))
+
+
+if __name__ == "__main__":
+    main()
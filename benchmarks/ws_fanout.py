@@ -0,0 +1,190 @@
+import argparse
+import asyncio
+import contextlib
+import random
+import time
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any
+
+import orjson
+from starlette.websockets import WebSocketState
+
+from app.core.websockets.service import ConnectionManager
+
+
+@dataclass(eq=False)
+class StandInWebSocket:
+    client_state: WebSocketState = WebSocketState.CONNECTED
+    received: int = 0
+
+    async def send_json(self, data: Any) -> None:
+        self.received += 1
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.received += 1
+
+    async def send_text(self, data: str) -> None:
+        self.received += 1
+
+
+@dataclass(eq=False)
+class StandInPubSub:
+    hub: LocalRedisStandIn
+    channels: set[str] = field(default_factory=set)
+    patterns: set[str] = field(default_factory=set)
+    queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    received: int = 0
+
+    @property
+    def subscribed(self) -> bool:
+        return bool(self.channels or self.patterns)
+
+    async def subscribe(self, *channels: str) -> None:
+        self.channels.update(channels)
+
+    ssubscribe = subscribe
+
+    async def unsubscribe(self, *channels: str) -> None:
+        self.channels.difference_update(channels)
+
+    sunsubscribe = unsubscribe
+
+    async def psubscribe(self, *patterns: str) -> None:
+        self.patterns.update(patterns)
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: float | None = 0.0) -> Any:
+        if not timeout:
+            return None if self.queue.empty() else self.queue.get_nowait()
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    async def listen(self) -> Any:
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self) -> None:
+        ...
+
+
+@dataclass
+class LocalRedisStandIn:
+    pubsubs: list[StandInPubSub] = field(default_factory=list)
+
+    def pubsub(self) -> StandInPubSub:
+        pubsub = StandInPubSub(hub=self)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def publish(self, channel: str, data: bytes) -> int:
+        receivers = 0
+        for pubsub in self.pubsubs:
+            if channel in pubsub.channels:
+                message = {"type": "message", "channel": channel.encode(), "data": data}
+            elif any(fnmatchcase(channel, pattern) for pattern in pubsub.patterns):
+                message = {"type": "pmessage", "pattern": b"ws:*", "channel": channel.encode(), "data": data}
+            else:
+                continue
+            pubsub.received += 1
+            pubsub.queue.put_nowait(message)
+            receivers += 1
+        return receivers
+
+    spublish = publish
+
+    async def aclose(self) -> None:
+        ...
+
+
+@dataclass
+class PatternConnectionManager(ConnectionManager):
+    async def _subscribe(self, key: str) -> None:
+        ...
+
+    async def _unsubscribe(self, key: str) -> None:
+        ...
+
+    async def startup(self) -> None:
+        pubsub = self._get_pubsub()
+        await pubsub.psubscribe("ws:*")
+        async for message in pubsub.listen():
+            if message["type"] != "pmessage":
+                continue
+            asyncio.create_task(self._dispatch_one(message))  # noqa: RUF006
+
+    async def _dispatch_one(self, message: dict) -> None:
+        channel = message["channel"].decode().removeprefix("ws:")
+        frame = self._unrelay(message["data"])
+        if frame is not None:
+            await self.send_json_all(channel, orjson.loads(frame))
+
+
+async def wait_drained(hub: LocalRedisStandIn, background: set[asyncio.Task]) -> None:
+    while any(pubsub.queue.qsize() for pubsub in hub.pubsubs):
+        await asyncio.sleep(0.001)
+
+    await asyncio.gather(*(asyncio.all_tasks() - background), return_exceptions=True)
+    await asyncio.sleep(0)
+
+
+async def run_mode(
+    manager_type: type[ConnectionManager], pods: int, keys: int, messages: int, seed: int
+) -> tuple[float, int, int]:
+    rng = random.Random(seed)
+    hub = LocalRedisStandIn()
+    managers = [manager_type(redis=hub, heartbeat_interval=3600) for _ in range(pods)] # type: ignore[arg-type]
+
+    sockets: list[StandInWebSocket] = []
+    for key in range(keys):
+        websocket = StandInWebSocket()
+        sockets.append(websocket)
+        await rng.choice(managers).bind_connection(websocket, f"user:{key}") # type: ignore[arg-type]
+
+    listeners = {asyncio.create_task(manager.startup()) for manager in managers}
+    await asyncio.sleep(0)
+    background = asyncio.all_tasks()
+
+    payload = b"bench|" + orjson.dumps({"type": "update", "value": 1})
+    started = time.perf_counter()
+    for _ in range(messages):
+        await hub.publish(f"ws:user:{rng.randrange(keys)}", payload)
+    await wait_drained(hub, background)
+    elapsed = time.perf_counter() - started
+
+    for task in listeners:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    for manager in managers:
+        await manager.shutdown()
+
+    return elapsed, sum(pubsub.received for pubsub in hub.pubsubs), sum(ws.received for ws in sockets)
+
+
+async def run(pods: int, keys: int, messages: int) -> None:
+    print(f"pods={pods} keys={keys} messages={messages}")
+    for name, manager_type in (
+        ("psubscribe ws:*", PatternConnectionManager),
+        ("subscribe ws:{key}", ConnectionManager),
+    ):
+        elapsed, received, delivered = await run_mode(manager_type, pods, keys, messages, seed=1)
+        print(
+            f"{name:<20} {messages / elapsed:>10,.0f} msg/s  "
+            f"pod receives={received:>10,}  socket deliveries={delivered:>8,}  ({elapsed:.3f}s)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ConnectionManager pub/sub fan-out across pods")
+    parser.add_argument("--pods", type=int, default=16)
+    parser.add_argument("--keys", type=int, default=5_000)
+    parser.add_argument("--messages", type=int, default=10_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.pods, args.keys, args.messages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""users partial unique indexes and archive
+
+Revision ID: 5c1e7f3a9d24
+Revises: 8877c879b8d2
+Create Date: 2026-10-19 17:05:51.640213
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e7f3a9d24"
+down_revision: str | None = "8877c879b8d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_index("ix_users_username", table_name="users")
+    op.create_index(
+        "ix_users_email", "users", ["email"], unique=True, postgresql_where=sa.text("deleted_at IS NULL")
+    )
+    op.create_index(
+        "ix_users_username", "users", ["username"], unique=True, postgresql_where=sa.text("deleted_at IS NULL")
+    )
+    op.create_index(
+        "ix_users_deleted_at", "users", ["deleted_at"], unique=False,
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+    )
+    op.create_table("users_archive",
+    sa.Column("id", sa.BigInteger(), autoincrement=False, nullable=False),
+    sa.Column("email", sa.String(), nullable=False),
+    sa.Column("username", sa.String(), nullable=False),
+    sa.Column("password_hash", sa.String(), nullable=True),
+    sa.Column("is_active", sa.Boolean(), nullable=False),
+    sa.Column("is_verified", sa.Boolean(), nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=False),
+    sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.PrimaryKeyConstraint("id")
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("users_archive")
+    op.drop_index("ix_users_deleted_at", table_name="users", postgresql_where=sa.text("deleted_at IS NOT NULL"))
+    op.drop_index("ix_users_username", table_name="users", postgresql_where=sa.text("deleted_at IS NULL"))
+    op.drop_index("ix_users_email", table_name="users", postgresql_where=sa.text("deleted_at IS NULL"))
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
@@ -0,0 +1,181 @@
+"""user effective permissions
+
+Revision ID: 8877c879b8d2
+Revises: 941d335edb1e
+Create Date: 2026-10-19 15:42:08.301126
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8877c879b8d2"
+down_revision: str | None = "941d335edb1e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CREATE_STATEMENTS = (
+    """
+CREATE OR REPLACE FUNCTION refresh_user_effective_permissions(target_ids bigint[]) RETURNS void
+LANGUAGE sql AS $$
+    INSERT INTO user_effective_permissions (user_id, roles, permissions, security_level, updated_at)
+    SELECT
+        u.id,
+        coalesce((
+            SELECT array_agg(r.name ORDER BY r.name)
+            FROM user_roles ur JOIN roles r ON r.id = ur.role_id
+            WHERE ur.user_id = u.id
+        ), '{}'),
+        coalesce((
+            SELECT array_agg(p.name ORDER BY p.name)
+            FROM (
+                SELECT rp.permission_id
+                FROM user_roles ur JOIN role_permissions rp ON rp.role_id = ur.role_id
+                WHERE ur.user_id = u.id
+                UNION
+                SELECT up.permission_id FROM user_permissions up WHERE up.user_id = u.id
+            ) AS granted JOIN permissions p ON p.id = granted.permission_id
+        ), '{}'),
+        coalesce((
+            SELECT max(r.security_level)
+            FROM user_roles ur JOIN roles r ON r.id = ur.role_id
+            WHERE ur.user_id = u.id
+        ), 0),
+        now()
+    FROM users u
+    WHERE u.id = ANY(target_ids)
+    ON CONFLICT (user_id) DO UPDATE SET
+        roles = EXCLUDED.roles,
+        permissions = EXCLUDED.permissions,
+        security_level = EXCLUDED.security_level,
+        updated_at = EXCLUDED.updated_at;
+$$
+""",
+    """
+CREATE OR REPLACE FUNCTION user_effective_permissions_by_new_user() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_user_effective_permissions(ARRAY(SELECT id FROM changed_rows));
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE OR REPLACE FUNCTION user_effective_permissions_by_user() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_user_effective_permissions(ARRAY(SELECT DISTINCT user_id FROM changed_rows));
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE OR REPLACE FUNCTION user_effective_permissions_by_role_permission() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_user_effective_permissions(ARRAY(SELECT DISTINCT ur.user_id
+        FROM user_roles ur WHERE ur.role_id IN (SELECT role_id FROM changed_rows)));
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE OR REPLACE FUNCTION user_effective_permissions_by_role() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_user_effective_permissions(ARRAY(SELECT ur.user_id FROM user_roles ur WHERE ur.role_id = NEW.id));
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE OR REPLACE FUNCTION user_effective_permissions_by_permission() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_user_effective_permissions(ARRAY(
+        SELECT up.user_id FROM user_permissions up WHERE up.permission_id = NEW.id
+        UNION SELECT ur.user_id FROM user_roles ur JOIN role_permissions rp ON rp.role_id = ur.role_id
+        WHERE rp.permission_id = NEW.id));
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE TRIGGER users_insert_effective_permissions AFTER INSERT ON users
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_effective_permissions_by_new_user()
+""",
+    """
+CREATE TRIGGER user_roles_insert_effective_permissions AFTER INSERT ON user_roles
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_effective_permissions_by_user()
+""",
+    """
+CREATE TRIGGER user_roles_delete_effective_permissions AFTER DELETE ON user_roles
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_effective_permissions_by_user()
+""",
+    """
+CREATE TRIGGER user_permissions_insert_effective_permissions AFTER INSERT ON user_permissions
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_effective_permissions_by_user()
+""",
+    """
+CREATE TRIGGER user_permissions_delete_effective_permissions AFTER DELETE ON user_permissions
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_effective_permissions_by_user()
+""",
+    """
+CREATE TRIGGER role_permissions_insert_effective_permissions AFTER INSERT ON role_permissions
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_effective_permissions_by_role_permission()
+""",
+    """
+CREATE TRIGGER role_permissions_delete_effective_permissions AFTER DELETE ON role_permissions
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_effective_permissions_by_role_permission()
+""",
+    """
+CREATE TRIGGER roles_update_effective_permissions AFTER UPDATE OF name, security_level ON roles
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name OR OLD.security_level IS DISTINCT FROM NEW.security_level)
+    EXECUTE FUNCTION user_effective_permissions_by_role()
+""",
+    """
+CREATE TRIGGER permissions_update_effective_permissions AFTER UPDATE OF name ON permissions
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION user_effective_permissions_by_permission()
+""",
+)
+
+DROP_STATEMENTS = (
+    "DROP FUNCTION IF EXISTS user_effective_permissions_by_new_user() CASCADE",
+    "DROP FUNCTION IF EXISTS user_effective_permissions_by_user() CASCADE",
+    "DROP FUNCTION IF EXISTS user_effective_permissions_by_role_permission() CASCADE",
+    "DROP FUNCTION IF EXISTS user_effective_permissions_by_role() CASCADE",
+    "DROP FUNCTION IF EXISTS user_effective_permissions_by_permission() CASCADE",
+    "DROP FUNCTION IF EXISTS refresh_user_effective_permissions(bigint[])",
+)
+
+
+def upgrade() -> None:
+    op.create_table("user_effective_permissions",
+    sa.Column("user_id", sa.BigInteger(), nullable=False),
+    sa.Column("roles", postgresql.ARRAY(sa.String()), server_default=sa.text("'{}'"), nullable=False),
+    sa.Column("permissions", postgresql.ARRAY(sa.String()), server_default=sa.text("'{}'"), nullable=False),
+    sa.Column("security_level", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], onupdate="cascade", ondelete="cascade"),
+    sa.PrimaryKeyConstraint("user_id")
+    )
+    for statement in CREATE_STATEMENTS:
+        op.execute(statement)
+    op.execute("SELECT refresh_user_effective_permissions(ARRAY(SELECT id FROM users))")
+
+
+def downgrade() -> None:
+    for statement in DROP_STATEMENTS:
+        op.execute(statement)
+    op.drop_table("user_effective_permissions")
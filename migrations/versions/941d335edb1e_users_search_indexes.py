@@ -0,0 +1,47 @@
+"""users search indexes
+
+Revision ID: 941d335edb1e
+Revises: a2db5de794b4
+Create Date: 2026-10-19 12:04:31.218544
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "941d335edb1e"
+down_revision: str | None = "a2db5de794b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column("users", sa.Column(
+        "search_vector",
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "to_tsvector('simple'::regconfig, coalesce(username, '') || ' ' || coalesce(email, ''))",
+            persisted=True,
+        ),
+        nullable=False,
+    ))
+    op.create_index(
+        "ix_users_email_trgm", "users", ["email"], unique=False,
+        postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_users_username_trgm", "users", ["username"], unique=False,
+        postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"},
+    )
+    op.create_index("ix_users_search_vector", "users", ["search_vector"], unique=False, postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_search_vector", table_name="users", postgresql_using="gin")
+    op.drop_index("ix_users_username_trgm", table_name="users", postgresql_using="gin")
+    op.drop_index("ix_users_email_trgm", table_name="users", postgresql_using="gin")
+    op.drop_column("users", "search_vector")
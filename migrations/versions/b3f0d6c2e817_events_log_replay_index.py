@@ -0,0 +1,26 @@
+"""events_log replay index
+
+Revision ID: b3f0d6c2e817
+Revises: 5c1e7f3a9d24
+Create Date: 2026-10-19 18:42:10.517304
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f0d6c2e817"
+down_revision: str | None = "5c1e7f3a9d24"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_events_log_created_at_event_id", "events_log", ["created_at", "event_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_log_created_at_event_id", table_name="events_log")
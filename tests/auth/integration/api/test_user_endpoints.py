@@ -30,6 +30,25 @@ class TestUserEndpoints:
         assert "page" in data
         assert len(data["items"]) >= 2
 
+    async def test_get_users_list_query_budget(
+        self,
+        client: AsyncClient,
+        admin_user: User,
+        standard_user: User,
+        auth_headers,
+        assert_max_queries,
+    ) -> None:
+        headers = auth_headers(admin_user)
+
+        with assert_max_queries(10) as stats:
+            response = await client.get(
+                api_path("users/"),
+                headers=headers
+            )
+
+        assert response.status_code == 200
+        assert not stats.repeated(threshold=3)
+
     async def test_get_users_list_unauthorized(
         self,
         client: AsyncClient,
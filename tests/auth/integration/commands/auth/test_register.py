@@ -86,6 +86,25 @@ class TestRegisterCommand:
         assert exc_info.value.field == "email"
         assert exc_info.value.value == standard_user.email
 
+    async def test_register_reuses_deleted_email(
+        self,
+        db_session: AsyncSession,
+        handler: RegisterCommandHandler,
+        standard_user: User,
+    ) -> None:
+        standard_user.soft_delete()
+        await db_session.commit()
+
+        cmd_data = AuthCommandFactory.create_register_command(
+            username=standard_user.username,
+            email=standard_user.email,
+        )
+
+        user_dto = await handler.handle(RegisterCommand(**cmd_data))
+
+        assert user_dto.id != standard_user.id
+        assert user_dto.email == standard_user.email
+
     async def test_register_password_mismatch(
         self,
         handler: RegisterCommandHandler,
@@ -0,0 +1,71 @@
+import pytest
+from dishka import AsyncContainer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.commands.permissions.bulk_add_permission_users import (
+    BulkAddPermissionToUsersCommand,
+    BulkAddPermissionToUsersCommandHandler,
+)
+from app.auth.commands.permissions.bulk_remove_permission_users import (
+    BulkDeletePermissionToUsersCommand,
+    BulkDeletePermissionToUsersCommandHandler,
+)
+from app.auth.exceptions import NotFoundPermissionsError
+from app.auth.models.permission import Permission
+from app.auth.models.user import User
+from app.auth.repositories.user import UserRepository
+from tests.auth.integration.factories import UserFactory
+from tests.support.jwt import jwt_from_user
+
+
+@pytest.mark.integration
+@pytest.mark.auth
+@pytest.mark.asyncio
+class TestBulkPermissionUsersCommand:
+
+    @pytest.fixture
+    async def add_handler(self, request_container: AsyncContainer) -> BulkAddPermissionToUsersCommandHandler:
+        return await request_container.get(BulkAddPermissionToUsersCommandHandler)
+
+    @pytest.fixture
+    async def delete_handler(self, request_container: AsyncContainer) -> BulkDeletePermissionToUsersCommandHandler:
+        return await request_container.get(BulkDeletePermissionToUsersCommandHandler)
+
+    async def test_add_and_delete_permissions(
+        self,
+        db_session: AsyncSession,
+        user_repository: UserRepository,
+        add_handler: BulkAddPermissionToUsersCommandHandler,
+        delete_handler: BulkDeletePermissionToUsersCommandHandler,
+        admin_user: User,
+    ) -> None:
+        users = [UserFactory.create_verified() for _ in range(3)]
+        db_session.add_all([Permission(name="bulk:read"), Permission(name="bulk:write"), *users])
+        await db_session.commit()
+        user_ids = {user.id for user in users}
+
+        await add_handler.handle(BulkAddPermissionToUsersCommand(
+            user_jwt_data=jwt_from_user(admin_user), user_ids=user_ids, permissions={"bulk:read", "bulk:write"},
+        ))
+        await delete_handler.handle(BulkDeletePermissionToUsersCommand(
+            user_jwt_data=jwt_from_user(admin_user), user_ids=user_ids, permissions={"bulk:write"},
+        ))
+        db_session.expire_all()
+
+        for user_id in user_ids:
+            updated_user = await user_repository.get_user_with_permission_by_id(user_id)
+            assert updated_user is not None
+            assert {p.name for p in updated_user.permissions} == {"bulk:read"}
+
+    async def test_add_missing_permission(
+        self,
+        add_handler: BulkAddPermissionToUsersCommandHandler,
+        admin_user: User,
+        standard_user: User,
+    ) -> None:
+        command = BulkAddPermissionToUsersCommand(
+            user_jwt_data=jwt_from_user(admin_user), user_ids={standard_user.id}, permissions={"bulk:missing"},
+        )
+
+        with pytest.raises(NotFoundPermissionsError):
+            await add_handler.handle(command)
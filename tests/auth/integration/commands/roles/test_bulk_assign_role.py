@@ -0,0 +1,141 @@
+import pytest
+from dishka import AsyncContainer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.commands.roles.bulk_assign_roles import BulkAssignRoleCommand, BulkAssignRoleCommandHandler
+from app.auth.commands.roles.bulk_remove_roles import BulkRemoveRoleCommand, BulkRemoveRoleCommandHandler
+from app.auth.exceptions import NotFoundRolesError, NotFoundUsersError
+from app.auth.models.user import User
+from app.auth.repositories.session import TokenBlacklistRepository
+from app.auth.repositories.user import UserRepository
+from app.core.services.auth.exceptions import AccessDeniedError
+from tests.auth.integration.factories import RoleFactory, UserFactory
+from tests.support.jwt import jwt_from_user
+
+
+@pytest.mark.integration
+@pytest.mark.auth
+@pytest.mark.asyncio
+class TestBulkAssignRoleCommand:
+
+    @pytest.fixture
+    async def assign_handler(self, request_container: AsyncContainer) -> BulkAssignRoleCommandHandler:
+        return await request_container.get(BulkAssignRoleCommandHandler)
+
+    @pytest.fixture
+    async def remove_handler(self, request_container: AsyncContainer) -> BulkRemoveRoleCommandHandler:
+        return await request_container.get(BulkRemoveRoleCommandHandler)
+
+    async def test_assign_roles_to_many_users(
+        self,
+        db_session: AsyncSession,
+        user_repository: UserRepository,
+        token_blacklist_repository: TokenBlacklistRepository,
+        assign_handler: BulkAssignRoleCommandHandler,
+        admin_user: User,
+    ) -> None:
+        roles = [RoleFactory.create(name=f"bulk_role_{idx}", security_level=2) for idx in range(2)]
+        users = [UserFactory.create_verified() for _ in range(3)]
+        db_session.add_all([*roles, *users])
+        await db_session.commit()
+
+        await assign_handler.handle(BulkAssignRoleCommand(
+            user_ids={user.id for user in users},
+            role_names={"bulk_role_0", "bulk_role_1"},
+            user_jwt_data=jwt_from_user(admin_user),
+        ))
+        db_session.expire_all()
+
+        for user in users:
+            updated_user = await user_repository.get_user_with_permission_by_id(user.id)
+            assert updated_user is not None
+            assert {"bulk_role_0", "bulk_role_1"} <= {role.name for role in updated_user.roles}
+            assert (await token_blacklist_repository.get_user_backlist(user.id)).timestamp() > 0
+
+    async def test_assign_is_idempotent(
+        self,
+        db_session: AsyncSession,
+        assign_handler: BulkAssignRoleCommandHandler,
+        admin_user: User,
+    ) -> None:
+        role = RoleFactory.create(name="bulk_role_again", security_level=2)
+        user = UserFactory.create_verified(roles={role})
+        db_session.add_all([role, user])
+        await db_session.commit()
+
+        command = BulkAssignRoleCommand(
+            user_ids={user.id}, role_names={"bulk_role_again"}, user_jwt_data=jwt_from_user(admin_user),
+        )
+        await assign_handler.handle(command)
+        await assign_handler.handle(command)
+
+    async def test_assign_missing_role(
+        self,
+        assign_handler: BulkAssignRoleCommandHandler,
+        admin_user: User,
+        standard_user: User,
+    ) -> None:
+        command = BulkAssignRoleCommand(
+            user_ids={standard_user.id}, role_names={"missing_role"}, user_jwt_data=jwt_from_user(admin_user),
+        )
+
+        with pytest.raises(NotFoundRolesError):
+            await assign_handler.handle(command)
+
+    async def test_assign_missing_user(
+        self,
+        db_session: AsyncSession,
+        assign_handler: BulkAssignRoleCommandHandler,
+        admin_user: User,
+        standard_user: User,
+    ) -> None:
+        db_session.add(RoleFactory.create(name="bulk_role_nu", security_level=2))
+        await db_session.commit()
+
+        command = BulkAssignRoleCommand(
+            user_ids={standard_user.id, 99999},
+            role_names={"bulk_role_nu"},
+            user_jwt_data=jwt_from_user(admin_user),
+        )
+
+        with pytest.raises(NotFoundUsersError) as exc:
+            await assign_handler.handle(command)
+        assert exc.value.missing == {99999}
+
+    async def test_assign_insufficient_permissions(
+        self,
+        assign_handler: BulkAssignRoleCommandHandler,
+        standard_user: User,
+    ) -> None:
+        command = BulkAssignRoleCommand(
+            user_ids={standard_user.id}, role_names={"user"}, user_jwt_data=jwt_from_user(standard_user),
+        )
+
+        with pytest.raises(AccessDeniedError):
+            await assign_handler.handle(command)
+
+    async def test_remove_roles_from_many_users(
+        self,
+        db_session: AsyncSession,
+        user_repository: UserRepository,
+        remove_handler: BulkRemoveRoleCommandHandler,
+        admin_user: User,
+    ) -> None:
+        role = RoleFactory.create(name="bulk_removable", security_level=2)
+        db_session.add(role)
+        await db_session.flush()
+        users = [UserFactory.create_verified(roles={role}) for _ in range(3)]
+        db_session.add_all(users)
+        await db_session.commit()
+
+        await remove_handler.handle(BulkRemoveRoleCommand(
+            user_ids={user.id for user in users},
+            role_names={"bulk_removable"},
+            user_jwt_data=jwt_from_user(admin_user),
+        ))
+        db_session.expire_all()
+
+        for user in users:
+            updated_user = await user_repository.get_user_with_permission_by_id(user.id)
+            assert updated_user is not None
+            assert "bulk_removable" not in {role.name for role in updated_user.roles}
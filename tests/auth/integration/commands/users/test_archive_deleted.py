@@ -0,0 +1,53 @@
+from datetime import timedelta
+
+import pytest
+from dishka import AsyncContainer
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.commands.users.archive_deleted import ArchiveDeletedUsersCommand, ArchiveDeletedUsersCommandHandler
+from app.auth.models.user import User, UserArchive
+from app.auth.repositories.role import RoleRepository
+from app.auth.repositories.user import UserRepository
+from app.core.utils import now_utc
+from tests.auth.integration.factories import UserFactory
+
+
+@pytest.mark.integration
+@pytest.mark.auth
+@pytest.mark.asyncio
+class TestArchiveDeletedUsersCommand:
+    @pytest.fixture
+    async def handler(self, request_container: AsyncContainer) -> ArchiveDeletedUsersCommandHandler:
+        return await request_container.get(ArchiveDeletedUsersCommandHandler)
+
+    async def test_moves_long_deleted_users_in_batches(
+        self,
+        db_session: AsyncSession,
+        user_repository: UserRepository,
+        role_repository: RoleRepository,
+        handler: ArchiveDeletedUsersCommandHandler,
+        standard_user: User,
+    ) -> None:
+        role = await role_repository.get_by_name("user")
+        assert role is not None
+
+        users = [
+            UserFactory.create(email=f"gone{idx}@example.com", username=f"goneuser{idx}", roles={role})
+            for idx in range(5)
+        ]
+        for idx, user in enumerate(users):
+            await user_repository.create(user)
+            user.deleted_at = now_utc() - timedelta(days=100 if idx < 3 else 10)
+        await db_session.commit()
+
+        archived = await handler.handle(ArchiveDeletedUsersCommand(retention_days=90, batch_size=2))
+
+        assert archived == 3
+        db_session.expire_all()
+        archive_ids = set((await db_session.execute(select(UserArchive.id))).scalars())
+        assert archive_ids == {user.id for user in users[:3]}
+
+        remaining = set((await db_session.execute(select(User.id).where(User.deleted_at.is_not(None)))).scalars())
+        assert remaining == {user.id for user in users[3:]}
+        assert await user_repository.get_by_id(standard_user.id) is not None
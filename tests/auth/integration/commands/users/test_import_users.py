@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+from dishka import AsyncContainer
+
+from app.auth.commands.users.import_users import ImportUsersCommand, ImportUsersCommandHandler
+from app.auth.exceptions import NotFoundRoleError
+from app.auth.models.user import User
+from app.auth.repositories.user import UserRepository
+from app.auth.services.user_import import ImportFormat
+from tests.conftest import MockEventBus
+
+
+@pytest.mark.integration
+@pytest.mark.auth
+@pytest.mark.asyncio
+class TestImportUsersCommand:
+    @pytest.fixture
+    async def handler(self, request_container: AsyncContainer) -> ImportUsersCommandHandler:
+        return await request_container.get(ImportUsersCommandHandler)
+
+    async def test_import_reports_invalid_rows_and_conflicts(
+        self,
+        tmp_path: Path,
+        user_repository: UserRepository,
+        mock_event_bus: MockEventBus,
+        handler: ImportUsersCommandHandler,
+        standard_user: User,
+    ) -> None:
+        source = tmp_path / "users.csv"
+        source.write_text(
+            "email,username,password,is_verified\n"
+            "first@example.com,firstuser,Secret123!,false\n"
+            "second@example.com,seconduser,,true\n"
+            "not-an-email,brokenuser,,\n"
+            f"{standard_user.email},takenemail,,\n"
+            f"third@example.com,{standard_user.username},,\n"
+            "first@example.com,firstagain,,\n"
+        )
+
+        report = await handler.handle(
+            ImportUsersCommand(path=str(source), import_format=ImportFormat.CSV, batch_size=4, workers=1)
+        )
+
+        assert report.imported == 2
+        assert [row.line for row in report.invalid] == [4]
+        assert {(c.line, c.field) for c in report.conflicts} == {(5, "email"), (6, "username"), (7, "email")}
+
+        authorization = await user_repository.get_authorization_by_email("first@example.com")
+        assert authorization is not None
+        first, effective = authorization
+        assert first.password_hash is not None
+        assert effective.roles == ["user"]
+
+        second = await user_repository.get_by_email("second@example.com")
+        assert second is not None
+        assert second.password_hash is None
+
+        assert [(event.__class__.__name__, event.email) for event in mock_event_bus.published_events] == [
+            ("CreatedUserEvent", "first@example.com")
+        ]
+
+    async def test_import_unknown_role(self, tmp_path: Path, handler: ImportUsersCommandHandler) -> None:
+        source = tmp_path / "users.ndjson"
+        source.write_text("")
+
+        with pytest.raises(NotFoundRoleError):
+            await handler.handle(
+                ImportUsersCommand(path=str(source), import_format=ImportFormat.NDJSON, role_name="missing")
+            )
@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.models.role_permission import PermissionEnum
+from app.auth.models.user import User
+from app.auth.repositories.permission import PermissionRepository
+from app.auth.repositories.role import RoleRepository
+from app.auth.repositories.user import UserRepository
+
+
+@pytest.mark.integration
+@pytest.mark.auth
+@pytest.mark.asyncio
+class TestUserEffectivePermissions:
+
+    async def test_new_user_gets_projection(self, user_repository: UserRepository, standard_user: User) -> None:
+        authorization = await user_repository.get_authorization_by_id(standard_user.id)
+
+        assert authorization is not None
+        user, effective = authorization
+        assert user.id == standard_user.id
+        assert effective.roles == ["user"]
+        assert effective.permissions == []
+        assert effective.security_level == 1
+
+    async def test_direct_and_role_permissions_are_merged(
+        self,
+        db_session: AsyncSession,
+        user_repository: UserRepository,
+        role_repository: RoleRepository,
+        permission_repository: PermissionRepository,
+        standard_user: User,
+    ) -> None:
+        view_user = await permission_repository.get_permission_by_name(PermissionEnum.VIEW_USER.value.name)
+        view_role = await permission_repository.get_permission_by_name(PermissionEnum.VIEW_ROLE.value.name)
+        admin_role = await role_repository.get_by_name("system_admin")
+        assert view_user is not None and view_role is not None and admin_role is not None
+
+        await user_repository.add_permissions([standard_user.id], [view_user.id, view_role.id])
+        await db_session.commit()
+
+        authorization = await user_repository.get_authorization_by_id(standard_user.id)
+        assert authorization is not None
+        assert authorization[1].permissions == sorted([view_role.name, view_user.name])
+
+        await user_repository.add_roles([standard_user.id], [admin_role.id])
+        await user_repository.remove_permissions([standard_user.id], [view_user.id, view_role.id])
+        await db_session.commit()
+
+        authorization = await user_repository.get_authorization_by_id(standard_user.id)
+        assert authorization is not None
+        _, effective = authorization
+        assert effective.roles == ["system_admin", "user"]
+        assert effective.security_level == 9
+        assert view_user.name in effective.permissions
+        assert view_role.name in effective.permissions
+
+    async def test_role_changes_propagate_to_members(
+        self,
+        db_session: AsyncSession,
+        user_repository: UserRepository,
+        role_repository: RoleRepository,
+        permission_repository: PermissionRepository,
+        standard_user: User,
+    ) -> None:
+        role = await role_repository.get_by_name("user")
+        permission = await permission_repository.get_permission_by_name(PermissionEnum.VIEW_USER.value.name)
+        assert role is not None and permission is not None
+
+        await role_repository.add_permissions([role.id], [permission.id])
+        role.security_level = 2
+        await db_session.commit()
+
+        authorization = await user_repository.get_authorization_by_id(standard_user.id)
+        assert authorization is not None
+        _, effective = authorization
+        assert effective.permissions == [permission.name]
+        assert effective.security_level == 2
+
+    async def test_deleted_user_has_no_authorization(
+        self, db_session: AsyncSession, user_repository: UserRepository, standard_user: User
+    ) -> None:
+        standard_user.soft_delete()
+        await db_session.commit()
+
+        assert await user_repository.get_authorization_by_id(standard_user.id) is None
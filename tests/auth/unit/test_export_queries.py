@@ -0,0 +1,66 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from app.auth.dtos.user import AuthUserJWTData
+from app.auth.filters.sessions import SessionFilter
+from app.auth.queries.sessions.export import ExportSessionsQuery, ExportSessionsQueryHandler
+from app.auth.services.rbac import AuthRBACManager
+from app.core import models  # noqa: F401
+from app.core.db.routing import DBRoute, db_route, route_to
+
+
+@dataclass
+class FakeSessionRepository:
+    session: Any
+    streamed: list[tuple[Any, DBRoute | None]]
+
+    async def stream_by_filter(self, model: Any, filters: Any, batch_size: int) -> AsyncIterator[list[Any]]:
+        self.streamed.append((self.session, db_route.get()))
+        yield []
+
+
+class FakeSessionMaker:
+    def __init__(self) -> None:
+        self.opened: list[str] = []
+        self.closed: list[str] = []
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator[str]:
+        name = f"stream-session-{len(self.opened)}"
+        self.opened.append(name)
+        try:
+            yield name
+        finally:
+            self.closed.append(name)
+
+
+@pytest.mark.unit
+class TestExportSessionsQueryHandler:
+
+    async def test_stream_owns_session_and_keeps_route(self) -> None:
+        repository = FakeSessionRepository(session="request-session", streamed=[])
+        session_maker = FakeSessionMaker()
+        handler = ExportSessionsQueryHandler(
+            session_repository=repository,  # type: ignore[arg-type]
+            rbac_manager=AuthRBACManager(),
+            session_maker=session_maker,  # type: ignore[arg-type]
+        )
+        query = ExportSessionsQuery(
+            session_filter=SessionFilter(),
+            user_jwt_data=AuthUserJWTData(
+                id="1", username="admin", roles=["admin"], permissions=["user:view"],
+                security_level=1, device_id="device",
+            ),
+        )
+
+        with route_to(DBRoute.REPLICA):
+            stream = await handler.handle(query)
+        assert session_maker.opened == []
+
+        assert [batch async for batch in stream] == [[]]
+        assert repository.streamed == [("stream-session-0", DBRoute.REPLICA)]
+        assert session_maker.closed == ["stream-session-0"]
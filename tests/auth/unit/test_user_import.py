@@ -0,0 +1,68 @@
+import io
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from passlib.context import CryptContext
+
+from app.auth.services.user_import import ImportFormat, hash_passwords_in_pool, read_rows, validate_rows
+
+
+@pytest.mark.unit
+class TestImportRows:
+
+    def test_csv_rows_keep_line_numbers(self) -> None:
+        source = io.StringIO("email,username,password\na@example.com,alice,\nb@example.com,bobby,Secret123!\n")
+
+        rows = list(read_rows(source, ImportFormat.CSV))
+
+        assert rows == [
+            (2, {"email": "a@example.com", "username": "alice"}),
+            (3, {"email": "b@example.com", "username": "bobby", "password": "Secret123!"}),
+        ]
+
+    def test_ndjson_marks_malformed_lines(self) -> None:
+        source = io.StringIO('{"email": "a@example.com", "username": "alice"}\n\nnot json\n[1]\n')
+
+        rows = list(read_rows(source, ImportFormat.NDJSON))
+
+        assert rows == [(1, {"email": "a@example.com", "username": "alice"}), (3, None), (4, None)]
+
+    def test_validate_splits_valid_and_invalid(self) -> None:
+        rows, invalid = validate_rows([
+            (1, {"email": "a@example.com", "username": "alice", "is_verified": "true"}),
+            (2, {"email": "broken", "username": "bob"}),
+            (3, None),
+        ])
+
+        assert [(line, row.email, row.is_verified) for line, row in rows] == [(1, "a@example.com", True)]
+        assert [row.line for row in invalid] == [2, 3]
+        assert any(error.startswith("email") for error in invalid[0].errors)
+        assert any(error.startswith("username") for error in invalid[0].errors)
+
+    def test_validate_applies_password_rules(self) -> None:
+        rows, invalid = validate_rows([
+            (1, {"email": "a@example.com", "username": "alice", "password": "Secret123!"}),
+            (2, {"email": "b@example.com", "username": "bobby", "password": "alllowercase1"}),
+        ])
+
+        assert [line for line, _ in rows] == [1]
+        assert [row.line for row in invalid] == [2]
+        assert invalid[0].errors[0].startswith("password")
+
+
+@pytest.mark.unit
+class TestImportHashing:
+
+    async def test_hashes_in_process_pool_and_keeps_order(self) -> None:
+        schemes = ("md5_crypt",)
+        passwords = ["first-pass", None, "second-pass", "third-pass"]
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            hashes = await hash_passwords_in_pool(pool, schemes, passwords, chunks=2)
+
+        context = CryptContext(schemes=list(schemes))
+        assert hashes[1] is None
+        for password, password_hash in zip(passwords, hashes, strict=True):
+            if password is not None:
+                assert password_hash is not None
+                assert context.verify(password, password_hash)
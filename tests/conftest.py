@@ -1,6 +1,7 @@
 import asyncio
 import os
 from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import AbstractContextManager, contextmanager
 from datetime import timedelta
 from typing import Any
 from uuid import uuid4
@@ -10,7 +11,6 @@ from dishka import AsyncContainer, Provider, Scope, provide
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
-from fastapi_limiter import FastAPILimiter
 from httpx import ASGITransport, AsyncClient
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import (
@@ -26,6 +26,7 @@ from testcontainers.redis import AsyncRedisContainer
 
 from app.core.configs.app import app_config
 from app.core.db.base_model import BaseModel
+from app.core.db.query_budget import QueryStats, track_queries
 from app.core.di.container import create_container
 from app.core.events.event import EventRegistry
 from app.core.events.service import BaseEventBus
@@ -306,13 +307,24 @@ def test_app() -> FastAPI:
 
 @pytest.fixture
 async def client(app: FastAPI, redis_client: Redis) -> AsyncGenerator[AsyncClient]:
-    await FastAPILimiter.init(redis_client)
     transport = ASGITransport(app=app)
 
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
+@pytest.fixture
+def assert_max_queries() -> Callable[[int], AbstractContextManager[QueryStats]]:
+    @contextmanager
+    def _assert_max_queries(expected: int) -> Generator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= expected, stats.report()
+        assert not stats.lazy_loads, stats.report()
+
+    return _assert_max_queries
+
+
 @pytest.fixture
 def mock_now() -> float:
     return 1704067200.0  # 2024-01-01 00:00:00 UTC
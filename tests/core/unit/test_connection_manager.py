@@ -0,0 +1,268 @@
+import asyncio
+import contextlib
+from typing import Any
+
+import ormsgpack
+import pytest
+
+from app.core.websockets.codecs import FLAG_PLAIN
+from app.core.websockets.outbox import FullQueuePolicy
+from app.core.websockets.service import ConnectionManager
+from tests.mocks import FakeRedisPubSubHub, FakeWebSocket
+
+
+def make_manager(hub: FakeRedisPubSubHub, **kwargs: Any) -> ConnectionManager:
+    return ConnectionManager(redis=hub, heartbeat_interval=3600, **kwargs) # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+class TestConnectionManagerSubscriptions:
+
+    async def test_subscribes_only_while_key_has_local_connections(self) -> None:
+        manager = make_manager(FakeRedisPubSubHub())
+        first, second = FakeWebSocket(), FakeWebSocket()
+
+        await manager.bind_connection(first, "user:1")
+        await manager.bind_connection(second, "user:1")
+        assert manager.pubsub.channels == {"ws:user:1"} # type: ignore[union-attr]
+
+        await manager.remove_connection(first, "user:1")
+        assert manager.pubsub.channels == {"ws:user:1"} # type: ignore[union-attr]
+
+        await manager.remove_connection(second, "user:1")
+        assert manager.pubsub.channels == set() # type: ignore[union-attr]
+
+    async def test_bind_during_unsubscribe_resubscribes(self) -> None:
+        manager = make_manager(FakeRedisPubSubHub())
+        first, second = FakeWebSocket(), FakeWebSocket()
+        await manager.bind_connection(first, "user:1")
+        pubsub = manager.pubsub
+        unsubscribing, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_unsubscribe(*channels: str) -> None:
+            unsubscribing.set()
+            await release.wait()
+            pubsub.channels.difference_update(channels) # type: ignore[union-attr]
+
+        pubsub.unsubscribe = slow_unsubscribe # type: ignore[union-attr]
+        removing = asyncio.create_task(manager.remove_connection(first, "user:1"))
+        await unsubscribing.wait()
+        binding = asyncio.create_task(manager.bind_connection(second, "user:1"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(removing, binding)
+
+        assert manager.connections_map["user:1"] == {second}
+        assert pubsub.channels == {"ws:user:1"} # type: ignore[union-attr]
+
+    async def test_publish_reaches_only_interested_pods(self) -> None:
+        hub = FakeRedisPubSubHub()
+        interested, idle = make_manager(hub), make_manager(hub)
+        websocket = FakeWebSocket()
+        await interested.bind_connection(websocket, "user:1")
+        await idle.bind_connection(FakeWebSocket(), "user:2")
+
+        tasks = [asyncio.create_task(manager.startup()) for manager in (interested, idle)]
+        receivers = await hub.publish("ws:user:1", b'\x1ev1:remote\x1e{"value":1}')
+        await asyncio.sleep(0.01)
+
+        for task in tasks:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        assert receivers == 1
+        assert websocket.sent == ['{"value":1}']
+
+    async def test_sharded_publish_uses_spublish(self) -> None:
+        hub = FakeRedisPubSubHub()
+        manager = make_manager(hub, sharded_pubsub=True)
+        await manager.bind_connection(FakeWebSocket(), "user:1")
+
+        await manager.publish("user:1", {"value": 1})
+
+        assert hub.published == [("SPUBLISH", "ws:user:1", manager._relay(b'{"value":1}'))]
+
+
+@pytest.mark.unit
+class TestConnectionManagerDispatch:
+
+    async def test_publish_delivers_locally_without_echo(self) -> None:
+        hub = FakeRedisPubSubHub()
+        local, remote = make_manager(hub), make_manager(hub)
+        local_socket, remote_socket = FakeWebSocket(), FakeWebSocket()
+        await local.bind_connection(local_socket, "room")
+        await remote.bind_connection(remote_socket, "room")
+        tasks = [asyncio.create_task(manager.startup()) for manager in (local, remote)]
+
+        await local.publish("room", {"value": 1})
+        await asyncio.sleep(0.01)
+
+        for task in tasks:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        assert local_socket.sent == ['{"value":1}']
+        assert remote_socket.sent == ['{"value":1}']
+
+    async def test_groups_consecutive_messages_per_channel(self) -> None:
+        manager = make_manager(FakeRedisPubSubHub())
+        messages = [
+            {"type": "message", "channel": b"ws:a", "data": b"\x1ev1:remote\x1e1"},
+            {"type": "message", "channel": b"ws:a", "data": b"\x1ev1:remote\x1e2"},
+            {"type": "message", "channel": b"ws:b", "data": b"\x1ev1:remote\x1e3"},
+            {"type": "message", "channel": b"ws:a", "data": manager._relay(b"4")},
+            {"type": "message", "channel": b"ws:a", "data": b"\x1ev1:remote\x1e5"},
+        ]
+
+        assert manager._group_by_channel(messages) == [("a", ["1", "2"]), ("b", ["3"]), ("a", ["5"])]
+
+    async def test_unprefixed_payloads_pass_through(self) -> None:
+        manager = make_manager(FakeRedisPubSubHub())
+
+        assert manager._unrelay(b'{"value":1}') == '{"value":1}'
+        assert manager._unrelay(b'{"text":"a|b"}') == '{"text":"a|b"}'
+        assert manager._unrelay(manager._relay(b'{"text":"a|b"}')) is None
+        assert make_manager(FakeRedisPubSubHub())._unrelay(manager._relay(b'{"text":"a|b"}')) == '{"text":"a|b"}'
+
+
+@pytest.mark.unit
+class TestConnectionManagerOutbox:
+
+    async def test_payload_is_serialized_once_for_all_sockets(self) -> None:
+        manager = make_manager(FakeRedisPubSubHub())
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for websocket in sockets:
+            await manager.bind_connection(websocket, "room")
+
+        await manager.send_json_all("room", {"value": 1})
+        await asyncio.sleep(0)
+
+        frames = [websocket.sent[0] for websocket in sockets]
+        assert frames == ['{"value":1}'] * 3
+        assert all(frame is frames[0] for frame in frames)
+
+    async def test_slow_socket_does_not_block_others(self) -> None:
+        manager = make_manager(FakeRedisPubSubHub())
+        slow, fast = FakeWebSocket(blocked=asyncio.Event()), FakeWebSocket()
+        await manager.bind_connection(slow, "room")
+        await manager.bind_connection(fast, "room")
+
+        await manager.send_all("room", b"1")
+        await manager.send_all("room", b"2")
+        await asyncio.sleep(0)
+
+        assert fast.sent == [b"1", b"2"]
+        assert slow.sent == []
+
+    async def test_drop_oldest_keeps_newest_frames(self) -> None:
+        manager = make_manager(FakeRedisPubSubHub(), send_queue_size=2)
+        websocket = FakeWebSocket(blocked=asyncio.Event())
+        await manager.bind_connection(websocket, "room")
+
+        for value in (b"1", b"2", b"3", b"4", b"5"):
+            await manager.send_all("room", value)
+        await asyncio.sleep(0)
+        websocket.blocked.set() # type: ignore[union-attr]
+        await asyncio.sleep(0.01)
+
+        assert websocket.sent == [b"4", b"5"]
+
+    async def test_coalesce_keeps_latest_frame_per_key(self) -> None:
+        manager = make_manager(FakeRedisPubSubHub(), send_queue_size=3, full_queue_policy=FullQueuePolicy.COALESCE)
+        websocket = FakeWebSocket(blocked=asyncio.Event())
+        await manager.bind_connection(websocket, "room")
+        await manager.bind_connection(websocket, "lobby")
+
+        await manager.send_all("room", b"room-1")
+        await asyncio.sleep(0)
+        for key, value in (("room", b"room-2"), ("lobby", b"lobby-1"), ("room", b"room-3"), ("room", b"room-4")):
+            await manager.send_all(key, value)
+        websocket.blocked.set() # type: ignore[union-attr]
+        await asyncio.sleep(0.01)
+
+        assert websocket.sent == [b"room-1", b"lobby-1", b"room-4"]
+
+    async def test_coalesce_drops_oldest_when_key_has_no_backlog(self) -> None:
+        manager = make_manager(FakeRedisPubSubHub(), send_queue_size=2, full_queue_policy=FullQueuePolicy.COALESCE)
+        websocket = FakeWebSocket(blocked=asyncio.Event())
+        await manager.bind_connection(websocket, "room")
+        await manager.bind_connection(websocket, "lobby")
+
+        await manager.send_all("room", b"room-1")
+        await asyncio.sleep(0)
+        for key, value in (("room", b"room-2"), ("room", b"room-3"), ("lobby", b"lobby-1")):
+            await manager.send_all(key, value)
+        websocket.blocked.set() # type: ignore[union-attr]
+        await asyncio.sleep(0.01)
+
+        assert websocket.sent == [b"room-1", b"room-3", b"lobby-1"]
+
+    async def test_disconnect_policy_evicts_slow_consumer(self) -> None:
+        manager = make_manager(
+            FakeRedisPubSubHub(), send_queue_size=1, full_queue_policy=FullQueuePolicy.DISCONNECT
+        )
+        websocket = FakeWebSocket(blocked=asyncio.Event())
+        await manager.bind_connection(websocket, "room")
+
+        for value in (b"1", b"2", b"3"):
+            await manager.send_all("room", value)
+        await asyncio.sleep(0.01)
+
+        assert websocket.closed
+        assert websocket.close_code == 1013
+        assert "room" not in manager.connections_map
+        assert websocket not in manager.outboxes
+
+
+@pytest.mark.unit
+class TestConnectionManagerPresence:
+
+    async def test_presence_tracks_connections_across_pods(self) -> None:
+        hub = FakeRedisPubSubHub()
+        first, second = make_manager(hub, presence_ttl=60), make_manager(hub, presence_ttl=60)
+        websocket = FakeWebSocket()
+        await first.bind_connection(websocket, "user:1")
+        await first.bind_connection(FakeWebSocket(), "user:1")
+        await second.bind_connection(FakeWebSocket(), "user:1")
+
+        assert await second.is_online("user:1")
+        assert await second.count_connections("user:1") == 3
+
+        await first.remove_connection(websocket, "user:1")
+        assert await second.count_connections("user:1") == 2
+        assert not await second.is_online("user:2")
+
+    async def test_expired_node_is_not_online(self) -> None:
+        hub = FakeRedisPubSubHub()
+        manager = make_manager(hub, presence_ttl=60)
+        await manager.bind_connection(FakeWebSocket(), "user:1")
+
+        hub.zsets["ws:presence:user:1"][manager.node_id] = 0
+
+        assert not await manager.is_online("user:1")
+        assert await manager.count_connections("user:1") == 0
+
+    async def test_publish_bulk_relays_only_keys_with_remote_subscribers(self) -> None:
+        hub = FakeRedisPubSubHub()
+        local, remote = make_manager(hub, presence_ttl=60), make_manager(hub, presence_ttl=60)
+        await local.bind_connection(FakeWebSocket(), "local-only")
+        await remote.bind_connection(FakeWebSocket(), "remote")
+
+        await local.publish_bulk(["local-only", "remote", "nobody"], {"value": 1})
+
+        assert [channel for _, channel, _ in hub.published] == ["ws:remote"]
+
+    async def test_disconnect_all_sends_abort_through_outbox_before_close(self) -> None:
+        manager = make_manager(FakeRedisPubSubHub())
+        websocket = FakeWebSocket(scope={"subprotocols": ["msgpack"]})
+        await manager.accept_connection(websocket, "room")
+        await manager.send_all("room", b"1")
+
+        await manager.disconnect_all("room")
+        await manager.disconnect_all("missing")
+
+        assert websocket.sent[0] == b"1"
+        assert websocket.sent[1] == FLAG_PLAIN + ormsgpack.packb({"message": "Abort connection"})
+        assert websocket.closed
@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+from aiokafka import TopicPartition
+
+from app.core.message_brokers.lag import ConsumerLagReporter
+from app.core.message_brokers.metrics import CONSUMER_LAG
+
+
+@dataclass
+class FakeAssignedConsumer:
+    positions: dict[TopicPartition, int]
+    highwaters: dict[TopicPartition, int]
+
+    def assignment(self) -> set[TopicPartition]:
+        return set(self.positions)
+
+    def highwater(self, partition: TopicPartition) -> int | None:
+        return self.highwaters.get(partition)
+
+    async def position(self, partition: TopicPartition) -> int:
+        return self.positions[partition]
+
+
+@dataclass
+class FakeSubscriber:
+    consumer: Any = None
+    consumer_subgroup: list[Any] = field(default_factory=list)
+
+
+@dataclass
+class FakeBroker:
+    subscribers: list[FakeSubscriber]
+
+
+def lag(topic: str, partition: int) -> float | None:
+    for metric in CONSUMER_LAG.collect():
+        for sample in metric.samples:
+            if sample.labels == {"topic": topic, "partition": str(partition)}:
+                return sample.value
+    return None
+
+
+@pytest.mark.unit
+class TestConsumerLagReporter:
+
+    async def test_reports_highwater_minus_position_per_assigned_partition(self) -> None:
+        tp0, tp1, tp2 = TopicPartition("lag.a", 0), TopicPartition("lag.a", 1), TopicPartition("lag.b", 0)
+        broker = FakeBroker(subscribers=[
+            FakeSubscriber(consumer=FakeAssignedConsumer(positions={tp0: 7, tp1: 3}, highwaters={tp0: 10, tp1: 3})),
+            FakeSubscriber(consumer_subgroup=[FakeAssignedConsumer(positions={tp2: 1}, highwaters={})]),
+        ])
+
+        await ConsumerLagReporter(broker=broker).report() # type: ignore[arg-type]
+
+        assert lag("lag.a", 0) == 3
+        assert lag("lag.a", 1) == 0
+        assert lag("lag.b", 0) is None
+
+    async def test_drops_revoked_partitions(self) -> None:
+        tp0 = TopicPartition("lag.revoked", 0)
+        consumer = FakeAssignedConsumer(positions={tp0: 1}, highwaters={tp0: 5})
+        reporter = ConsumerLagReporter(broker=FakeBroker(subscribers=[FakeSubscriber(consumer=consumer)])) # type: ignore[arg-type]
+
+        await reporter.report()
+        consumer.positions.clear()
+        await reporter.report()
+
+        assert lag("lag.revoked", 0) is None
@@ -0,0 +1,83 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import NullPool, create_engine, exc, text
+from sqlalchemy.pool import QueuePool
+
+from app.core.configs.db_pool import DEFAULT_DB_POOLS, merge_db_pools
+from app.core.db.pool import InstrumentedPoolMixin, InstrumentedQueuePool, instrument_pool, pool_options
+
+
+class SyncInstrumentedPool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+def sample(name: str, engine: str) -> float | None:
+    return REGISTRY.get_sample_value(name, {"role": "test", "engine": engine})
+
+
+@pytest.mark.unit
+class TestPoolOptions:
+
+    def test_merge_keeps_defaults(self) -> None:
+        merged = merge_db_pools({"external.api": {"pool_size": 4, "max_overflow": 0}})
+
+        assert merged["external.api"] == {"pool_size": 4, "max_overflow": 0}
+        assert merged["internal.worker"] == DEFAULT_DB_POOLS["internal.worker"]
+
+    def test_zero_pool_size_uses_null_pool(self) -> None:
+        options = pool_options({"pool_size": 0, "max_overflow": 0})
+
+        assert options == {"poolclass": NullPool}
+
+    def test_queue_pool_settings(self) -> None:
+        options = pool_options(DEFAULT_DB_POOLS["external.api"])
+
+        assert options["poolclass"] is InstrumentedQueuePool
+        assert (options["pool_size"], options["max_overflow"], options["pool_recycle"]) == (2, 3, 300)
+
+    def test_external_mode_disables_statement_caches(self) -> None:
+        connect_args = pool_options(DEFAULT_DB_POOLS["external.worker"], external=True)["connect_args"]
+
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        assert connect_args["prepared_statement_name_func"]() != connect_args["prepared_statement_name_func"]()
+
+
+@pytest.mark.unit
+class TestPoolMetrics:
+
+    def make_engine(self, name: str, **kwargs):
+        engine = create_engine("sqlite://", poolclass=SyncInstrumentedPool, **kwargs)
+        instrument_pool(engine, role="test", name=name)
+        return engine
+
+    def test_checked_out_and_overflow(self) -> None:
+        engine = self.make_engine("overflow", pool_size=1, max_overflow=1)
+
+        first = engine.connect()
+        second = engine.connect()
+        assert sample("db_pool_checked_out_connections", "overflow") == 2
+        assert sample("db_pool_overflow_connections", "overflow") == 1
+
+        second.close()
+        first.close()
+        assert sample("db_pool_checked_out_connections", "overflow") == 0
+        assert sample("db_pool_overflow_connections", "overflow") == 0
+
+    def test_timeout_is_counted(self) -> None:
+        engine = self.make_engine("timeout", pool_size=1, max_overflow=0, pool_timeout=0.01)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        assert sample("db_pool_timeouts_total", "timeout") == 1
+        assert sample("db_pool_checked_out_connections", "timeout") == 0
+
+    def test_labels_survive_dispose(self) -> None:
+        engine = self.make_engine("dispose", pool_size=1, max_overflow=0)
+
+        engine.dispose()
+
+        assert engine.pool.metric_labels == {"role": "test", "engine": "dispose"}
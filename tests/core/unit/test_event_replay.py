@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from app.core.db.event import EventLog
+from app.core.events.event import BaseEvent
+from app.core.events.replay import EventReplayer
+from app.core.message_brokers.kafka import KafkaMessageBroker
+from app.core.utils import now_utc
+from tests.mocks import FakeKafkaProducer, FakeReplayCheckpointStore, FakeStreamSession
+
+
+@dataclass(frozen=True)
+class MockReplayedEvent(BaseEvent):
+    user_id: int
+
+    __event_name__: str = "tests.replay.event"
+
+    def get_partition_key(self) -> str:
+        return str(self.user_id)
+
+
+def make_rows(count: int) -> list[EventLog]:
+    started = now_utc()
+    return [
+        EventLog(
+            event_id=uuid4(),
+            created_at=started + timedelta(seconds=i),
+            payload={"user_id": i, "event_name": MockReplayedEvent.get_name()},
+            meta_data={},
+        )
+        for i in range(count)
+    ]
+
+
+def make_replayer(session: FakeStreamSession, producer: FakeKafkaProducer) -> EventReplayer:
+    consumer: Any = None
+    broker = KafkaMessageBroker(producer=producer, consumer=consumer) # type: ignore[arg-type]
+    return EventReplayer(
+        session=session, # type: ignore[arg-type]
+        message_broker=broker,
+        checkpoints=FakeReplayCheckpointStore(),
+        batch_size=2,
+    )
+
+
+@pytest.mark.unit
+class TestEventReplayer:
+
+    async def test_replay_publishes_in_batches_and_checkpoints(self) -> None:
+        rows = make_rows(5)
+        producer = FakeKafkaProducer()
+        replayer = make_replayer(FakeStreamSession(rows=rows), producer)
+
+        result = await replayer.replay(name="backfill", topic="users")
+
+        assert result.published == 5
+        assert [orjson.loads(value)["event_id"] for _, _, value in producer.sent] == [ # type: ignore[arg-type]
+            str(row.event_id) for row in rows
+        ]
+        assert result.checkpoint is not None
+        assert result.checkpoint.event_id == rows[-1].event_id
+        assert await replayer.checkpoints.get("backfill") == result.checkpoint
+
+    async def test_replay_resumes_after_checkpoint(self) -> None:
+        session = FakeStreamSession(rows=make_rows(2))
+        replayer = make_replayer(session, FakeKafkaProducer())
+
+        await replayer.replay(name="backfill", topic="users")
+        await replayer.replay(name="backfill", topic="users")
+
+        compiled = str(session.statements[-1])
+        assert "(events_log.created_at, events_log.event_id) >" in compiled
+
+    async def test_replay_skips_unknown_events(self) -> None:
+        rows = make_rows(1)
+        rows[0].payload = {"event_name": "tests.replay.unknown"}
+        producer = FakeKafkaProducer()
+
+        result = await make_replayer(FakeStreamSession(rows=rows), producer).replay(name="backfill", topic="users")
+
+        assert result.skipped == 1
+        assert not producer.sent
+
+    async def test_replay_filters_event_names_from_payload_or_meta_data(self) -> None:
+        session = FakeStreamSession(rows=[])
+
+        await make_replayer(session, FakeKafkaProducer()).replay(
+            name="backfill", topic="users", event_names=[MockReplayedEvent.get_name()]
+        )
+
+        compiled = str(session.statements[-1])
+        assert "coalesce((events_log.payload ->> " in compiled
+        assert "(events_log.meta_data ->> " in compiled
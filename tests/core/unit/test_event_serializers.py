@@ -0,0 +1,56 @@
+from dataclasses import asdict, dataclass
+
+import orjson
+import pytest
+
+from app.core.events.event import BaseEvent
+from app.core.exceptions import UnknownEventError
+from app.core.message_brokers.converters import (
+    EventSerializerRegistry,
+    convert_broker_message_to_event,
+    convert_event_to_broker_message,
+)
+
+
+@dataclass(frozen=True)
+class MockSerializedEvent(BaseEvent):
+    user_id: int
+    username: str
+    reason: str | None
+
+    __event_name__: str = "tests.serializer.event"
+
+    def get_partition_key(self) -> str:
+        return str(self.user_id)
+
+
+@pytest.mark.unit
+class TestEventSerializers:
+
+    def test_encode_matches_asdict_payload(self) -> None:
+        event = MockSerializedEvent(user_id=1, username="user", reason=None)
+
+        expected = asdict(event)
+        expected["event_name"] = event.get_name()
+
+        assert convert_event_to_broker_message(event) == orjson.dumps(expected)
+
+    def test_decode_restores_typed_event(self) -> None:
+        event = MockSerializedEvent(user_id=1, username="user", reason="login")
+
+        decoded = convert_broker_message_to_event(convert_event_to_broker_message(event))
+
+        assert decoded == event
+
+    def test_decode_discovers_event_by_name(self) -> None:
+        registry = EventSerializerRegistry()
+        event = MockSerializedEvent(user_id=2, username="user", reason=None)
+
+        decoded = registry.decode(orjson.dumps({**asdict(event), "event_name": event.get_name()}))
+
+        assert decoded == event
+        assert registry.by_name[event.get_name()].event_type is MockSerializedEvent
+
+    def test_decode_unknown_event_raises(self) -> None:
+        with pytest.raises(UnknownEventError):
+            EventSerializerRegistry().decode({"event_name": "tests.serializer.unknown"})
@@ -0,0 +1,107 @@
+from collections.abc import AsyncIterator, Sequence
+
+import orjson
+import pytest
+from pydantic import BaseModel
+from starlette.types import Message
+
+from app.core.api.export import ExportFormat, ExportLimiter, encode_csv, export_response
+from app.core.db.query_budget import query_stats, track_queries
+from app.core.exceptions import ServiceOverloadedError
+
+
+class Item(BaseModel):
+    id: int
+    name: str | None = None
+    tags: list[str] = []
+
+
+async def batches(*groups: list[Item]) -> AsyncIterator[Sequence[Item]]:
+    for group in groups:
+        yield group
+
+
+async def consume(response) -> tuple[list[Message], bytes]:
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await response({"type": "http", "method": "GET", "path": "/"}, receive, send)
+    return messages, b"".join(message.get("body", b"") for message in messages)
+
+
+@pytest.mark.unit
+class TestExportEncoding:
+
+    async def test_ndjson_streams_one_line_per_item(self) -> None:
+        response = export_response(
+            batches([Item(id=1, name="a")], [Item(id=2)]),
+            export_format=ExportFormat.NDJSON, columns=("id",), filename="items", limiter=ExportLimiter(),
+        )
+        messages, body = await consume(response)
+
+        assert [orjson.loads(line) for line in body.splitlines()] == [{"id": 1, "name": "a"}, {"id": 2}]
+        assert dict(messages[0]["headers"])[b"content-type"] == b"application/x-ndjson"
+        assert sum(1 for message in messages if message.get("body")) == 2
+
+    async def test_csv_writes_header_once(self) -> None:
+        response = export_response(
+            batches([Item(id=1, tags=["x"])], [Item(id=2, name="b,c")]),
+            export_format=ExportFormat.CSV, columns=("id", "name", "tags"), filename="items", limiter=ExportLimiter(),
+        )
+        _, body = await consume(response)
+
+        assert body.decode().splitlines() == ["id,name,tags", '1,,"[""x""]"', '2,"b,c",[]']
+
+    def test_csv_only_selected_columns(self) -> None:
+        assert encode_csv([Item(id=1, name="a")], ("name",), header=True) == b"name\r\na\r\n"
+
+
+@pytest.mark.unit
+class TestExportLimiter:
+
+    async def test_rejects_when_slots_are_taken(self) -> None:
+        limiter = ExportLimiter(max_concurrent=1, retry_after=3)
+        response = export_response(
+            batches(), export_format=ExportFormat.NDJSON, columns=(), filename="items", limiter=limiter,
+        )
+
+        with pytest.raises(ServiceOverloadedError) as exc:
+            limiter.acquire()
+        assert exc.value.headers == {"Retry-After": "3"}
+
+        await consume(response)
+        assert limiter.active == 0
+
+    async def test_releases_slot_when_stream_fails(self) -> None:
+        async def failing() -> AsyncIterator[Sequence[Item]]:
+            yield [Item(id=1)]
+            raise RuntimeError
+
+        limiter = ExportLimiter(max_concurrent=1)
+        response = export_response(
+            failing(), export_format=ExportFormat.NDJSON, columns=(), filename="items", limiter=limiter,
+        )
+
+        with pytest.raises(RuntimeError):
+            await consume(response)
+        assert limiter.active == 0
+
+    async def test_stream_is_excluded_from_request_query_budget(self) -> None:
+        seen = []
+
+        async def tracked() -> AsyncIterator[Sequence[Item]]:
+            seen.append(query_stats.get())
+            yield []
+
+        with track_queries(budget=1):
+            response = export_response(
+                tracked(), export_format=ExportFormat.NDJSON, columns=(), filename="items", limiter=ExportLimiter(),
+            )
+            await consume(response)
+
+        assert seen == [None]
@@ -0,0 +1,96 @@
+from typing import Any
+
+import pytest
+from sqlalchemy import Table, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.auth.filters.users import UserFilter
+from app.core.db.convertor import SQLAlchemyFilterConverter
+from app.core.db.search import TRIGRAM_OPS, search_vector_column, trigram_index
+from app.core.filters.base import BaseFilter
+from app.core.filters.condition import FilterOperator
+from app.core.models import User
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Article(Base):
+    __tablename__ = "articles"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str]
+    body: Mapped[str]
+    search_vector: Mapped[Any] = search_vector_column("title", "body")
+
+    __table_args__ = (trigram_index("articles", "title"),)
+
+
+def has_trigram_index(table: Table, column: str) -> bool:
+    return any(
+        index.dialect_options["postgresql"]["using"] == "gin"
+        and [col.name for col in index.columns] == [column]
+        and (index.dialect_options["postgresql"]["ops"] or {}).get(column) == TRIGRAM_OPS
+        for index in table.indexes
+    )
+
+
+class ArticleFilter(BaseFilter):
+    searchable_fields = frozenset({"title"})
+
+    def __init__(self, operator: FilterOperator, field: str, value: str) -> None:
+        self.operator, self.field, self.value = operator, field, value
+        super().__init__()
+
+    def build_condition(self) -> None:
+        self.add_condition(self.field, self.operator, self.value)
+
+
+def compile_where(article_filter: BaseFilter) -> tuple[str, dict]:
+    conditions = SQLAlchemyFilterConverter.filter_to_sqlalchemy_conditions(Article, article_filter)
+    compiled = select(Article.id).where(*conditions).compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+@pytest.mark.unit
+class TestSearchableFields:
+
+    def test_searchable_field_escapes_wildcards(self) -> None:
+        sql, params = compile_where(ArticleFilter(FilterOperator.CONTAINS, "title", "50%_off"))
+
+        assert "ILIKE" in sql and "ESCAPE '/'" in sql
+        assert params["title_1"] == "50/%/_off"
+
+    def test_plain_field_keeps_legacy_pattern(self) -> None:
+        sql, params = compile_where(ArticleFilter(FilterOperator.STARTS_WITH, "body", "abc"))
+
+        assert "ESCAPE" not in sql
+        assert params["body_1"] == "abc%"
+
+    def test_user_searchable_fields_have_trigram_indexes(self) -> None:
+        assert all(has_trigram_index(User.__table__, name) for name in UserFilter.searchable_fields)
+        assert not has_trigram_index(Article.__table__, "body")
+
+
+@pytest.mark.unit
+class TestFullTextSearch:
+
+    def test_search_operator_uses_tsquery(self) -> None:
+        sql, params = compile_where(ArticleFilter(FilterOperator.SEARCH, "search_vector", "fast api"))
+
+        assert "articles.search_vector @@ websearch_to_tsquery" in sql
+        assert "fast api" in params.values()
+
+    def test_rank_orders_search_results(self) -> None:
+        article_filter = ArticleFilter(FilterOperator.SEARCH, "search_vector", "fast api")
+        clauses = SQLAlchemyFilterConverter.get_search_rank_attributes(Article, article_filter)
+
+        assert len(clauses) == 1
+        assert "ts_rank_cd(articles.search_vector" in str(clauses[0].compile(dialect=postgresql.dialect()))
+
+    def test_search_vector_is_deferred_generated_column(self) -> None:
+        column = Article.__table__.c.search_vector
+
+        assert column.computed is not None and column.computed.persisted
+        assert "search_vector" not in str(select(Article))
@@ -0,0 +1,62 @@
+import asyncio
+import time
+
+import orjson
+import pytest
+
+from app.core.websockets.service import ConnectionManager
+from tests.mocks import FakeRedisPubSubHub, FakeWebSocket
+
+
+def make_manager(**kwargs: float | int | None) -> ConnectionManager:
+    return ConnectionManager(redis=FakeRedisPubSubHub(), heartbeat_interval=4, heartbeat_slots=4, **kwargs) # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+class TestHeartbeatWheel:
+
+    async def test_sweep_pings_one_slot_per_tick(self) -> None:
+        manager = make_manager()
+        early = FakeWebSocket()
+        await manager.bind_connection(early, "user:1")
+        await manager.heartbeat.sweep()
+        late = FakeWebSocket()
+        await manager.bind_connection(late, "user:2")
+
+        pinged_per_tick = []
+        for _ in range(4):
+            await manager.heartbeat.sweep()
+            await asyncio.sleep(0)
+            pinged_per_tick.append((len(early.sent), len(late.sent)))
+
+        assert pinged_per_tick == [(0, 0), (0, 0), (1, 0), (1, 1)]
+        assert orjson.loads(early.sent[0])["type"] == "ping"
+
+    async def test_ping_frame_is_encoded_once_per_tick(self) -> None:
+        manager = make_manager()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for idx, websocket in enumerate(sockets):
+            await manager.bind_connection(websocket, f"user:{idx}")
+
+        for _ in range(4):
+            await manager.heartbeat.sweep()
+        await asyncio.sleep(0)
+
+        assert all(websocket.sent[0] is sockets[0].sent[0] for websocket in sockets)
+
+    async def test_closes_connections_without_recent_messages(self) -> None:
+        manager = make_manager(heartbeat_timeout=10)
+        alive, dead = FakeWebSocket(), FakeWebSocket()
+        await manager.bind_connection(alive, "user:1")
+        await manager.bind_connection(dead, "user:2")
+        manager.heartbeat.last_seen[dead] = time.monotonic() - 60
+        manager.heartbeat.last_seen[alive] = time.monotonic() - 60
+        manager.mark_alive(alive)
+
+        for _ in range(4):
+            await manager.heartbeat.sweep()
+
+        assert dead.closed
+        assert "user:2" not in manager.connections_map
+        assert not alive.closed
+        assert dead not in manager.heartbeat.positions
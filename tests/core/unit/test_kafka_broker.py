@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+import pytest
+
+from app.core.events.event import BaseEvent
+from app.core.message_brokers.kafka import KafkaMessageBroker
+from tests.mocks import FakeKafkaProducer
+
+
+@dataclass(frozen=True)
+class MockBrokerEvent(BaseEvent):
+    user_id: int
+
+    __event_name__: str = "tests.broker.sent"
+
+    def get_partition_key(self) -> str:
+        return str(self.user_id)
+
+
+def make_broker(producer: FakeKafkaProducer) -> KafkaMessageBroker:
+    consumer: Any = None
+    return KafkaMessageBroker(producer=producer, consumer=consumer) # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+class TestKafkaMessageBrokerProducer:
+
+    async def test_send_events_batch_uses_partition_keys(self) -> None:
+        producer = FakeKafkaProducer()
+        broker = make_broker(producer)
+
+        await broker.send_events_batch("users", [MockBrokerEvent(user_id=i) for i in range(3)])
+
+        assert [key for _, key, _ in producer.sent] == [b"0", b"1", b"2"]
+        assert orjson.loads(producer.sent[0][2])["event_name"] == "tests.broker.sent" # type: ignore[arg-type]
+
+    async def test_send_events_batch_raises_on_failed_delivery(self) -> None:
+        broker = make_broker(FakeKafkaProducer(fail=True))
+
+        with pytest.raises(RuntimeError):
+            await broker.send_events_batch("users", [MockBrokerEvent(user_id=1)])
+
+    async def test_send_event_tracks_delivery_until_flush(self) -> None:
+        producer = FakeKafkaProducer()
+        broker = make_broker(producer)
+
+        await broker.send_event("1", "users", MockBrokerEvent(user_id=1))
+        await broker.flush()
+
+        assert len(producer.sent) == 1
+        assert not broker.pending_deliveries
@@ -0,0 +1,116 @@
+import asyncio
+
+import orjson
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from app.core.middlewares.load_shedding import AIMDLimiter, LoadSheddingMiddleware, RequestPriority
+
+
+def make_scope(method: str, path: str) -> Scope:
+    return {"type": "http", "method": method, "path": path, "headers": [], "state": {}}
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+@pytest.mark.unit
+class TestAIMDLimiter:
+
+    def test_priority_shares_shed_low_first(self) -> None:
+        limiter = AIMDLimiter(limit=10)
+        for _ in range(5):
+            assert limiter.try_acquire(RequestPriority.NORMAL)
+
+        assert not limiter.try_acquire(RequestPriority.LOW)
+        assert limiter.try_acquire(RequestPriority.NORMAL)
+        assert limiter.try_acquire(RequestPriority.HIGH)
+
+    def test_slow_responses_decrease_limit_once_per_target(self) -> None:
+        limiter = AIMDLimiter(limit=20, latency_target=1.0, backoff=0.5, in_flight=3)
+
+        limiter.release(latency=2.0, now=10.0)
+        limiter.release(latency=2.0, now=10.5)
+        assert limiter.limit == 10
+
+        limiter.release(latency=2.0, now=11.0)
+        assert limiter.limit == 5
+        assert limiter.in_flight == 0
+
+    def test_limit_is_bounded(self) -> None:
+        limiter = AIMDLimiter(limit=6, min_limit=5, max_limit=6, backoff=0.5, in_flight=2)
+
+        limiter.release(latency=0.1, dropped=True, now=10.0)
+        assert limiter.limit == 5
+
+        limiter.in_flight = 50
+        for _ in range(50):
+            limiter.release(latency=0.1)
+        assert limiter.limit == 6
+
+    def test_fast_responses_grow_limit_only_when_utilised(self) -> None:
+        limiter = AIMDLimiter(limit=10, in_flight=1)
+        limiter.release(latency=0.1)
+        assert limiter.limit == 10
+
+        limiter.in_flight = 6
+        limiter.release(latency=0.1)
+        assert limiter.limit == pytest.approx(10.1)
+
+
+@pytest.mark.unit
+class TestLoadSheddingMiddleware:
+
+    async def test_saturated_route_gets_fast_503(self) -> None:
+        release = asyncio.Event()
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        middleware = LoadSheddingMiddleware(app, limiter=AIMDLimiter(limit=1), retry_after=2)
+        slow_sent: list[Message] = []
+
+        async def slow_send(message: Message) -> None:
+            slow_sent.append(message)
+
+        slow = asyncio.create_task(middleware(make_scope("GET", "/api/v1/items"), receive, slow_send))
+        await asyncio.sleep(0)
+
+        rejected: list[Message] = []
+
+        async def reject_send(message: Message) -> None:
+            rejected.append(message)
+
+        await middleware(make_scope("POST", "/api/v1/items"), receive, reject_send)
+        release.set()
+        await slow
+
+        assert rejected[0]["status"] == 503
+        assert (b"retry-after", b"2") in rejected[0]["headers"]
+        assert orjson.loads(rejected[1]["body"])["error"]["code"] == "SERVICE_OVERLOADED"
+        assert slow_sent[0]["status"] == 200
+        assert middleware.limiter.in_flight == 0
+
+    async def test_critical_routes_bypass_limiter(self) -> None:
+        sent: list[Message] = []
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        async def collect(message: Message) -> None:
+            sent.append(message)
+
+        middleware = LoadSheddingMiddleware(app, limiter=AIMDLimiter(limit=0, min_limit=0))
+        await middleware(make_scope("GET", "/health"), receive, collect)
+
+        assert sent[0]["status"] == 200
+
+    def test_route_priorities(self) -> None:
+        middleware = LoadSheddingMiddleware(app=None) # type: ignore[arg-type]
+
+        assert middleware.get_priority("POST", "/api/v1/auth/refresh") is RequestPriority.HIGH
+        assert middleware.get_priority("GET", "/api/v1/users/") is RequestPriority.LOW
+        assert middleware.get_priority("GET", "/api/v1/users/me") is RequestPriority.NORMAL
@@ -0,0 +1,130 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+import pytest
+from aiokafka import TopicPartition
+
+from app.core.message_brokers.consumer import PartitionedConsumer
+from tests.mocks import FakeKafkaConsumer
+
+
+@dataclass(frozen=True)
+class MockRecord:
+    offset: int
+    key: bytes
+    value: bytes
+
+
+def make_records(key: str, offsets: range) -> list[MockRecord]:
+    return [
+        MockRecord(offset=offset, key=key.encode(), value=orjson.dumps({"key": key, "offset": offset}))
+        for offset in offsets
+    ]
+
+
+def make_runtime(
+    consumer: FakeKafkaConsumer, handler: Any, lanes_per_partition: int = 1, **options: Any
+) -> PartitionedConsumer:
+    return PartitionedConsumer(
+        consumer=consumer, # type: ignore[arg-type]
+        handler=handler,
+        queue_size=2,
+        lanes_per_partition=lanes_per_partition,
+        **options,
+    )
+
+
+@pytest.mark.unit
+class TestPartitionedConsumer:
+
+    async def test_keeps_order_per_partition_and_commits_batch(self) -> None:
+        tp0, tp1 = TopicPartition("users", 0), TopicPartition("users", 1)
+        consumer = FakeKafkaConsumer(batches=[{tp0: make_records("a", range(5)), tp1: make_records("b", range(3))}])
+        handled: list[tuple[str, int]] = []
+
+        async def handler(message: dict[str, Any]) -> None:
+            await asyncio.sleep(0)
+            handled.append((message["key"], message["offset"]))
+
+        await make_runtime(consumer, handler).run(["users"])
+
+        assert [offset for key, offset in handled if key == "a"] == [0, 1, 2, 3, 4]
+        assert [offset for key, offset in handled if key == "b"] == [0, 1, 2]
+        assert consumer.committed == [{tp0: 5, tp1: 3}]
+
+    async def test_failed_message_rewinds_partition_without_commit(self) -> None:
+        tp0, tp1 = TopicPartition("users", 0), TopicPartition("users", 1)
+        consumer = FakeKafkaConsumer(batches=[{tp0: make_records("a", range(4)), tp1: make_records("b", range(2))}])
+        handled: list[tuple[str, int]] = []
+
+        async def handler(message: dict[str, Any]) -> None:
+            if message["key"] == "a" and message["offset"] == 1:
+                raise RuntimeError("boom")
+            handled.append((message["key"], message["offset"]))
+
+        await make_runtime(consumer, handler).run(["users"])
+
+        assert ("a", 2) not in handled
+        assert consumer.seeks == [(tp0, 1)]
+        assert consumer.paused == {tp0}
+        assert consumer.committed == [{tp1: 2}]
+
+    async def test_poison_message_is_dead_lettered_after_retries(self) -> None:
+        tp0 = TopicPartition("users", 0)
+        consumer = FakeKafkaConsumer(batches=[
+            {tp0: make_records("a", range(3))},
+            {tp0: make_records("a", range(1, 3))},
+            {tp0: make_records("a", range(1, 3))},
+            {tp0: make_records("a", range(2, 3))},
+        ])
+        handled: list[int] = []
+        dead_letters: list[int] = []
+
+        async def handler(message: dict[str, Any]) -> None:
+            if message["offset"] == 1:
+                raise RuntimeError("poison")
+            handled.append(message["offset"])
+
+        async def dead_letter(record: Any) -> None:
+            dead_letters.append(record.offset)
+
+        await make_runtime(consumer, handler, max_retries=2, retry_backoff_ms=0, dead_letter=dead_letter).run(["users"])
+
+        assert dead_letters == [1]
+        assert handled == [0, 2]
+        assert consumer.seeks == [(tp0, 1), (tp0, 1), (tp0, 2)]
+        assert consumer.committed == [{tp0: 2}, {tp0: 3}]
+        assert consumer.paused == set()
+
+    async def test_failed_dead_letter_keeps_partition_on_message(self) -> None:
+        tp0 = TopicPartition("users", 0)
+        consumer = FakeKafkaConsumer(batches=[{tp0: make_records("a", range(1))}, {tp0: make_records("a", range(1))}])
+
+        async def handler(message: dict[str, Any]) -> None:
+            raise RuntimeError("poison")
+
+        async def dead_letter(record: Any) -> None:
+            raise RuntimeError("dlq down")
+
+        await make_runtime(consumer, handler, max_retries=1, retry_backoff_ms=0, dead_letter=dead_letter).run(["users"])
+
+        assert consumer.seeks == [(tp0, 0), (tp0, 0)]
+        assert consumer.committed == []
+
+    async def test_lanes_keep_order_per_key_inside_partition(self) -> None:
+        tp0 = TopicPartition("users", 0)
+        records = make_records("a", range(0, 6, 2)) + make_records("b", range(1, 6, 2))
+        consumer = FakeKafkaConsumer(batches=[{tp0: sorted(records, key=lambda r: r.offset)}])
+        handled: list[tuple[str, int]] = []
+
+        async def handler(message: dict[str, Any]) -> None:
+            await asyncio.sleep(0)
+            handled.append((message["key"], message["offset"]))
+
+        await make_runtime(consumer, handler, lanes_per_partition=4).run(["users"])
+
+        assert [offset for key, offset in handled if key == "a"] == [0, 2, 4]
+        assert [offset for key, offset in handled if key == "b"] == [1, 3, 5]
+        assert consumer.committed == [{tp0: 6}]
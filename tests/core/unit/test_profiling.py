@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import pytest
+from pyinstrument.renderers import HTMLRenderer
+from pyinstrument.session import Session
+from starlette.types import Message, Receive, Scope, Send
+
+from app.core.middlewares.profiling import ProfilingMiddleware
+from app.core.profiling.store import BaseProfileStore, ProfileCapture
+from app.core.utils import now_utc
+from tests.mocks import FakeProfileStore
+
+
+def make_scope(path: str) -> Scope:
+    return {"type": "http", "method": "GET", "path": path, "headers": []}
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def discard(message: Message) -> None:
+    return None
+
+
+def make_middleware(store: FakeProfileStore, **kwargs: float | str | None) -> ProfilingMiddleware:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        deadline = time.perf_counter() + float(scope.get("work", 0))
+        while time.perf_counter() < deadline:
+            sum(range(1000))
+        await asyncio.sleep(0)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def get_store(scope: Scope) -> BaseProfileStore:
+        return store
+
+    return ProfilingMiddleware(app, get_store=get_store, **kwargs) # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+class TestProfilingMiddleware:
+
+    async def test_slow_matching_request_is_captured(self) -> None:
+        store = FakeProfileStore()
+        middleware = make_middleware(store, route_pattern="^/slow", slow_threshold=0.02)
+
+        await middleware({**make_scope("/slow"), "work": 0.05}, receive, discard)
+
+        capture = store.captures[0]
+        assert capture.path == "/slow"
+        assert capture.duration_ms >= 20
+        html = HTMLRenderer().render(Session.from_json(store.sessions[capture.id]))
+        assert "<html" in html.lower()
+        assert middleware.active == 0
+
+    async def test_fast_request_is_discarded(self) -> None:
+        store = FakeProfileStore()
+        middleware = make_middleware(store, route_pattern="^/", slow_threshold=10)
+
+        await middleware(make_scope("/fast"), receive, discard)
+
+        assert store.captures == []
+
+    def test_sampling_decision(self) -> None:
+        middleware = make_middleware(FakeProfileStore(), route_pattern="^/api/v1/users")
+
+        assert middleware.should_profile("/api/v1/users/")
+        assert not middleware.should_profile("/api/v1/roles/")
+        middleware.sample_rate = 1.0
+        assert middleware.should_profile("/api/v1/roles/")
+        middleware.active = middleware.max_concurrent
+        assert not middleware.should_profile("/api/v1/users/")
+
+
+@pytest.mark.unit
+def test_profile_capture_roundtrip() -> None:
+    capture = ProfileCapture(
+        id="abc", method="GET", path="/users", route="/users", duration_ms=512.5, created_at=now_utc()
+    )
+
+    assert ProfileCapture.load(capture.dump()) == capture
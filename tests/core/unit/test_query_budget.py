@@ -0,0 +1,103 @@
+import logging
+
+import pytest
+from sqlalchemy import ForeignKey, create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
+from starlette.types import Message, Receive, Scope, Send
+
+from app.core.db.exceptions import QueryBudgetExceededError
+from app.core.db.query_budget import track_queries
+from app.core.middlewares.query_budget import QueryBudgetMiddleware
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Author(Base):
+    __tablename__ = "authors"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    books: Mapped[list[Book]] = relationship()
+
+
+class Book(Base):
+    __tablename__ = "books"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    author_id: Mapped[int] = mapped_column(ForeignKey("authors.id"))
+
+
+@pytest.fixture
+def session() -> Session:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Author(id=idx, books=[Book()]) for idx in range(3)])
+        session.commit()
+        session.expunge_all()
+        yield session
+
+
+@pytest.mark.unit
+class TestTrackQueries:
+
+    def test_lazy_loads_and_repeated_statements(self, session: Session) -> None:
+        with track_queries() as stats:
+            for author in session.scalars(select(Author)):
+                _ = author.books
+
+        assert stats.count == 4
+        assert stats.lazy_loads == {"Author.books": 3}
+        assert stats.repeated(3)[0][1] == 3
+
+    def test_nested_tracking_propagates_to_parent(self, session: Session) -> None:
+        with track_queries() as outer:
+            with track_queries() as inner:
+                session.execute(select(Author))
+            session.execute(select(Book))
+
+        assert inner.count == 1
+        assert outer.count == 2
+
+    def test_budget_raises_once(self, session: Session) -> None:
+        with track_queries(budget=1, raise_on_exceed=True) as stats:
+            session.execute(select(Author))
+            with pytest.raises(QueryBudgetExceededError):
+                session.execute(select(Book))
+            session.execute(select(Book))
+
+        assert stats.exceeded
+        assert stats.count == 3
+
+    def test_no_tracking_outside_context(self, session: Session) -> None:
+        session.execute(select(Author))
+
+        with track_queries() as stats:
+            pass
+        assert stats.count == 0
+
+
+@pytest.mark.unit
+class TestQueryBudgetMiddleware:
+
+    async def test_reports_n_plus_one_per_route(self, session: Session, caplog: pytest.LogCaptureFixture) -> None:
+        route = type("Route", (), {"path": "/authors"})()
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            scope["route"] = route
+            for author in session.scalars(select(Author)):
+                _ = author.books
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        async def receive() -> Message:
+            return {"type": "http.request"}
+
+        async def send(message: Message) -> None:
+            return None
+
+        middleware = QueryBudgetMiddleware(app, budgets={"GET /authors": 2}, repeat_threshold=3)
+        with caplog.at_level(logging.WARNING):
+            await middleware({"type": "http", "method": "GET", "path": "/authors"}, receive, send)
+
+        messages = {record.getMessage(): record for record in caplog.records}
+        assert messages["Query budget exceeded"].budget == 2
+        assert messages["Possible N+1 queries"].lazy_loads == {"Author.books": 3}
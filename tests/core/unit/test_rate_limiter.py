@@ -0,0 +1,103 @@
+import pytest
+
+from app.core.configs.app import AppConfig
+from app.core.configs.rate_limit import RateLimitRule
+from app.core.services.rate_limit.base import RateLimitResult
+from app.core.services.rate_limit.local import LocalRateLimitCache
+from app.core.services.rate_limit.service import RedisRateLimiter
+from tests.mocks import FakeScriptRedis
+
+SLIDING: RateLimitRule = {"times": 2, "seconds": 60}
+BUCKET: RateLimitRule = {"times": 2, "seconds": 60, "algorithm": "token_bucket"}
+
+
+@pytest.mark.unit
+class TestLocalRateLimitCache:
+
+    def test_denied_key_is_rejected_until_retry_after(self) -> None:
+        cache = LocalRateLimitCache()
+        cache.record("k", BUCKET, RateLimitResult(allowed=False, retry_after=5), now=100)
+
+        assert cache.check("k", BUCKET, now=102) == 3
+        assert cache.check("k", BUCKET, now=105) == 0
+        assert "k" not in cache.blocked
+
+    def test_local_window_rejects_clearly_over_limit(self) -> None:
+        cache = LocalRateLimitCache()
+        for now in (100, 110):
+            assert cache.check("k", SLIDING, now=now) == 0
+            cache.record("k", SLIDING, RateLimitResult(allowed=True), now=now)
+
+        assert cache.check("k", SLIDING, now=120) == 40
+        assert cache.check("k", SLIDING, now=160) == 0
+
+    def test_token_bucket_is_not_counted_locally(self) -> None:
+        cache = LocalRateLimitCache()
+        for now in (100, 101, 102):
+            cache.record("k", BUCKET, RateLimitResult(allowed=True), now=now)
+
+        assert cache.check("k", BUCKET, now=103) == 0
+
+    def test_keys_are_bounded(self) -> None:
+        cache = LocalRateLimitCache(max_keys=2)
+        for key in ("a", "b", "c"):
+            cache.record(key, SLIDING, RateLimitResult(allowed=True), now=100)
+
+        assert list(cache.windows) == ["b", "c"]
+
+
+@pytest.mark.unit
+class TestRedisRateLimiter:
+
+    async def test_sliding_window_script_call(self) -> None:
+        redis = FakeScriptRedis(replies=[[1, 1, 0]])
+        limiter = RedisRateLimiter(redis=redis) # type: ignore[arg-type]
+
+        result = await limiter.hit("auth.login", "ip:1.2.3.4", SLIDING)
+
+        assert result == RateLimitResult(allowed=True, remaining=1, retry_after=0)
+        keys, args = redis.scripts[0].calls[0]
+        assert keys == ["rate_limit:auth.login:ip:1.2.3.4"]
+        assert args[:2] == [2, 60_000]
+        assert len(args) == 3
+
+    async def test_token_bucket_script_call(self) -> None:
+        redis = FakeScriptRedis(replies=[[0, 0, 1500]])
+        limiter = RedisRateLimiter(redis=redis) # type: ignore[arg-type]
+
+        result = await limiter.hit("auth.login", "ip:1.2.3.4", BUCKET)
+
+        assert result == RateLimitResult(allowed=False, remaining=0, retry_after=1.5)
+        assert redis.scripts[0].calls == []
+        assert redis.scripts[1].calls[0][1] == [2, 60_000]
+
+    async def test_local_precheck_skips_redis_after_denial(self) -> None:
+        redis = FakeScriptRedis(replies=[[0, 0, 30_000]])
+        limiter = RedisRateLimiter(redis=redis, local=LocalRateLimitCache()) # type: ignore[arg-type]
+
+        first = await limiter.hit("auth.login", "ip:1", SLIDING)
+        second = await limiter.hit("auth.login", "ip:1", SLIDING)
+
+        assert not first.allowed
+        assert not second.allowed
+        assert 0 < second.retry_after <= 30
+        assert len(redis.scripts[0].calls) == 1
+
+    async def test_reset_clears_local_state(self) -> None:
+        redis = FakeScriptRedis(replies=[[0, 0, 30_000], [1, 1, 0]])
+        limiter = RedisRateLimiter(redis=redis, local=LocalRateLimitCache()) # type: ignore[arg-type]
+
+        await limiter.hit("auth.login", "ip:1", SLIDING)
+        await limiter.reset("auth.login", "ip:1")
+        result = await limiter.hit("auth.login", "ip:1", SLIDING)
+
+        assert result.allowed
+        assert redis.deleted == ["rate_limit:auth.login:ip:1"]
+
+
+@pytest.mark.unit
+def test_rate_limits_override_is_merged_with_defaults() -> None:
+    config = AppConfig(RATE_LIMITS={"auth.login": {"times": 10, "seconds": 60, "algorithm": "token_bucket"}})
+
+    assert config.RATE_LIMITS["auth.login"]["algorithm"] == "token_bucket"
+    assert config.RATE_LIMITS["users.register"] == {"times": 4, "seconds": 300}
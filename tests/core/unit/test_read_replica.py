@@ -0,0 +1,138 @@
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, ClassVar
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.core.db.routing import DBRoute, ReadRouter, ReplicaPool, RoutingSession, db_identity, route_to
+from app.core.queries import BaseQuery
+from tests.mocks import FakeWriteTracker
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    source: Mapped[str]
+
+
+@dataclass(frozen=True)
+class ListItemsQuery(BaseQuery):
+    ...
+
+
+@dataclass(frozen=True)
+class GetTokenQuery(BaseQuery):
+    read_from_replica: ClassVar[bool] = False
+
+
+class FakeEngine:
+    def __init__(self, host: str, lag: float | None = 0.0) -> None:
+        self.url = SimpleNamespace(host=host)
+        self.lag = lag
+
+    @asynccontextmanager
+    async def connect(self) -> Any:
+        if self.lag is None:
+            raise ConnectionError
+        yield self
+
+    async def execute(self, statement: Any) -> Any:
+        return SimpleNamespace(scalar_one=lambda: self.lag)
+
+
+def make_engine(source: str) -> Any:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Item).values(id=1, source=source))
+    return engine
+
+
+@pytest.fixture
+def session() -> RoutingSession:
+    replica = make_engine("replica")
+    pool = ReplicaPool(engines=[SimpleNamespace(sync_engine=replica)])
+    pool.healthy = list(pool.engines)
+    with RoutingSession(bind=make_engine("primary"), replicas=pool) as session:
+        yield session
+
+
+@pytest.mark.unit
+class TestRoutingSession:
+
+    def test_reads_go_to_primary_by_default(self, session: RoutingSession) -> None:
+        assert session.scalar(select(Item.source)) == "primary"
+
+    def test_replica_route_reads_from_replica(self, session: RoutingSession) -> None:
+        with route_to(DBRoute.REPLICA):
+            assert session.scalar(select(Item.source)) == "replica"
+            assert session.scalar(select(Item.source).with_for_update()) == "primary"
+
+    def test_writes_stay_on_primary(self, session: RoutingSession) -> None:
+        with route_to(DBRoute.REPLICA):
+            session.add(Item(id=2, source="new"))
+            session.flush()
+            session.execute(insert(Item).values(id=3, source="dml"))
+
+        assert session.scalars(select(Item.id).order_by(Item.id)).all() == [1, 2, 3]
+
+    def test_falls_back_to_primary_without_healthy_replicas(self, session: RoutingSession) -> None:
+        session.replicas.healthy = []
+        with route_to(DBRoute.REPLICA):
+            assert session.scalar(select(Item.source)) == "primary"
+
+
+@pytest.mark.unit
+class TestReplicaPool:
+
+    async def test_health_check_drops_failed_and_lagging_replicas(self) -> None:
+        engines = [FakeEngine("a"), FakeEngine("b", lag=None), FakeEngine("c", lag=30.0), FakeEngine("d")]
+        pool = ReplicaPool(engines=engines, max_lag=5.0)
+
+        await pool.check()
+
+        assert [engine.url.host for engine in pool.healthy] == ["a", "d"]
+
+    async def test_round_robin(self) -> None:
+        pool = ReplicaPool(engines=[FakeEngine("a"), FakeEngine("b")])
+        await pool.check()
+
+        assert [pool.choose().url.host for _ in range(4)] == ["a", "b", "a", "b"]
+
+
+@pytest.mark.unit
+class TestReadRouter:
+
+    @pytest.fixture
+    def router(self) -> ReadRouter:
+        return ReadRouter(replicas=ReplicaPool(engines=[FakeEngine("a")]), tracker=FakeWriteTracker())
+
+    async def test_queries_use_replica(self, router: ReadRouter) -> None:
+        assert await router.route_for_query(ListItemsQuery()) is DBRoute.REPLICA
+        assert await router.route_for_query(GetTokenQuery()) is DBRoute.PRIMARY
+
+    async def test_queries_inside_command_stay_on_primary(self, router: ReadRouter) -> None:
+        with route_to(DBRoute.PRIMARY):
+            assert await router.route_for_query(ListItemsQuery()) is DBRoute.PRIMARY
+
+    async def test_read_your_writes(self, router: ReadRouter) -> None:
+        token = db_identity.set("42")
+        try:
+            await router.after_command()
+            assert await router.route_for_query(ListItemsQuery()) is DBRoute.PRIMARY
+        finally:
+            db_identity.reset(token)
+
+        assert await router.route_for_query(ListItemsQuery()) is DBRoute.REPLICA
+
+    async def test_disabled_without_replicas(self) -> None:
+        router = ReadRouter(replicas=ReplicaPool(), tracker=FakeWriteTracker())
+
+        assert await router.route_for_query(ListItemsQuery()) is DBRoute.PRIMARY
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from app.core.middlewares.timing import TimingMiddleware
+from app.core.timing import RequestTimings, measure, request_timings
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+@pytest.mark.unit
+class TestRequestTimings:
+
+    async def test_measure_accumulates_per_phase(self) -> None:
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        try:
+            for _ in range(2):
+                with measure("redis"):
+                    await asyncio.sleep(0.001)
+        finally:
+            request_timings.reset(token)
+
+        assert timings.counts == {"redis": 2}
+        assert timings.durations_ns["redis"] >= 2_000_000
+
+    def test_nested_phase_is_counted_once(self) -> None:
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        try:
+            with measure("mediator"), measure("mediator"):
+                pass
+        finally:
+            request_timings.reset(token)
+
+        assert timings.counts == {"mediator": 1}
+
+    def test_measure_without_request_is_noop(self) -> None:
+        with measure("db"):
+            pass
+
+        assert request_timings.get() is None
+
+    def test_server_timing_and_log_fields(self) -> None:
+        timings = RequestTimings()
+        timings.add("db", 1_500_000)
+        timings.add("db", 500_000)
+
+        assert timings.server_timing(5_000_000) == 'db;dur=2.000;desc="2", total;dur=5.000'
+        assert timings.as_log_fields() == {"db_time_ms": 2.0, "db_count": 2}
+
+
+@pytest.mark.unit
+class TestTimingMiddleware:
+
+    async def test_server_timing_header(self) -> None:
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            with measure("db"):
+                pass
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        sent: list[Message] = []
+
+        async def collect(message: Message) -> None:
+            sent.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/items", "headers": []}
+        await TimingMiddleware(app)(scope, receive, collect)
+
+        header = dict(sent[0]["headers"])[b"server-timing"].decode()
+        assert header.startswith('db;dur=')
+        assert "total;dur=" in header
+        assert request_timings.get() is None
+
+    async def test_header_can_be_disabled(self) -> None:
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            await send({"type": "http.response.start", "status": 204, "headers": []})
+
+        sent: list[Message] = []
+
+        async def collect(message: Message) -> None:
+            sent.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/items", "headers": []}
+        await TimingMiddleware(app, server_timing=False)(scope, receive, collect)
+
+        assert sent[0]["headers"] == []
@@ -0,0 +1,93 @@
+import pytest
+from sqlalchemy import ForeignKey, create_engine, inspect, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
+
+from app.core.api.filter_mapper import FilterMapper
+from app.core.db.convertor import SQLAlchemyFilterConverter
+from app.core.db.exceptions import AttributeNotExistError
+from app.core.filters.base import BaseFilter
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Author(Base):
+    __tablename__ = "authors"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    bio: Mapped[str]
+    books: Mapped[list[Book]] = relationship()
+
+
+class Book(Base):
+    __tablename__ = "books"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    author_id: Mapped[int] = mapped_column(ForeignKey("authors.id"))
+
+
+class AuthorFilter(BaseFilter):
+    def build_condition(self) -> None:
+        self.add_relation("books")
+
+
+@pytest.fixture
+def session() -> Session:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Author(id=1, name="name", bio="bio", books=[Book()]))
+        session.commit()
+        session.expunge_all()
+        yield session
+
+
+@pytest.mark.unit
+class TestFilterFields:
+
+    def test_without_fields_loads_every_relation(self) -> None:
+        author_filter = AuthorFilter()
+
+        assert not author_filter.has_projection()
+        assert len(author_filter.loading_config.relationships) == 1
+
+    def test_fields_narrow_columns_and_relations(self) -> None:
+        author_filter = AuthorFilter().set_fields(["name", "name", "id"])
+
+        assert author_filter.fields == ("name", "id")
+        assert author_filter.column_fields == ("name", "id")
+        assert not author_filter.has_relation_fields()
+        assert author_filter.loading_config.relationships == ()
+
+    def test_relation_field_keeps_its_loader(self) -> None:
+        author_filter = AuthorFilter().set_fields(["name", "books"])
+
+        assert author_filter.column_fields == ("name",)
+        assert author_filter.has_relation_fields()
+        assert len(author_filter.loading_config.relationships) == 1
+
+    def test_parse_fields_string(self) -> None:
+        assert FilterMapper.parse_fields_string(None) is None
+        assert FilterMapper.parse_fields_string(" id, name ,,id") == ["id", "name"]
+
+
+@pytest.mark.unit
+class TestProjection:
+
+    def test_load_only_defers_other_columns(self, session: Session) -> None:
+        option = SQLAlchemyFilterConverter.build_load_only(Author, ("name",))
+        author = session.scalars(select(Author).options(option)).one()
+
+        assert inspect(author).unloaded >= {"bio", "books"}
+        assert author.id == 1
+
+    def test_projection_columns_select_rows(self, session: Session) -> None:
+        columns = SQLAlchemyFilterConverter.get_projection_columns(Author, ("id", "name"))
+        rows = session.execute(select(*columns)).mappings().all()
+
+        assert [dict(row) for row in rows] == [{"id": 1, "name": "name"}]
+
+    @pytest.mark.parametrize("name", ["missing", "books"])
+    def test_rejects_non_column_fields(self, name: str) -> None:
+        with pytest.raises(AttributeNotExistError):
+            SQLAlchemyFilterConverter.get_projection_columns(Author, (name,))
@@ -0,0 +1,81 @@
+from typing import Any
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, bindparam, create_engine, event, select, text
+from sqlalchemy.pool import QueuePool
+
+from app.core.db.statements import StatementRegistry, warm_statements
+
+metadata = MetaData()
+items = Table("items", metadata, Column("id", Integer, primary_key=True), Column("name", String))
+
+
+def make_registry() -> StatementRegistry:
+    registry = StatementRegistry()
+    registry.register("items.get_by_id", select(items).where(items.c.id == bindparam("item_id")))
+    registry.register(
+        "items.get_by_name_and_id",
+        select(items.c.id).where(items.c.name == bindparam("name"), items.c.id == bindparam("item_id")),
+    )
+    return registry
+
+
+@pytest.mark.unit
+class TestStatementRegistry:
+
+    def test_register_returns_statement_and_rejects_duplicates(self) -> None:
+        registry = StatementRegistry()
+        statement = select(items)
+
+        assert registry.register("items.all", statement) is statement
+        with pytest.raises(ValueError, match=r"items\.all"):
+            registry.register("items.all", select(items))
+
+    def test_compiled_counts_parameters_and_is_cached(self) -> None:
+        registry = make_registry()
+        dialect = create_engine("sqlite://").dialect
+
+        compiled = registry.compiled(dialect)
+
+        assert [params for _, params in compiled] == [1, 2]
+        assert registry.compiled(dialect) is compiled
+
+
+@pytest.mark.unit
+class TestWarmStatements:
+
+    def make_engine(self, registry: StatementRegistry, traced: list[str]) -> Any:
+        engine = create_engine("sqlite://", poolclass=QueuePool)
+
+        @event.listens_for(engine, "connect")
+        def create_schema(dbapi_connection: Any, record: Any) -> None:
+            dbapi_connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name VARCHAR)")
+            dbapi_connection.set_trace_callback(traced.append)
+
+        warm_statements(engine, registry)
+        return engine
+
+    def test_runs_every_statement_on_new_connection(self) -> None:
+        registry = make_registry()
+        traced: list[str] = []
+        engine = self.make_engine(registry, traced)
+
+        with engine.connect() as connection:
+            warmed = list(traced)
+            connection.execute(text("SELECT 1"))
+        with engine.connect():
+            pass
+
+        assert [sql.splitlines()[0].strip() for sql in warmed] == ["SELECT items.id, items.name", "SELECT items.id"]
+        assert all("NULL" in sql for sql in warmed)
+        assert len(traced) == len(warmed) + 1
+
+    def test_failed_warm_up_keeps_connection_usable(self, caplog: pytest.LogCaptureFixture) -> None:
+        registry = StatementRegistry()
+        registry.register("missing.get", text("SELECT * FROM missing WHERE id = :id"))
+        engine = self.make_engine(registry, [])
+
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT 1")).scalar() == 1
+
+        assert "Statement warm-up failed" in caplog.text
@@ -0,0 +1,48 @@
+import asyncio
+import zlib
+
+import ormsgpack
+import pytest
+
+from app.core.websockets.codecs import JSON_CODEC, OutboundMessage, build_codecs, negotiate_codec
+from app.core.websockets.service import ConnectionManager
+from tests.mocks import FakeRedisPubSubHub, FakeWebSocket
+
+
+@pytest.mark.unit
+class TestWebSocketCodecs:
+
+    def test_negotiation_prefers_server_order_and_falls_back_to_json(self) -> None:
+        codecs = build_codecs()
+
+        assert negotiate_codec(codecs, ["msgpack", "msgpack+deflate"]).subprotocol == "msgpack+deflate"
+        assert negotiate_codec(codecs, ["msgpack"]).subprotocol == "msgpack"
+        assert negotiate_codec(codecs, ["graphql-ws"]) is JSON_CODEC
+
+    def test_msgpack_frames_are_flagged_and_compressed_above_threshold(self) -> None:
+        codec = build_codecs(compress_threshold=64)["msgpack+deflate"]
+        small = {"value": 1}
+        large = {"items": ["value"] * 100}
+
+        small_frame = OutboundMessage(payload=small).frame_for(codec)
+        large_frame = OutboundMessage(payload=large).frame_for(codec)
+
+        assert small_frame == b"\x00" + ormsgpack.packb(small)
+        assert large_frame[:1] == b"\x01"
+        assert ormsgpack.unpackb(zlib.decompress(large_frame[1:], wbits=-15)) == large # type: ignore[index]
+        assert len(large_frame) < len(ormsgpack.packb(large))
+
+    async def test_mixed_clients_receive_their_encoding(self) -> None:
+        manager = ConnectionManager(redis=FakeRedisPubSubHub(), heartbeat_interval=3600) # type: ignore[arg-type]
+        legacy = FakeWebSocket()
+        binary = FakeWebSocket(scope={"subprotocols": ["msgpack"]})
+        await manager.accept_connection(legacy, "room")
+        await manager.accept_connection(binary, "room")
+
+        await manager.send_json_all("room", {"value": 1})
+        await asyncio.sleep(0)
+
+        assert legacy.subprotocol is None
+        assert binary.subprotocol == "msgpack"
+        assert legacy.sent == ['{"value":1}']
+        assert binary.sent == [b"\x00" + ormsgpack.packb({"value": 1})]
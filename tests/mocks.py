@@ -1,9 +1,15 @@
+import asyncio
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
+from starlette.websockets import WebSocketState
+
+from app.core.db.routing import BaseWriteTracker
 from app.core.events.event import BaseEvent
+from app.core.events.replay import BaseReplayCheckpointStore, ReplayCheckpoint
 from app.core.events.service import BaseEventBus
+from app.core.profiling.store import BaseProfileStore, ProfileCapture
 from app.core.services.mail.service import BaseMailService, EmailData
 from app.core.services.mail.template import BaseTemplate
 from app.core.services.queues.service import QueueResult, QueueResultStatus, QueueService
@@ -93,3 +99,294 @@ class MockEventBus(BaseEventBus):
     async def publish(self, events: Iterable[BaseEvent]) -> None:
         self.published_events.extend(events)
 
+
+
+@dataclass
+class FakeKafkaProducer:
+    sent: list[tuple[str, bytes | None, bytes | None]] = field(default_factory=list)
+    fail: bool = False
+
+    async def send(self, topic: str, key: bytes | None = None, value: bytes | None = None) -> asyncio.Future:
+        self.sent.append((topic, key, value))
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        if self.fail:
+            fut.set_exception(RuntimeError("delivery failed"))
+        else:
+            fut.set_result(None)
+        return fut
+
+    async def start(self) -> None:
+        ...
+
+    async def stop(self) -> None:
+        ...
+
+
+@dataclass
+class FakeKafkaConsumer:
+    batches: list[dict[Any, list[Any]]] = field(default_factory=list)
+    committed: list[dict[Any, int]] = field(default_factory=list)
+    seeks: list[tuple[Any, int]] = field(default_factory=list)
+    topics: list[str] = field(default_factory=list)
+    paused: set[Any] = field(default_factory=set)
+
+    def subscribe(self, topics: list[str]) -> None:
+        self.topics = topics
+
+    def subscription(self) -> set[str]:
+        return set(self.topics)
+
+    def unsubscribe(self) -> None:
+        self.topics = []
+
+    async def getmany(self, timeout_ms: int = 0, max_records: int | None = None) -> dict[Any, list[Any]]:
+        if not self.batches:
+            self.unsubscribe()
+            return {}
+        return self.batches.pop(0)
+
+    async def commit(self, offsets: dict[Any, int] | None = None) -> None:
+        self.committed.append(offsets or {})
+
+    def seek(self, partition: Any, offset: int) -> None:
+        self.seeks.append((partition, offset))
+
+    def pause(self, *partitions: Any) -> None:
+        self.paused.update(partitions)
+
+    def resume(self, *partitions: Any) -> None:
+        self.paused.difference_update(partitions)
+
+    def highwater(self, partition: Any) -> int | None:
+        return 100
+
+
+@dataclass
+class FakeReplayCheckpointStore(BaseReplayCheckpointStore):
+    checkpoints: dict[str, ReplayCheckpoint] = field(default_factory=dict)
+
+    async def get(self, name: str) -> ReplayCheckpoint | None:
+        return self.checkpoints.get(name)
+
+    async def save(self, name: str, checkpoint: ReplayCheckpoint) -> None:
+        self.checkpoints[name] = checkpoint
+
+    async def reset(self, name: str) -> None:
+        self.checkpoints.pop(name, None)
+
+
+@dataclass
+class FakeScalarStream:
+    rows: list[Any]
+    size: int
+
+    async def partitions(self) -> Any:
+        for start in range(0, len(self.rows), self.size):
+            yield self.rows[start:start + self.size]
+
+
+@dataclass
+class FakeStreamSession:
+    rows: list[Any] = field(default_factory=list)
+    statements: list[Any] = field(default_factory=list)
+
+    async def stream_scalars(self, statement: Any) -> FakeScalarStream:
+        self.statements.append(statement)
+        return FakeScalarStream(rows=self.rows, size=statement.get_execution_options()["yield_per"])
+
+
+@dataclass(eq=False)
+class FakeWebSocket:
+    sent: list[Any] = field(default_factory=list)
+    client_state: WebSocketState = WebSocketState.CONNECTED
+    closed: bool = False
+    close_code: int | None = None
+    blocked: asyncio.Event | None = None
+    scope: dict[str, Any] = field(default_factory=dict)
+    subprotocol: str | None = None
+
+    async def _wait(self) -> None:
+        if self.blocked is not None:
+            await self.blocked.wait()
+
+    async def accept(self, subprotocol: str | None = None) -> None:
+        self.subprotocol = subprotocol
+
+    async def send_json(self, data: Any) -> None:
+        await self._wait()
+        self.sent.append(data)
+
+    async def send_bytes(self, data: bytes) -> None:
+        await self._wait()
+        self.sent.append(data)
+
+    async def send_text(self, data: str) -> None:
+        await self._wait()
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.closed = True
+        self.close_code = code
+        self.client_state = WebSocketState.DISCONNECTED
+
+
+@dataclass
+class FakePubSub:
+    hub: FakeRedisPubSubHub
+    channels: set[str] = field(default_factory=set)
+    queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+
+    @property
+    def subscribed(self) -> bool:
+        return bool(self.channels)
+
+    async def subscribe(self, *channels: str) -> None:
+        self.channels.update(channels)
+
+    async def ssubscribe(self, *channels: str) -> None:
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels: str) -> None:
+        self.channels.difference_update(channels)
+
+    async def sunsubscribe(self, *channels: str) -> None:
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: float | None = 0.0) -> Any:
+        if not timeout:
+            return None if self.queue.empty() else self.queue.get_nowait()
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        self.hub.subscribers.remove(self)
+
+
+@dataclass
+class FakeRedisPipeline:
+    hub: FakeRedisPubSubHub
+    commands: list[tuple[str, tuple[Any, ...]]] = field(default_factory=list)
+
+    def __getattr__(self, name: str) -> Any:
+        def command(*args: Any) -> FakeRedisPipeline:
+            self.commands.append((name, args))
+            return self
+        return command
+
+    async def execute(self) -> list[Any]:
+        results = [await getattr(self.hub, name)(*args) for name, args in self.commands]
+        self.commands.clear()
+        return results
+
+
+@dataclass
+class FakeRedisPubSubHub:
+    subscribers: list[FakePubSub] = field(default_factory=list)
+    published: list[tuple[str, str, bytes]] = field(default_factory=list)
+    zsets: dict[str, dict[str, float]] = field(default_factory=dict)
+    hashes: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def pipeline(self, transaction: bool = True) -> FakeRedisPipeline:
+        return FakeRedisPipeline(hub=self)
+
+    async def zadd(self, name: str, mapping: dict[str, float]) -> int:
+        self.zsets.setdefault(name, {}).update(mapping)
+        return len(mapping)
+
+    async def zrem(self, name: str, *members: str) -> int:
+        zset = self.zsets.get(name, {})
+        return sum(zset.pop(member, None) is not None for member in members)
+
+    async def zrangebyscore(self, name: str, min: float, max: str) -> list[str]:
+        return [member for member, score in self.zsets.get(name, {}).items() if score >= min]
+
+    async def zcount(self, name: str, min: float, max: str) -> int:
+        return len(await self.zrangebyscore(name, min, max))
+
+    async def hset(self, name: str, key: str, value: Any) -> int:
+        self.hashes.setdefault(name, {})[key] = value
+        return 1
+
+    async def hdel(self, name: str, *keys: str) -> int:
+        values = self.hashes.get(name, {})
+        return sum(values.pop(key, None) is not None for key in keys)
+
+    async def hmget(self, name: str, keys: list[str]) -> list[Any]:
+        values = self.hashes.get(name, {})
+        return [values.get(key) for key in keys]
+
+    async def expire(self, name: str, seconds: int) -> bool:
+        return True
+
+    def pubsub(self) -> FakePubSub:
+        pubsub = FakePubSub(hub=self)
+        self.subscribers.append(pubsub)
+        return pubsub
+
+    async def publish(self, channel: str, data: bytes, command: str = "PUBLISH") -> int:
+        self.published.append((command, channel, data))
+        receivers = [pubsub for pubsub in self.subscribers if channel in pubsub.channels]
+        for pubsub in receivers:
+            pubsub.queue.put_nowait({"type": "message", "channel": channel.encode(), "data": data})
+        return len(receivers)
+
+    async def spublish(self, channel: str, data: bytes) -> int:
+        return await self.publish(channel, data, command="SPUBLISH")
+
+    async def aclose(self) -> None:
+        ...
+
+
+@dataclass
+class FakeRedisScript:
+    replies: list[list[int]]
+    calls: list[tuple[list[str], list[Any]]] = field(default_factory=list)
+
+    async def __call__(self, keys: list[str], args: list[Any]) -> list[int]:
+        self.calls.append((keys, args))
+        return self.replies.pop(0)
+
+
+@dataclass
+class FakeScriptRedis:
+    replies: list[list[int]] = field(default_factory=list)
+    scripts: list[FakeRedisScript] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+
+    def register_script(self, script: str) -> FakeRedisScript:
+        fake = FakeRedisScript(replies=self.replies)
+        self.scripts.append(fake)
+        return fake
+
+    async def delete(self, *keys: str) -> int:
+        self.deleted.extend(keys)
+        return len(keys)
+
+
+class FakeProfileStore(BaseProfileStore):
+    def __init__(self) -> None:
+        self.captures: list[ProfileCapture] = []
+        self.sessions: dict[str, dict[str, Any]] = {}
+
+    async def save(self, capture: ProfileCapture, session: dict[str, Any]) -> None:
+        self.captures.insert(0, capture)
+        self.sessions[capture.id] = session
+
+    async def list(self, limit: int) -> list[ProfileCapture]:
+        return self.captures[:limit]
+
+    async def get_session(self, capture_id: str) -> dict[str, Any] | None:
+        return self.sessions.get(capture_id)
+
+
+class FakeWriteTracker(BaseWriteTracker):
+    def __init__(self) -> None:
+        self.writers: set[str] = set()
+
+    async def mark_write(self, identity: str) -> None:
+        self.writers.add(identity)
+
+    async def recently_wrote(self, identity: str) -> bool:
+        return identity in self.writers